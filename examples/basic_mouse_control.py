@@ -15,208 +15,228 @@ import sys
 import os
 import time
 
+import numpy as np
+
 # Add SDK to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'python_sdk'))
 
 from browsergeist import HumanMouse, MotionProfiles
 
-def demo_basic_movements():
+def precise_sleep(seconds):
+    """Sleep with sub-millisecond accuracy for short pauses
+    
+    time.sleep can wake up several milliseconds late under load, so sleep
+    until just before the deadline and spin for the remainder. Use plain
+    time.sleep for long waits where that jitter doesn't matter.
+    """
+    deadline = time.monotonic_ns() + int(seconds * 1e9)
+    coarse = seconds - 0.002
+    if coarse > 0:
+        time.sleep(coarse)
+    while time.monotonic_ns() < deadline:
+        pass
+
+def demo_basic_movements(bot):
     """Demonstrate basic mouse movements with different profiles"""
     print("🖱️  Basic Mouse Movement Demo")
     print("-" * 40)
     
-    with HumanMouse() as bot:
-        # Get current screen dimensions (rough estimates for demo)
-        screen_width, screen_height = 1920, 1080
-        center_x, center_y = screen_width // 2, screen_height // 2
-        
-        print("1. Moving to screen center with Natural profile...")
-        bot.move_to((center_x, center_y), profile=MotionProfiles.NATURAL)
-        time.sleep(1)
-        
-        print("2. Moving to top-left with Careful profile...")
-        bot.move_to((200, 200), profile=MotionProfiles.CAREFUL)
-        time.sleep(1)
-        
-        print("3. Moving to bottom-right with Fast profile...")
-        bot.move_to((center_x + 300, center_y + 200), profile=MotionProfiles.FAST)
-        time.sleep(1)
-        
-        print("✅ Movement demo completed!")
+    # Get current screen dimensions (rough estimates for demo)
+    screen_width, screen_height = 1920, 1080
+    center_x, center_y = screen_width // 2, screen_height // 2
+    
+    print("1. Moving to screen center with Natural profile...")
+    bot.move_to((center_x, center_y), profile=MotionProfiles.NATURAL)
+    time.sleep(1)
+    
+    print("2. Moving to top-left with Careful profile...")
+    bot.move_to((200, 200), profile=MotionProfiles.CAREFUL)
+    time.sleep(1)
+    
+    print("3. Moving to bottom-right with Fast profile...")
+    bot.move_to((center_x + 300, center_y + 200), profile=MotionProfiles.FAST)
+    time.sleep(1)
+    
+    print("✅ Movement demo completed!")
 
-def demo_click_types():
+def demo_click_types(bot):
     """Demonstrate different types of mouse clicks"""
     print("\n🎯 Mouse Click Types Demo")
     print("-" * 40)
     
-    with HumanMouse() as bot:
-        # Move to a neutral position
-        bot.move_to((400, 300), profile=MotionProfiles.NATURAL)
-        
-        print("1. Standard left click...")
-        bot.click("left", duration=0.05)
-        time.sleep(0.5)
-        
-        print("2. Right click (context menu)...")
-        bot.click("right", duration=0.06)
-        time.sleep(0.5)
-        
-        print("3. Longer duration click (button press feel)...")
-        bot.click("left", duration=0.12)
-        time.sleep(0.5)
-        
-        print("4. Quick double-click simulation...")
-        bot.click("left", duration=0.04)
-        time.sleep(0.08)  # Brief pause between clicks
-        bot.click("left", duration=0.04)
-        time.sleep(0.5)
-        
-        print("✅ Click demo completed!")
+    # Move to a neutral position
+    bot.move_to((400, 300), profile=MotionProfiles.NATURAL)
+    
+    # Pauses between actions are scheduled by the daemon via delay_after
+    print("1. Standard left click...")
+    bot.click("left", duration=0.05, delay_after=0.5)
+    
+    print("2. Right click (context menu)...")
+    bot.click("right", duration=0.06, delay_after=0.5)
+    
+    print("3. Longer duration click (button press feel)...")
+    bot.click("left", duration=0.12, delay_after=0.5)
+    
+    print("4. Quick double-click simulation...")
+    bot.click("left", duration=0.04, delay_after=0.08)  # Brief pause between clicks
+    bot.click("left", duration=0.04, delay_after=0.5)
+    
+    print("✅ Click demo completed!")
 
-def demo_motion_profiles():
+def demo_motion_profiles(bot):
     """Demonstrate the differences between motion profiles"""
     print("\n🏃‍♂️ Motion Profiles Comparison")
     print("-" * 40)
     
+    NATURAL, CAREFUL, FAST = MotionProfiles.NATURAL, MotionProfiles.CAREFUL, MotionProfiles.FAST
+    move = bot.move_to
+    
     profiles = [
-        ("Natural", MotionProfiles.NATURAL, "Realistic human movement with natural curves"),
-        ("Careful", MotionProfiles.CAREFUL, "Slow, precise movement for delicate operations"),
-        ("Fast", MotionProfiles.FAST, "Quick movement for efficient automation")
+        ("Natural", NATURAL, "Realistic human movement with natural curves"),
+        ("Careful", CAREFUL, "Slow, precise movement for delicate operations"),
+        ("Fast", FAST, "Quick movement for efficient automation")
     ]
     
-    with HumanMouse() as bot:
-        start_pos = (300, 300)
+    start_pos = (300, 300)
+    
+    for i, (name, profile, description) in enumerate(profiles):
+        target_x = 300 + (i * 250)
+        target_y = 400
         
-        for i, (name, profile, description) in enumerate(profiles):
-            target_x = 300 + (i * 250)
-            target_y = 400
-            
-            print(f"{i+1}. {name} Profile: {description}")
-            
-            # Start from same position each time
-            bot.move_to(start_pos, profile=MotionProfiles.FAST)
-            time.sleep(0.2)
-            
-            # Time the movement with this profile
-            start_time = time.time()
-            bot.move_to((target_x, target_y), profile=profile)
-            duration = time.time() - start_time
-            
-            print(f"   ⏱️  Completed in {duration:.3f} seconds")
-            time.sleep(1)
+        print(f"{i+1}. {name} Profile: {description}")
+        
+        # Start from same position each time
+        move(start_pos, profile=FAST)
+        precise_sleep(0.2)
+        
+        # Time the movement with this profile
+        start_time = time.time()
+        move((target_x, target_y), profile=profile)
+        duration = time.time() - start_time
+        
+        print(f"   ⏱️  Completed in {duration:.3f} seconds")
+        time.sleep(1)
     
     print("✅ Profile comparison completed!")
 
-def demo_realistic_interactions():
+def demo_realistic_interactions(bot):
     """Demonstrate realistic interaction patterns"""
     print("\n🎭 Realistic Interaction Patterns")
     print("-" * 40)
     
-    with HumanMouse() as bot:
-        print("1. Simulating browsing behavior...")
+    print("1. Simulating browsing behavior...")
+    
+    # Simulate reading a webpage with occasional clicks
+    positions = np.array([
+        (400, 200, "Article title"),
+        (450, 350, "First paragraph"),
+        (380, 500, "Interesting link"),
+        (600, 450, "Side navigation"),
+        (420, 650, "Continue reading button")
+    ], dtype=[('x', 'i4'), ('y', 'i4'), ('desc', 'U32')])
+    
+    # Slight positional randomness, applied in one pass: ±10 px in x, ±5 px in y
+    rng = np.random.default_rng(0xB0B)
+    xs = positions['x'] + rng.integers(-10, 11, size=len(positions))
+    ys = positions['y'] + rng.integers(-5, 6, size=len(positions))
+    
+    NATURAL = MotionProfiles.NATURAL
+    move_path, click = bot.move_path, bot.click
+    
+    # Hover-only waypoints are queued and sent to the daemon as one path
+    pending_path = []
+    
+    for actual_x, actual_y, description in zip(xs.tolist(), ys.tolist(), positions['desc'].tolist()):
+        print(f"   👁️  Looking at: {description}")
         
-        # Simulate reading a webpage with occasional clicks
-        positions = [
-            (400, 200, "Article title"),
-            (450, 350, "First paragraph"),
-            (380, 500, "Interesting link"),
-            (600, 450, "Side navigation"),
-            (420, 650, "Continue reading button")
-        ]
+        pending_path.append((actual_x, actual_y))
         
-        for x, y, description in positions:
-            print(f"   👁️  Looking at: {description}")
-            
-            # Add human-like delay (reading time)
+        # Sometimes click, sometimes just hover
+        if "button" in description.lower() or "link" in description.lower():
+            # Add human-like delay (reading time) before committing to the click
             time.sleep(0.8 + (len(description) * 0.02))  # Reading time based on text length
             
-            # Move with slight randomness
-            actual_x = x + int((hash(description) % 21) - 10)  # ±10 pixel variation
-            actual_y = y + int((hash(description) % 11) - 5)   # ±5 pixel variation
-            
-            bot.move_to((actual_x, actual_y), profile=MotionProfiles.NATURAL)
+            move_path(pending_path, profile=NATURAL)
+            pending_path = []
             
-            # Sometimes click, sometimes just hover
-            if "button" in description.lower() or "link" in description.lower():
-                print(f"   🖱️  Clicking: {description}")
-                bot.click("left")
-                time.sleep(0.3)  # Brief pause after action
-        
-        print("✅ Realistic interaction completed!")
+            print(f"   🖱️  Clicking: {description}")
+            click("left")
+            precise_sleep(0.3)  # Brief pause after action
+    
+    # Finish any trailing hover-only waypoints
+    if pending_path:
+        move_path(pending_path, profile=NATURAL)
+    
+    print("✅ Realistic interaction completed!")
 
-def demo_advanced_timing():
+def demo_advanced_timing(bot):
     """Demonstrate advanced timing and hesitation patterns"""
     print("\n⏱️  Advanced Timing Patterns")
     print("-" * 40)
     
-    with HumanMouse() as bot:
-        print("1. Hesitation before important action...")
-        
-        # Move towards a "submit" button
-        bot.move_to((400, 500), profile=MotionProfiles.NATURAL)
-        
-        # Pause (user thinking/hesitating)
-        print("   🤔 Hesitating before clicking submit...")
-        time.sleep(1.2)
-        
-        # Small adjustment movement (common human behavior)
-        bot.move_to((405, 498), profile=MotionProfiles.CAREFUL)
-        time.sleep(0.3)
-        
-        # Final click
-        print("   ✅ Deciding to click...")
-        bot.click("left", duration=0.08)
-        
-        print("\n2. Distraction and correction pattern...")
-        
-        # Start moving toward target
-        bot.move_to((600, 300), profile=MotionProfiles.NATURAL)
-        time.sleep(0.2)
-        
-        # "Get distracted" and move elsewhere briefly
-        print("   👀 Got distracted by something else...")
-        bot.move_to((550, 250), profile=MotionProfiles.FAST)
-        time.sleep(0.5)
-        
-        # Return to original task
-        print("   🔄 Returning to original task...")
-        bot.move_to((600, 300), profile=MotionProfiles.NATURAL)
-        bot.click("left")
-        
-        print("✅ Advanced timing patterns completed!")
+    print("1. Hesitation before important action...")
+    
+    # Move towards a "submit" button, then pause (user thinking/hesitating)
+    print("   🤔 Hesitating before clicking submit...")
+    bot.move_to((400, 500), profile=MotionProfiles.NATURAL, delay_after=1.2)
+    
+    # Small adjustment movement (common human behavior)
+    bot.move_to((405, 498), profile=MotionProfiles.CAREFUL, delay_after=0.3)
+    
+    # Final click
+    print("   ✅ Deciding to click...")
+    bot.click("left", duration=0.08)
+    
+    print("\n2. Distraction and correction pattern...")
+    
+    # Start moving toward target
+    bot.move_to((600, 300), profile=MotionProfiles.NATURAL, delay_after=0.2)
+    
+    # "Get distracted" and move elsewhere briefly
+    print("   👀 Got distracted by something else...")
+    bot.move_to((550, 250), profile=MotionProfiles.FAST, delay_after=0.5)
+    
+    # Return to original task
+    print("   🔄 Returning to original task...")
+    bot.move_to((600, 300), profile=MotionProfiles.NATURAL)
+    bot.click("left")
+    
+    print("✅ Advanced timing patterns completed!")
 
-def demo_error_recovery():
+def demo_error_recovery(bot):
     """Demonstrate error handling and recovery patterns"""
     print("\n🔧 Error Handling Demo")
     print("-" * 40)
     
     try:
-        with HumanMouse() as bot:
-            print("1. Attempting normal operation...")
-            bot.move_to((400, 300))
-            bot.click()
-            
-            print("2. Simulating failed operation and retry...")
-            # In real scenarios, you might detect that an action failed
-            # Here we simulate a retry pattern
+        print("1. Attempting normal operation...")
+        bot.move_to((400, 300))
+        bot.click()
+        
+        print("2. Simulating failed operation and retry...")
+        # In real scenarios, you might detect that an action failed
+        # Here we simulate a retry pattern
+        
+        # Retry schedule: slight position variation and slightly longer clicks per attempt
+        attempts = tuple(((410 + i * 5, 305 + i * 2), 0.06 + i * 0.01) for i in range(3))
+        
+        for attempt, (position, click_duration) in enumerate(attempts):
+            print(f"   Attempt {attempt + 1}: Clicking target...")
+            bot.move_to(position)
+            bot.click("left", duration=click_duration)
             
-            for attempt in range(3):
-                print(f"   Attempt {attempt + 1}: Clicking target...")
-                bot.move_to((410 + attempt * 5, 305 + attempt * 2))  # Slight position variation
-                bot.click("left", duration=0.06 + attempt * 0.01)   # Slightly longer clicks on retries
-                
-                # Simulate checking if action succeeded
-                time.sleep(0.5)
-                success = attempt == 2  # Succeed on third attempt
-                
-                if success:
-                    print("   ✅ Operation succeeded!")
-                    break
-                else:
-                    print("   ⚠️  Operation failed, retrying...")
-                    time.sleep(0.3)  # Brief pause before retry
+            # Simulate checking if action succeeded
+            time.sleep(0.5)
+            success = attempt == 2  # Succeed on third attempt
             
-            print("✅ Error recovery demo completed!")
+            if success:
+                print("   ✅ Operation succeeded!")
+                break
+            else:
+                print("   ⚠️  Operation failed, retrying...")
+                precise_sleep(0.3)  # Brief pause before retry
+        
+        print("✅ Error recovery demo completed!")
     
     except Exception as e:
         print(f"❌ Demo failed: {e}")
@@ -236,12 +256,14 @@ def main():
     print()
     
     try:
-        demo_basic_movements()
-        demo_click_types()
-        demo_motion_profiles()
-        demo_realistic_interactions()
-        demo_advanced_timing()
-        demo_error_recovery()
+        # One daemon connection shared by every demo
+        with HumanMouse() as bot:
+            demo_basic_movements(bot)
+            demo_click_types(bot)
+            demo_motion_profiles(bot)
+            demo_realistic_interactions(bot)
+            demo_advanced_timing(bot)
+            demo_error_recovery(bot)
         
         print("\n🎉 All mouse control demos completed successfully!")
         print("\n💡 Key Takeaways:")
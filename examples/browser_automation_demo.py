@@ -9,14 +9,19 @@ human-like mouse movements and visual target detection.
 import sys
 import os
 import time
-import cv2
-import numpy as np
+import random
+import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Add SDK to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'python_sdk'))
 
 from browsergeist import HumanMouse, MotionProfiles, target
 
+# Failures are logged at ERROR; set level=logging.CRITICAL to skip traceback formatting
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 def main():
     print("🤖 BrowserGeist Demo - Advanced Browser Automation")
     print("=" * 50)
@@ -46,8 +51,8 @@ def main():
         
         for profile, description in profiles:
             print(f"  - {description}")
-            bot.move_to((600 + int(100 * np.random.randn()), 
-                        300 + int(100 * np.random.randn())), 
+            bot.move_to((600 + int(100 * random.gauss(0, 1)), 
+                        300 + int(100 * random.gauss(0, 1))), 
                        profile=profile)
             time.sleep(0.5)
         
@@ -87,31 +92,37 @@ def main():
         
     except Exception as e:
         print(f"❌ Demo failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Demo failed")
 
-def test_vision_system():
-    """Test the vision system independently"""
-    print("\n🔍 Testing Vision System...")
+def test_vision_system() -> str:
+    """Test the vision system independently and return the status report"""
+    lines = ["\n🔍 Testing Vision System..."]
     
     try:
+        import cv2
         from template_matcher import TemplateMatcher
         
         matcher = TemplateMatcher()
-        print("✅ Vision system initialized")
+        lines.append("✅ Vision system initialized")
         
         # You could add template images in examples/ to test this
-        print("📷 Vision features available:")
-        print("  ✓ Template matching with multiple algorithms")
-        print("  ✓ SIFT feature-based detection")
-        print("  ✓ OCR text recognition (if pytesseract installed)")
-        print("  ✓ Multi-scale template detection")
-        print("  ✓ Vision caching for performance")
+        lines.append("📷 Vision features available:")
+        lines.append("  ✓ Template matching with multiple algorithms")
+        lines.append("  ✓ SIFT feature-based detection")
+        lines.append("  ✓ OCR text recognition (if pytesseract installed)")
+        lines.append("  ✓ Multi-scale template detection")
+        lines.append("  ✓ Vision caching for performance")
         
     except ImportError as e:
-        print(f"⚠️  Vision system not fully available: {e}")
-        print("Install missing dependencies: uv pip install opencv-python")
+        lines.append(f"⚠️  Vision system not fully available: {e}")
+        lines.append("Install missing dependencies: uv pip install opencv-python")
+    
+    return "\n".join(lines)
 
 if __name__ == "__main__":
-    main()
-    test_vision_system()
+    # Initialize the vision system in the background while the mouse demos run;
+    # its report is printed afterwards so it doesn't interleave with theirs
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        vision_check = executor.submit(test_vision_system)
+        main()
+        print(vision_check.result())
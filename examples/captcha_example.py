@@ -9,6 +9,7 @@ Demonstrates how to use the CAPTCHA solving capabilities:
 4. 2Captcha service integration
 """
 
+import asyncio
 import os
 import sys
 import time
@@ -19,130 +20,127 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'python_
 from browsergeist import HumanMouse, MotionProfiles
 from captcha_solver import CaptchaSolveMethod
 
-def example_basic_captcha_detection():
+# API keys are read from the environment once, at import
+_OPENAI_KEY = os.getenv('OPENAI_API_KEY')
+_TWOCAPTCHA_KEY = os.getenv('TWOCAPTCHA_API_KEY')
+
+def example_basic_captcha_detection(bot):
     """Basic example: Check for CAPTCHA and solve manually if found"""
     print("🚀 Basic CAPTCHA Detection Example")
     print("=" * 50)
     
-    # Initialize with manual solving only
-    with HumanMouse(auto_solve_captcha=True) as bot:
-        print("Checking current screen for CAPTCHA...")
-        
-        # Check for CAPTCHA on current screen
-        solution = bot.check_for_captcha(methods=[CaptchaSolveMethod.MANUAL])
-        
-        if solution:
-            print(f"✅ CAPTCHA solved: {solution.success}")
-            if solution.solution:
-                print(f"   Text solution: {solution.solution}")
-            if solution.coordinates:
-                print(f"   Click coordinates: {solution.coordinates}")
-        else:
-            print("ℹ️ No CAPTCHA detected on current screen")
+    # Manual solving only
+    bot.reconfigure(auto_solve_captcha=True)
+    print("Checking current screen for CAPTCHA...")
+    
+    # Check for CAPTCHA on current screen
+    solution = bot.check_for_captcha(methods=[CaptchaSolveMethod.MANUAL])
+    
+    if solution:
+        print(f"✅ CAPTCHA solved: {solution.success}")
+        if solution.solution:
+            print(f"   Text solution: {solution.solution}")
+        if solution.coordinates:
+            print(f"   Click coordinates: {solution.coordinates}")
+    else:
+        print("ℹ️ No CAPTCHA detected on current screen")
 
-def example_openai_captcha():
+def example_openai_captcha(bot):
     """Example using OpenAI API for automatic CAPTCHA solving"""
     print("\n🤖 OpenAI CAPTCHA Solving Example")
     print("=" * 50)
     
-    # Get API key from environment or user input
-    openai_key = os.getenv('OPENAI_API_KEY')
-    if not openai_key:
+    if not _OPENAI_KEY:
         print("⚠️ OpenAI API key not found in environment.")
         print("Set OPENAI_API_KEY environment variable or skip this example.")
         return
     
-    with HumanMouse(openai_api_key=openai_key, auto_solve_captcha=True) as bot:
-        print("Checking for CAPTCHA with OpenAI solving...")
-        
-        # Try OpenAI first, then manual as fallback
-        solution = bot.check_for_captcha(methods=[
-            CaptchaSolveMethod.OPENAI, 
-            CaptchaSolveMethod.MANUAL
-        ])
-        
-        if solution:
-            print(f"✅ CAPTCHA solved using {solution.method_used.value}")
-        else:
-            print("ℹ️ No CAPTCHA detected")
+    bot.reconfigure(openai_api_key=_OPENAI_KEY, auto_solve_captcha=True)
+    print("Checking for CAPTCHA with OpenAI solving...")
+    
+    # Try OpenAI first, then manual as fallback
+    solution = bot.check_for_captcha(methods=[
+        CaptchaSolveMethod.OPENAI, 
+        CaptchaSolveMethod.MANUAL
+    ])
+    
+    if solution:
+        print(f"✅ CAPTCHA solved using {solution.method_used.value}")
+    else:
+        print("ℹ️ No CAPTCHA detected")
 
-def example_2captcha_service():
+def example_2captcha_service(bot):
     """Example using 2Captcha service for outsourced solving"""
     print("\n🌐 2Captcha Service Example")
     print("=" * 50)
     
-    # Get API key from environment
-    twocaptcha_key = os.getenv('TWOCAPTCHA_API_KEY')
-    if not twocaptcha_key:
+    if not _TWOCAPTCHA_KEY:
         print("⚠️ 2Captcha API key not found in environment.")
         print("Set TWOCAPTCHA_API_KEY environment variable or skip this example.")
         return
     
-    with HumanMouse(twocaptcha_api_key=twocaptcha_key, auto_solve_captcha=True) as bot:
-        print("Checking for CAPTCHA with 2Captcha service...")
-        
-        solution = bot.check_for_captcha(methods=[CaptchaSolveMethod.TWOCAPTCHA])
-        
-        if solution:
-            print(f"✅ CAPTCHA solved using 2Captcha service")
-        else:
-            print("ℹ️ No CAPTCHA detected")
+    bot.reconfigure(twocaptcha_api_key=_TWOCAPTCHA_KEY, auto_solve_captcha=True)
+    print("Checking for CAPTCHA with 2Captcha service...")
+    
+    solution = bot.check_for_captcha(methods=[CaptchaSolveMethod.TWOCAPTCHA])
+    
+    if solution:
+        print(f"✅ CAPTCHA solved using 2Captcha service")
+    else:
+        print("ℹ️ No CAPTCHA detected")
 
-def example_automation_with_captcha():
+def example_automation_with_captcha(bot):
     """Complete automation example with automatic CAPTCHA handling"""
     print("\n🎯 Automation with CAPTCHA Handling")
     print("=" * 50)
     
     # Initialize with all solving methods available
-    openai_key = os.getenv('OPENAI_API_KEY')
-    twocaptcha_key = os.getenv('TWOCAPTCHA_API_KEY')
-    
-    with HumanMouse(
-        openai_api_key=openai_key,
-        twocaptcha_api_key=twocaptcha_key,
+    bot.reconfigure(
+        openai_api_key=_OPENAI_KEY,
+        twocaptcha_api_key=_TWOCAPTCHA_KEY,
         auto_solve_captcha=True
-    ) as bot:
+    )
+    
+    print("Starting automation with CAPTCHA handling...")
+    
+    # Example automation workflow
+    try:
+        # Navigate to a form (this would be real coordinates in practice)
+        print("🖱️ Moving to username field...")
+        bot.move_to((400, 300), profile=MotionProfiles.NATURAL)
+        bot.click()
         
-        print("Starting automation with CAPTCHA handling...")
+        # Type username
+        print("⌨️ Typing username...")
+        bot.type("test@example.com", delay_profile="average")
         
-        # Example automation workflow
-        try:
-            # Navigate to a form (this would be real coordinates in practice)
-            print("🖱️ Moving to username field...")
-            bot.move_to((400, 300), profile=MotionProfiles.NATURAL)
-            bot.click()
-            
-            # Type username
-            print("⌨️ Typing username...")
-            bot.type("test@example.com", delay_profile="average")
-            
-            # Move to password field
-            print("🖱️ Moving to password field...")
-            bot.move_to((400, 350), profile=MotionProfiles.NATURAL)
-            bot.click()
-            
-            # Type password
-            print("⌨️ Typing password...")
-            bot.type("password123", delay_profile="careful")
-            
-            # Submit form - this might trigger a CAPTCHA
-            print("🖱️ Clicking submit button...")
-            bot.move_to((400, 400), profile=MotionProfiles.NATURAL)
-            
-            # Use CAPTCHA-aware click
-            bot.click_with_captcha_handling()
-            
-            # Wait and check for any CAPTCHAs that appeared
-            time.sleep(2)
-            captcha_handled = bot.solve_captcha_if_present()
+        # Move to password field
+        print("🖱️ Moving to password field...")
+        bot.move_to((400, 350), profile=MotionProfiles.NATURAL)
+        bot.click()
+        
+        # Type password
+        print("⌨️ Typing password...")
+        bot.type("password123", delay_profile="careful")
+        
+        # Submit form - this might trigger a CAPTCHA
+        print("🖱️ Clicking submit button...")
+        bot.move_to((400, 400), profile=MotionProfiles.NATURAL)
+        
+        # Use CAPTCHA-aware click
+        bot.click_with_captcha_handling()
+        
+        # Wait and check for any CAPTCHAs that appeared
+        time.sleep(2)
+        captcha_handled = bot.solve_captcha_if_present()
+        
+        if captcha_handled:
+            print("✅ Automation completed successfully!")
+        else:
+            print("⚠️ Automation may need manual intervention")
             
-            if captcha_handled:
-                print("✅ Automation completed successfully!")
-            else:
-                print("⚠️ Automation may need manual intervention")
-                
-        except Exception as e:
-            print(f"❌ Automation failed: {e}")
+    except Exception as e:
+        print(f"❌ Automation failed: {e}")
 
 def example_manual_webserver():
     """Demonstrate the manual CAPTCHA solving webserver"""
@@ -157,8 +155,7 @@ def example_manual_webserver():
         print("Creating demo CAPTCHA challenge...")
         
         # Create a simple test image (normally this would be a real CAPTCHA)
-        test_image = np.zeros((100, 200, 3), dtype=np.uint8)
-        test_image[:] = (200, 200, 200)  # Light gray background
+        test_image = np.full((100, 200, 3), 200, dtype=np.uint8)  # Light gray background
         
         challenge = CaptchaChallenge(
             image=test_image,
@@ -182,6 +179,24 @@ def example_manual_webserver():
         print(f"⚠️ Could not start webserver demo: {e}")
         print("Install Flask to enable manual CAPTCHA solving: pip install flask")
 
+def run_daemon_examples():
+    """Run the examples that drive the daemon, in order"""
+    # One daemon connection shared by every example; each one
+    # reconfigures the solver options it needs, so they can't overlap
+    with HumanMouse() as bot:
+        example_basic_captcha_detection(bot)
+        example_openai_captcha(bot)
+        example_2captcha_service(bot)
+        example_automation_with_captcha(bot)
+
+async def run_examples():
+    """Run the daemon examples and the webserver demo concurrently"""
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        loop.run_in_executor(None, run_daemon_examples),
+        loop.run_in_executor(None, example_manual_webserver)
+    )
+
 def main():
     """Run all CAPTCHA examples"""
     print("🎯 BrowserGeist CAPTCHA Solving Examples")
@@ -217,11 +232,7 @@ def main():
     
     # Run examples
     try:
-        example_basic_captcha_detection()
-        example_openai_captcha()
-        example_2captcha_service()
-        example_automation_with_captcha()
-        example_manual_webserver()
+        asyncio.run(run_examples())
         
         print("\n🎉 All CAPTCHA examples completed!")
         print("\n💡 Tips for production use:")
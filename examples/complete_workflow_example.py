@@ -20,21 +20,111 @@ suitable for complex business processes.
 
 import sys
 import os
+import io
+import re
+import binascii
+import hashlib
+import csv
+import json
 import time
+import random
 import asyncio
 import logging
+import queue
+import atexit
+import threading
+import functools
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from urllib.parse import urlparse
+from typing import Dict, List, Optional, Any, Sequence
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 
 # Add SDK to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'python_sdk'))
 
 from browsergeist import HumanMouse, MotionProfiles, target
+
+try:
+    import orjson  # Optional: faster JSON serialization for large reports
+except ImportError:
+    orjson = None
 from async_browsergeist import AsyncHumanMouse, async_automation_session
 
-@dataclass
+class RecoverableError(Exception):
+    """Transient step failure (timeout, OCR miss, daemon hiccup) worth retrying"""
+    pass
+
+class UnrecoverableError(Exception):
+    """Deterministic step failure that retrying cannot fix"""
+    pass
+
+# Contact extraction patterns, compiled once rather than per lead
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# One alternation so the OCR text is scanned once for every phone format
+_PHONE_RE = re.compile(
+    r'\(\d{3}\)\s*\d{3}-\d{4}'  # (555) 123-4567
+    r'|\d{3}-\d{3}-\d{4}'      # 555-123-4567
+    r'|\d{3}\.\d{3}\.\d{4}'    # 555.123.4567
+    r'|\d{10}'                 # 5551234567
+)
+# Every phone format starts here, so text before the first hit can be skipped
+_PHONE_ANCHOR = re.compile(r'\(?\d{3}')
+
+# Candidate labels for page elements, tried in order (see _try_candidates)
+_SEARCH_LABELS = ("Search", "search", "Find", "Enter search terms", "Query")
+_CONTACT_LINK_LABELS = ("Contact", "Contact Us", "Get in Touch", "Reach Out", "About")
+_CONTACT_FORM_LABELS = ("Contact Form", "Get in Touch", "Send Message", "Contact", "Form")
+_NAME_FIELDS = ("Name", "Full Name", "Your Name", "First Name")
+_EMAIL_FIELDS = ("Email", "Email Address", "Your Email", "E-mail")
+_COMPANY_FIELDS = ("Company", "Organization", "Company Name", "Business")
+_SUBJECT_FIELDS = ("Subject", "Topic", "Regarding", "Message Subject")
+_MESSAGE_FIELDS = ("Message", "Comments", "Your Message", "Details", "Description")
+_SUBMIT_LABELS = ("Submit", "Send", "Send Message", "Contact Us", "Get in Touch")
+
+# Text that marks an email address or phone number on a contact page
+_EMAIL_PATTERNS = ("contact@", "info@", "sales@", "support@", "@")
+_PHONE_PATTERNS = ("(", ")", "-", "Tel:", "Phone:", "Call:")
+
+# Per-lead time allowances for the multi-lead steps' timeouts: visiting a
+# search result, reading a contact page, and filling a contact form (the
+# ~400-character message alone takes well over a minute at natural speed)
+_SECONDS_PER_RESULT = 15.0
+_SECONDS_PER_EXTRACT = 20.0
+_SECONDS_PER_FORM = 180.0
+
+# Standard contact form message
+_CONTACT_MESSAGE = (
+    "Hello,\n"
+    "\n"
+    "I hope this message finds you well. I'm reaching out to explore potential\n"
+    "collaboration opportunities between our organizations. We specialize in\n"
+    "automation solutions and believe there may be synergies with your business.\n"
+    "\n"
+    "Would you be available for a brief call to discuss this further?\n"
+    "\n"
+    "Best regards,\n"
+    "Automation Team"
+)
+
+def _dumps_compact(obj: Any) -> str:
+    """Serialize obj as compact JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+@functools.lru_cache(maxsize=256)
+def _domain_for(url: str) -> str:
+    """Domain part of url without the www. prefix (memoized; workflows revisit the same sites)"""
+    return urlparse(url).netloc.replace('www.', '')
+
+def _backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0, jitter: float = 0.5) -> float:
+    """Capped exponential backoff with jitter so concurrent workflows don't retry in lockstep"""
+    return min(cap, base * (2 ** attempt) * (1 + random.uniform(-jitter, jitter)))
+
+@dataclass(frozen=True)
 class WorkflowStep:
     """Represents a single step in an automation workflow"""
     name: str
@@ -44,21 +134,32 @@ class WorkflowStep:
     retry_count: int = 3
     timeout: float = 30.0
     critical: bool = True
+    base_delay: float = 1.0   # Backoff before the second attempt
+    max_delay: float = 30.0   # Upper bound on any single backoff
+    jitter: float = 0.5       # ± fraction applied to each backoff
+    side_effects: bool = False  # Submits something, so a timed-out attempt is not replayed
 
-@dataclass
+@dataclass(frozen=True)
 class WorkflowResult:
     """Result of workflow execution"""
     success: bool
     steps_completed: int
     total_steps: int
     duration: float
-    errors: List[str]
-    data_extracted: Dict[str, Any]
+    errors: List[str] = field(default_factory=list)
+    data_extracted: Dict[str, Any] = field(default_factory=dict)
 
 class ComprehensiveWorkflowAutomator:
     """
     Production-ready workflow automation system demonstrating
     all BrowserGeist capabilities in a real-world scenario.
+    
+    Used as an async context manager, one automation session is shared
+    by every workflow run:
+        
+        async with ComprehensiveWorkflowAutomator(persona="tech_professional") as automator:
+            for _ in range(batches):
+                result = await automator.execute_lead_generation_workflow()
     """
     
     def __init__(self, 
@@ -77,18 +178,87 @@ class ComprehensiveWorkflowAutomator:
         self.workflow_data = {}
         self.errors = []
         
+        # Set once any step actually encounters a CAPTCHA
+        self._captcha_seen = False
+        
+        # Bound on leads processed at once, and a lock for the single screen/cursor
+        self._lead_sem = asyncio.Semaphore(8)
+        self._screen_lock = asyncio.Lock()
+        
+        # Label that last worked for each kind of element, tried first on the next page
+        self._label_cache: Dict[str, str] = {}
+        
+        # Workflow step actions and the methods that implement them
+        self._dispatch = {
+            "search_setup": self._setup_search,
+            "execute_search": self._execute_search,
+            "extract_data": self._extract_contact_data,
+            "form_automation": self._automate_contact_forms,
+            "captcha_solving": self._handle_captcha_challenges,
+            "report_generation": self._generate_workflow_report,
+        }
+        
+        # Automation session shared across workflow runs (see __aenter__)
+        self._session_stack: Optional[AsyncExitStack] = None
+        self._bot: Optional[AsyncHumanMouse] = None
+        
         # Debug directory
         self.debug_dir = Path("workflow_debug")
         self.debug_dir.mkdir(exist_ok=True)
+        
+        # Last debug screenshot written, used to skip identical frames
+        self._last_shot_hash: Optional[bytes] = None
+        self._last_shot_path: Optional[str] = None
+        
+        # Daemon connection reused for screenshots taken outside the shared session
+        self._shot_bot: Optional[HumanMouse] = None
+        self._shot_bot_lock = threading.Lock()
+    
+    async def __aenter__(self):
+        """Open one automation session that every workflow run reuses"""
+        self._session_stack = AsyncExitStack()
+        self._bot = await self._session_stack.enter_async_context(self._open_session())
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the shared automation session"""
+        stack, self._session_stack, self._bot = self._session_stack, None, None
+        await stack.aclose()
+        self._close_shot_bot()
+    
+    def _open_session(self):
+        """Create a new automation session context manager"""
+        return async_automation_session(
+            openai_api_key=self.openai_api_key,
+            persona=self.persona,
+            auto_solve_captcha=True,
+            command_timeout=30.0
+        )
+    
+    @asynccontextmanager
+    async def _session_for_run(self):
+        """Yield the shared session, or a one-off session outside `async with`"""
+        if self._bot is not None:
+            yield self._bot
+        else:
+            async with self._open_session() as bot:
+                yield bot
     
     def _setup_logging(self) -> logging.Logger:
         """Setup comprehensive logging for workflow automation"""
         logger = logging.getLogger("workflow_automator")
         logger.setLevel(logging.DEBUG if self.debug_mode else logging.INFO)
         
-        # File handler
+        # Handlers are attached once per process; later instances share them
+        if logger.handlers:
+            return logger
+        
+        # Records go only to these handlers, not again via the root logger
+        logger.propagate = False
+        
+        # File handler (the file is opened on first write)
         log_file = Path("workflow_automation.log")
-        file_handler = logging.FileHandler(log_file)
+        file_handler = logging.FileHandler(log_file, delay=True)
         file_handler.setLevel(logging.DEBUG)
         
         # Console handler
@@ -102,8 +272,14 @@ class ComprehensiveWorkflowAutomator:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        # Log calls only enqueue the record; a listener thread does the actual I/O
+        log_queue = queue.Queue(-1)
+        logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+        listener.start()
+        
+        # The listener outlives any one instance; drain it when the process exits
+        atexit.register(listener.stop)
         
         return logger
     
@@ -116,10 +292,17 @@ class ComprehensiveWorkflowAutomator:
         4. Handle CAPTCHAs
         5. Generate reports
         """
-        workflow_start = time.time()
+        workflow_start = time.perf_counter()
         self.logger.info("Starting lead generation workflow")
         
-        # Define workflow steps
+        # Each run starts from a clean slate, even on a reused session
+        self.current_step = 0
+        self.workflow_data = {}
+        self.errors = []
+        self._captcha_seen = False
+        
+        # Define workflow steps; the multi-lead steps get time for every lead
+        results_limit = 10
         steps = [
             WorkflowStep(
                 name="initialize_search",
@@ -131,19 +314,23 @@ class ComprehensiveWorkflowAutomator:
                 name="perform_search",
                 description="Execute search for target companies",
                 action="execute_search",
-                parameters={"results_limit": 10}
+                parameters={"results_limit": results_limit},
+                timeout=30.0 + _SECONDS_PER_RESULT * results_limit
             ),
             WorkflowStep(
                 name="extract_contacts",
                 description="Extract contact information from search results",
                 action="extract_data",
-                parameters={"data_types": ["email", "phone", "website"]}
+                parameters={"data_types": ["email", "phone", "website"]},
+                timeout=30.0 + _SECONDS_PER_EXTRACT * results_limit
             ),
             WorkflowStep(
                 name="fill_contact_forms",
                 description="Fill contact forms for each lead",
                 action="form_automation",
-                parameters={"form_template": "contact_inquiry"}
+                parameters={"form_template": "contact_inquiry"},
+                timeout=30.0 + _SECONDS_PER_FORM * results_limit,
+                side_effects=True
             ),
             WorkflowStep(
                 name="handle_captchas",
@@ -160,20 +347,15 @@ class ComprehensiveWorkflowAutomator:
         ]
         
         try:
-            async with async_automation_session(
-                openai_api_key=self.openai_api_key,
-                persona=self.persona,
-                auto_solve_captcha=True,
-                command_timeout=30.0
-            ) as bot:
+            async with self._session_for_run() as bot:
                 
                 for i, step in enumerate(steps):
                     self.current_step = i + 1
                     self.logger.info(f"Executing step {self.current_step}/{len(steps)}: {step.name}")
                     
-                    step_start = time.time()
+                    step_start = time.perf_counter()
                     success = await self._execute_step(bot, step)
-                    step_duration = time.time() - step_start
+                    step_duration = time.perf_counter() - step_start
                     
                     if success:
                         self.logger.info(f"Step {step.name} completed in {step_duration:.2f}s")
@@ -186,7 +368,7 @@ class ComprehensiveWorkflowAutomator:
                             self.logger.error("Critical step failed, aborting workflow")
                             break
                 
-                workflow_duration = time.time() - workflow_start
+                workflow_duration = time.perf_counter() - workflow_start
                 
                 # Generate final result
                 result = WorkflowResult(
@@ -207,9 +389,8 @@ class ComprehensiveWorkflowAutomator:
                 success=False,
                 steps_completed=self.current_step,
                 total_steps=len(steps),
-                duration=time.time() - workflow_start,
-                errors=[str(e)],
-                data_extracted={}
+                duration=time.perf_counter() - workflow_start,
+                errors=[str(e)]
             )
     
     async def _execute_step(self, bot: AsyncHumanMouse, step: WorkflowStep) -> bool:
@@ -223,22 +404,8 @@ class ComprehensiveWorkflowAutomator:
                 if self.debug_mode:
                     await self._capture_debug_screenshot(f"{step.name}_before_attempt_{attempt + 1}")
                 
-                # Execute the specific action
-                if step.action == "search_setup":
-                    success = await self._setup_search(bot, step.parameters)
-                elif step.action == "execute_search":
-                    success = await self._execute_search(bot, step.parameters)
-                elif step.action == "extract_data":
-                    success = await self._extract_contact_data(bot, step.parameters)
-                elif step.action == "form_automation":
-                    success = await self._automate_contact_forms(bot, step.parameters)
-                elif step.action == "captcha_solving":
-                    success = await self._handle_captcha_challenges(bot, step.parameters)
-                elif step.action == "report_generation":
-                    success = await self._generate_workflow_report(bot, step.parameters)
-                else:
-                    self.logger.warning(f"Unknown action: {step.action}")
-                    success = False
+                # Execute the specific action, bounded by the step timeout
+                success = await self._run_action(bot, step)
                 
                 if success:
                     # Take debug screenshot after successful step
@@ -248,17 +415,81 @@ class ComprehensiveWorkflowAutomator:
                 else:
                     self.logger.warning(f"Step {step.name} attempt {attempt + 1} failed")
                     if attempt < step.retry_count - 1:
-                        await asyncio.sleep(2.0 ** attempt)  # Exponential backoff
+                        await asyncio.sleep(_backoff_delay(attempt, step.base_delay, step.max_delay, step.jitter))
                 
-            except Exception as e:
+            except UnrecoverableError as e:
+                # Retrying a deterministic failure only burns the backoff budget
+                self.logger.error(f"Step {step.name} attempt {attempt + 1} failed permanently: {e}")
+                return False
+            except RecoverableError as e:
                 self.logger.error(f"Step {step.name} attempt {attempt + 1} error: {e}")
                 if attempt < step.retry_count - 1:
-                    await asyncio.sleep(2.0 ** attempt)
+                    await asyncio.sleep(_backoff_delay(attempt, step.base_delay, step.max_delay, step.jitter))
         
         # All attempts failed
         self.logger.error(f"Step {step.name} failed after {step.retry_count} attempts")
         return False
     
+    async def _run_action(self, bot: AsyncHumanMouse, step: WorkflowStep) -> bool:
+        """Run a step's action, classifying any failure as recoverable or not"""
+        try:
+            return await asyncio.wait_for(self._perform_action(bot, step), timeout=step.timeout)
+        except UnrecoverableError:
+            raise
+        except (KeyError, ValueError, FileNotFoundError, PermissionError) as e:
+            raise UnrecoverableError(f"{type(e).__name__}: {e}") from e
+        except asyncio.TimeoutError as e:
+            # Cancelling the attempt doesn't stop the daemon, so replaying a step
+            # that submits forms could submit them twice
+            if step.side_effects:
+                raise UnrecoverableError(f"Timed out after {step.timeout}s") from e
+            raise RecoverableError(f"Timed out after {step.timeout}s") from e
+        except Exception as e:
+            # Daemon, OCR and network hiccups are worth another attempt
+            raise RecoverableError(str(e)) from e
+    
+    async def _perform_action(self, bot: AsyncHumanMouse, step: WorkflowStep) -> bool:
+        """Dispatch a step to the method implementing its action"""
+        handler = self._dispatch.get(step.action)
+        if handler is None:
+            raise UnrecoverableError(f"Unknown action: {step.action}")
+        return await handler(bot, step.parameters)
+    
+    async def _try_candidates(self, category: str, candidates: Sequence[str], action) -> Optional[str]:
+        """Run action with each candidate label until one succeeds
+        
+        The label that worked last time for this category is tried first, since
+        similar pages tend to use the same wording.
+        
+        Returns:
+            The label that succeeded, or None if every candidate failed
+        """
+        cached = self._label_cache.get(category)
+        if cached in candidates:
+            candidates = [cached] + [label for label in candidates if label != cached]
+        
+        for label in candidates:
+            try:
+                await action(label)
+            except Exception:
+                continue
+            self._label_cache[category] = label
+            return label
+        
+        return None
+    
+    async def _type_first_match(self, 
+                                bot: AsyncHumanMouse, 
+                                category: str, 
+                                candidates: Sequence[str], 
+                                value: str, 
+                                delay_profile: str) -> Optional[str]:
+        """Type value into the first form field whose label matches a candidate"""
+        return await self._try_candidates(
+            category, candidates,
+            lambda label: bot.type_in_field(label, value, confidence=0.7, delay_profile=delay_profile)
+        )
+    
     async def _setup_search(self, bot: AsyncHumanMouse, params: Dict[str, Any]) -> bool:
         """Setup the search interface"""
         self.logger.info("Setting up search interface")
@@ -266,19 +497,12 @@ class ComprehensiveWorkflowAutomator:
         try:
             # Navigate to search page using natural element targeting
             # Try to find search box by common search terms
-            search_candidates = ["Search", "search", "Find", "Enter search terms", "Query"]
-            
-            found_search = False
-            for candidate in search_candidates:
-                try:
-                    await bot.click_text(candidate, confidence=0.7)
-                    found_search = True
-                    self.logger.info(f"Found search interface using: {candidate}")
-                    break
-                except Exception:
-                    continue
-            
-            if not found_search:
+            candidate = await self._try_candidates(
+                "search", _SEARCH_LABELS, lambda label: bot.click_text(label, confidence=0.7)
+            )
+            if candidate:
+                self.logger.info(f"Found search interface using: {candidate}")
+            else:
                 # Fallback: try to find search input field by looking for common input patterns
                 # This is more robust than hardcoded coordinates
                 self.logger.warning("Could not find search text, trying fallback positioning")
@@ -311,11 +535,13 @@ class ComprehensiveWorkflowAutomator:
             await bot.click()
             
             # Wait for results to load
-            await asyncio.sleep(3.0)
+            await bot.wait_until_idle(timeout=3.0)
             
             # Handle any CAPTCHAs that might appear
             captcha_solved = await bot.solve_captcha_if_present()
             if not captcha_solved:
+                # Only an unsolved CAPTCHA reports False, so one was really there
+                self._captcha_seen = True
                 self.logger.warning("CAPTCHA handling may be required")
             
             # Simulate collecting search results
@@ -329,7 +555,7 @@ class ComprehensiveWorkflowAutomator:
                 await bot.click()
                 
                 # Brief pause to load page
-                await asyncio.sleep(1.5)
+                await bot.wait_until_idle(timeout=1.5)
                 
                 # Simulate data extraction
                 result_data = {
@@ -342,7 +568,7 @@ class ComprehensiveWorkflowAutomator:
                 # Go back to results
                 await bot.move_to((100, 100), profile=MotionProfiles.FAST)  # Back button
                 await bot.click()
-                await asyncio.sleep(1.0)
+                await bot.wait_until_idle(timeout=1.0)
             
             self.workflow_data["search_results"] = results
             self.logger.info(f"Found {len(results)} search results")
@@ -360,9 +586,30 @@ class ComprehensiveWorkflowAutomator:
             results = self.workflow_data.get("search_results", [])
             data_types = params.get("data_types", ["email", "phone"])
             
-            for i, result in enumerate(results):
-                self.logger.debug(f"Extracting data from {result['company_name']}")
-                
+            outcomes = await asyncio.gather(
+                *(self._extract_one(bot, result, i, data_types) for i, result in enumerate(results)),
+                return_exceptions=True
+            )
+            failures = [o for o in outcomes if isinstance(o, Exception)]
+            for failure in failures:
+                self.logger.error(f"Contact data extraction failed for a lead: {failure}")
+            if failures:
+                return False
+            
+            self.logger.info(f"Extracted contact data for {len(results)} companies")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Contact data extraction failed: {e}")
+            return False
+    
+    async def _extract_one(self, bot: AsyncHumanMouse, result: Dict[str, Any], i: int, data_types: List[str]):
+        """Extract contact information for a single lead"""
+        async with self._lead_sem:
+            self.logger.debug(f"Extracting data from {result['company_name']}")
+            
+            # There is one screen and one cursor, so navigation and reads are serialized
+            async with self._screen_lock:
                 # Navigate to company website using real browser interaction
                 website_url = result.get("url", "")
                 if website_url:
@@ -370,87 +617,58 @@ class ComprehensiveWorkflowAutomator:
                     self.logger.info(f"Navigating to {website_url}")
                     
                     # Try to find and click Contact link using natural targeting
-                    contact_candidates = ["Contact", "Contact Us", "Get in Touch", "Reach Out", "About"]
-                    contact_found = False
-                    
-                    for contact_text in contact_candidates:
-                        try:
-                            await bot.click_link(contact_text, confidence=0.7)
-                            contact_found = True
-                            self.logger.info(f"Found contact page using: {contact_text}")
-                            break
-                        except Exception:
-                            continue
-                    
-                    if not contact_found:
+                    contact_text = await self._try_candidates(
+                        "contact_link", _CONTACT_LINK_LABELS, lambda label: bot.click_link(label, confidence=0.7)
+                    )
+                    if contact_text:
+                        self.logger.info(f"Found contact page using: {contact_text}")
+                    else:
                         self.logger.warning("Could not find contact link")
                 
-                await asyncio.sleep(2.0)  # Allow page to load
-                
-                # Extract contact information using real text detection
-                contact_data = {}
-                
-                if "email" in data_types:
-                    # Find email addresses on the page using OCR
-                    try:
-                        # Look for common email patterns
-                        email_candidates = ["contact@", "info@", "sales@", "support@", "@"]
-                        for email_pattern in email_candidates:
-                            try:
-                                # Use click_text to find email patterns, but don't actually click
-                                # This is a workaround - ideally we'd have a find_text method
-                                screenshot = await bot._take_screenshot()
-                                if screenshot is not None:
-                                    email_result = bot.vision.find_text(screenshot, email_pattern, confidence=0.6)
-                                    if email_result:
-                                        # Extract full email from detected text
-                                        contact_data["email"] = self._extract_email_from_text(email_pattern)
-                                        break
-                            except Exception:
-                                continue
-                        
-                        if "email" not in contact_data:
-                            # Fallback: generate reasonable email based on domain
-                            domain = self._extract_domain_from_url(website_url)
-                            contact_data["email"] = f"contact@{domain}" if domain else f"contact@company{i+1}.com"
-                    except Exception:
-                        contact_data["email"] = f"contact@company{i+1}.com"
-                
-                if "phone" in data_types:
-                    # Find phone numbers using OCR
-                    try:
-                        phone_patterns = ["(", ")", "-", "Tel:", "Phone:", "Call:"]
-                        for phone_pattern in phone_patterns:
-                            try:
-                                screenshot = await bot._take_screenshot()
-                                if screenshot is not None:
-                                    phone_result = bot.vision.find_text(screenshot, phone_pattern, confidence=0.6)
-                                    if phone_result:
-                                        contact_data["phone"] = self._extract_phone_from_text(phone_pattern)
-                                        break
-                            except Exception:
-                                continue
-                        
-                        if "phone" not in contact_data:
-                            contact_data["phone"] = f"(555) {100+i:03d}-{1000+i:04d}"
-                    except Exception:
-                        contact_data["phone"] = f"(555) {100+i:03d}-{1000+i:04d}"
-                
-                if "website" in data_types:
-                    contact_data["website"] = result["url"]
+                await bot.wait_until_idle(timeout=3.0)  # Allow page to load
                 
-                # Update result with contact data
-                result.update(contact_data)
-                
-                # Brief pause between extractions
-                await asyncio.sleep(0.5)
+                # The page doesn't change while we read it, so capture it once per dwell
+                try:
+                    page_shot = await bot._take_screenshot()
+                except Exception:
+                    page_shot = None
             
-            self.logger.info(f"Extracted contact data for {len(results)} companies")
-            return True
+            # One OCR pass over the captured frame covers every email and phone pattern.
+            # It runs off the screen lock, so other leads can navigate meanwhile.
+            # find_text_any reports OCR failures as no matches
+            hits = {}
+            if page_shot is not None:
+                hits = await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    functools.partial(bot.vision.find_text_any, confidence=0.6),
+                    page_shot, _EMAIL_PATTERNS + _PHONE_PATTERNS
+                )
             
-        except Exception as e:
-            self.logger.error(f"Contact data extraction failed: {e}")
-            return False
+            contact_data = {}
+            
+            if "email" in data_types:
+                # First common email pattern present on the page
+                email_pattern = next((p for p in _EMAIL_PATTERNS if hits.get(p)), None)
+                if email_pattern:
+                    # Extract full email from detected text
+                    contact_data["email"] = self._extract_email_from_text(email_pattern)
+                else:
+                    # Fallback: generate reasonable email based on domain
+                    domain = self._extract_domain_from_url(website_url)
+                    contact_data["email"] = f"contact@{domain}" if domain else f"contact@company{i+1}.com"
+            
+            if "phone" in data_types:
+                phone_pattern = next((p for p in _PHONE_PATTERNS if hits.get(p)), None)
+                if phone_pattern:
+                    contact_data["phone"] = self._extract_phone_from_text(phone_pattern)
+                else:
+                    contact_data["phone"] = f"(555) {100+i:03d}-{1000+i:04d}"
+            
+            if "website" in data_types:
+                contact_data["website"] = result["url"]
+            
+            # Update result with contact data
+            result.update(contact_data)
     
     async def _automate_contact_forms(self, bot: AsyncHumanMouse, params: Dict[str, Any]) -> bool:
         """Fill contact forms for each lead"""
@@ -459,131 +677,15 @@ class ComprehensiveWorkflowAutomator:
         try:
             results = self.workflow_data.get("search_results", [])
             
-            # Standard contact form message
-            message_template = """
-            Hello,
-            
-            I hope this message finds you well. I'm reaching out to explore potential 
-            collaboration opportunities between our organizations. We specialize in 
-            automation solutions and believe there may be synergies with your business.
-            
-            Would you be available for a brief call to discuss this further?
-            
-            Best regards,
-            Automation Team
-            """
-            
-            for i, result in enumerate(results):
-                company_name = result.get("company_name", f"Company {i+1}")
-                self.logger.debug(f"Filling contact form for {company_name}")
-                
-                # Navigate to contact form using natural targeting
-                form_candidates = ["Contact Form", "Get in Touch", "Send Message", "Contact", "Form"]
-                form_found = False
-                
-                for form_text in form_candidates:
-                    try:
-                        await bot.click_text(form_text, confidence=0.7)
-                        form_found = True
-                        self.logger.info(f"Found contact form using: {form_text}")
-                        break
-                    except Exception:
-                        continue
-                
-                if not form_found:
-                    self.logger.warning("Could not find contact form")
-                
-                await asyncio.sleep(1.0)
-                
-                # Fill form fields using natural field targeting
-                form_data = {
-                    "name": "John Smith",
-                    "email": "john.smith@automation-company.com",
-                    "company": "Automation Solutions Inc.",
-                    "subject": f"Partnership Opportunity with {company_name}",
-                    "message": message_template.strip()
-                }
-                
-                # Name field - try multiple common field labels
-                name_field_candidates = ["Name", "Full Name", "Your Name", "First Name"]
-                for field_label in name_field_candidates:
-                    try:
-                        await bot.type_in_field(field_label, form_data["name"], confidence=0.7, delay_profile="fast")
-                        self.logger.info(f"Filled name field using: {field_label}")
-                        break
-                    except Exception:
-                        continue
-                
-                # Email field
-                email_field_candidates = ["Email", "Email Address", "Your Email", "E-mail"]
-                for field_label in email_field_candidates:
-                    try:
-                        await bot.type_in_field(field_label, form_data["email"], confidence=0.7, delay_profile="careful")
-                        self.logger.info(f"Filled email field using: {field_label}")
-                        break
-                    except Exception:
-                        continue
-                
-                # Company field
-                company_field_candidates = ["Company", "Organization", "Company Name", "Business"]
-                for field_label in company_field_candidates:
-                    try:
-                        await bot.type_in_field(field_label, form_data["company"], confidence=0.7, delay_profile="average")
-                        self.logger.info(f"Filled company field using: {field_label}")
-                        break
-                    except Exception:
-                        continue
-                
-                # Subject field
-                subject_field_candidates = ["Subject", "Topic", "Regarding", "Message Subject"]
-                for field_label in subject_field_candidates:
-                    try:
-                        await bot.type_in_field(field_label, form_data["subject"], confidence=0.7, delay_profile="average")
-                        self.logger.info(f"Filled subject field using: {field_label}")
-                        break
-                    except Exception:
-                        continue
-                
-                # Message field
-                message_field_candidates = ["Message", "Comments", "Your Message", "Details", "Description"]
-                for field_label in message_field_candidates:
-                    try:
-                        await bot.type_in_field(field_label, form_data["message"], confidence=0.7, delay_profile="natural")
-                        self.logger.info(f"Filled message field using: {field_label}")
-                        break
-                    except Exception:
-                        continue
-                
-                # Handle CAPTCHA if present
-                try:
-                    await bot.check_for_captcha()
-                except Exception as e:
-                    self.logger.info(f"No CAPTCHA detected or handled: {e}")
-                
-                # Submit form using natural button targeting
-                submit_candidates = ["Submit", "Send", "Send Message", "Contact Us", "Get in Touch"]
-                submit_success = False
-                for submit_text in submit_candidates:
-                    try:
-                        await bot.click_button(button_text=submit_text, confidence=0.7)
-                        submit_success = True
-                        self.logger.info(f"Submitted form using: {submit_text}")
-                        break
-                    except Exception:
-                        continue
-                
-                if not submit_success:
-                    self.logger.warning("Could not find submit button")
-                
-                # Wait for submission confirmation
-                await asyncio.sleep(2.0)
-                
-                # Update result with form submission status
-                result["form_submitted"] = True
-                result["submission_time"] = datetime.now().isoformat()
-                
-                # Brief pause between form submissions
-                await asyncio.sleep(1.0)
+            outcomes = await asyncio.gather(
+                *(self._submit_one(bot, result, i, _CONTACT_MESSAGE) for i, result in enumerate(results)),
+                return_exceptions=True
+            )
+            failures = [o for o in outcomes if isinstance(o, Exception)]
+            for failure in failures:
+                self.logger.error(f"Contact form automation failed for a lead: {failure}")
+            if failures:
+                return False
             
             self.logger.info(f"Submitted contact forms for {len(results)} companies")
             return True
@@ -592,10 +694,93 @@ class ComprehensiveWorkflowAutomator:
             self.logger.error(f"Contact form automation failed: {e}")
             return False
     
+    async def _submit_one(self, bot: AsyncHumanMouse, result: Dict[str, Any], i: int, message: str):
+        """Fill and submit the contact form for a single lead"""
+        # Forms are filled with the mouse and keyboard, so only one lead at a time
+        async with self._screen_lock:
+            company_name = result.get("company_name", f"Company {i+1}")
+            self.logger.debug(f"Filling contact form for {company_name}")
+            
+            # Navigate to contact form using natural targeting
+            form_text = await self._try_candidates(
+                "contact_form", _CONTACT_FORM_LABELS, lambda label: bot.click_text(label, confidence=0.7)
+            )
+            if form_text:
+                self.logger.info(f"Found contact form using: {form_text}")
+            else:
+                self.logger.warning("Could not find contact form")
+            
+            await bot.wait_until_idle(timeout=1.0)
+            
+            # Fill form fields using natural field targeting
+            form_data = {
+                "name": "John Smith",
+                "email": "john.smith@automation-company.com",
+                "company": "Automation Solutions Inc.",
+                "subject": f"Partnership Opportunity with {company_name}",
+                "message": message
+            }
+            
+            # Name field - try multiple common field labels
+            field_label = await self._type_first_match(bot, "name", _NAME_FIELDS, form_data["name"], "fast")
+            if field_label:
+                self.logger.info(f"Filled name field using: {field_label}")
+            
+            # Email field
+            field_label = await self._type_first_match(bot, "email", _EMAIL_FIELDS, form_data["email"], "careful")
+            if field_label:
+                self.logger.info(f"Filled email field using: {field_label}")
+            
+            # Company field
+            field_label = await self._type_first_match(bot, "company", _COMPANY_FIELDS, form_data["company"], "average")
+            if field_label:
+                self.logger.info(f"Filled company field using: {field_label}")
+            
+            # Subject field
+            field_label = await self._type_first_match(bot, "subject", _SUBJECT_FIELDS, form_data["subject"], "average")
+            if field_label:
+                self.logger.info(f"Filled subject field using: {field_label}")
+            
+            # Message field
+            field_label = await self._type_first_match(bot, "message", _MESSAGE_FIELDS, form_data["message"], "natural")
+            if field_label:
+                self.logger.info(f"Filled message field using: {field_label}")
+            
+            # Handle CAPTCHA if present
+            try:
+                if await bot.check_for_captcha() is not None:
+                    self._captcha_seen = True
+            except Exception as e:
+                self.logger.info(f"No CAPTCHA detected or handled: {e}")
+            
+            # Submit form using natural button targeting
+            submit_text = await self._try_candidates(
+                "submit", _SUBMIT_LABELS, lambda label: bot.click_button(button_text=label, confidence=0.7)
+            )
+            if submit_text:
+                self.logger.info(f"Submitted form using: {submit_text}")
+            else:
+                self.logger.warning("Could not find submit button")
+            
+            # Wait for submission confirmation
+            await bot.wait_until_text("Thank you", timeout=4.0)
+            
+            # Brief pause between form submissions
+            await asyncio.sleep(1.0)
+        
+        # Update result with form submission status
+        result["form_submitted"] = True
+        result["submission_time"] = datetime.now().isoformat()
+    
     async def _handle_captcha_challenges(self, bot: AsyncHumanMouse, params: Dict[str, Any]) -> bool:
         """Handle any outstanding CAPTCHA challenges"""
         self.logger.info("Handling CAPTCHA challenges")
         
+        # Nothing to clean up if no earlier step ever ran into a CAPTCHA
+        if not self._captcha_seen:
+            self.logger.info("No CAPTCHAs encountered, skipping check")
+            return True
+        
         try:
             methods = params.get("methods", ["openai", "manual"])
             
@@ -608,7 +793,7 @@ class ComprehensiveWorkflowAutomator:
                     break
                 elif captcha_found.success:
                     self.logger.info(f"CAPTCHA solved using {captcha_found.method}")
-                    await asyncio.sleep(1.0)  # Brief pause after solving
+                    await asyncio.sleep(0.25)  # Brief pause after solving
                 else:
                     self.logger.warning(f"CAPTCHA solving failed: {captcha_found.error}")
                     return False
@@ -639,24 +824,10 @@ class ComprehensiveWorkflowAutomator:
                 "companies": results
             }
             
-            # Save report to file
-            report_file = self.debug_dir / f"workflow_report.json"
-            with open(report_file, 'w') as f:
-                import json
-                json.dump(report_data, f, indent=2)
-            
-            # Generate CSV if requested
-            if report_format == "csv":
-                csv_file = self.debug_dir / "lead_generation_results.csv"
-                with open(csv_file, 'w') as f:
-                    f.write("Company Name,Email,Phone,Website,Form Submitted,Submission Time\n")
-                    for result in results:
-                        f.write(f"{result.get('company_name', '')},")
-                        f.write(f"{result.get('email', '')},")
-                        f.write(f"{result.get('phone', '')},")
-                        f.write(f"{result.get('website', '')},")
-                        f.write(f"{result.get('form_submitted', False)},")
-                        f.write(f"{result.get('submission_time', '')}\n")
+            # File I/O runs on a worker thread so the event loop stays responsive
+            report_file = await asyncio.get_running_loop().run_in_executor(
+                None, self._write_reports, report_data, results, self.debug_dir, report_format
+            )
             
             # Capture final screenshot if requested
             if include_screenshots:
@@ -672,45 +843,66 @@ class ComprehensiveWorkflowAutomator:
             self.logger.error(f"Report generation failed: {e}")
             return False
     
+    def _write_reports(self, 
+                       report_data: Dict[str, Any], 
+                       results: List[Dict[str, Any]], 
+                       debug_dir: Path, 
+                       report_format: str) -> Path:
+        """Write the JSON report, plus the CSV if requested (blocking)"""
+        report_file = debug_dir / "workflow_report.json"
+        
+        # Stream the companies one record at a time so a large result set is
+        # never serialized into a single in-memory blob
+        envelope = {key: value for key, value in report_data.items() if key != "companies"}
+        envelope_fields = _dumps_compact(envelope)[1:-1]  # Without the surrounding braces
+        with open(report_file, 'w') as f:
+            f.write('{')
+            if envelope_fields:
+                f.write(envelope_fields + ',')
+            f.write('"companies":[')
+            for index, company in enumerate(report_data.get("companies", [])):
+                if index:
+                    f.write(",")
+                f.write(_dumps_compact(company))
+            f.write("]}")
+        
+        # Generate CSV if requested; the csv module quotes fields containing commas.
+        # Rows are formatted in memory and written to disk in one go
+        if report_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(["Company Name", "Email", "Phone", "Website", "Form Submitted", "Submission Time"])
+            writer.writerows(
+                (result.get('company_name', ''), result.get('email', ''), result.get('phone', ''),
+                 result.get('website', ''), result.get('form_submitted', False), result.get('submission_time', ''))
+                for result in results
+            )
+            with open(debug_dir / "lead_generation_results.csv", 'w', newline='') as f:
+                f.write(buffer.getvalue())
+        
+        return report_file
+    
     def _extract_email_from_text(self, text_result) -> str:
         """Extract email address from OCR text result"""
-        import re
-        # Simple email regex pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        
-        # If text_result is a MatchResult object, get the actual text
-        text = str(text_result) if hasattr(text_result, '__str__') else text_result
+        # Callers usually pass the matched text itself; only stringify other results
+        text = text_result if isinstance(text_result, str) else str(text_result)
         
-        matches = re.findall(email_pattern, text)
-        return matches[0] if matches else "contact@example.com"
+        match = _EMAIL_RE.search(text)
+        return match.group(0) if match else "contact@example.com"
     
     def _extract_phone_from_text(self, text_result) -> str:
         """Extract phone number from OCR text result"""
-        import re
-        # Phone number patterns
-        phone_patterns = [
-            r'\(\d{3}\)\s*\d{3}-\d{4}',  # (555) 123-4567
-            r'\d{3}-\d{3}-\d{4}',        # 555-123-4567
-            r'\d{3}\.\d{3}\.\d{4}',      # 555.123.4567
-            r'\d{10}',                   # 5551234567
-        ]
-        
-        text = str(text_result) if hasattr(text_result, '__str__') else text_result
+        text = text_result if isinstance(text_result, str) else str(text_result)
         
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                return matches[0]
-        
-        return "(555) 123-4567"
+        # Cheap anchor scan first; most OCR text has no three-digit run at all
+        anchor = _PHONE_ANCHOR.search(text)
+        match = _PHONE_RE.search(text, anchor.start()) if anchor else None
+        return match.group(0) if match else "(555) 123-4567"
     
     def _extract_domain_from_url(self, url: str) -> str:
         """Extract domain from URL"""
         try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            domain = parsed.netloc.replace('www.', '')
-            return domain
+            return _domain_for(url)
         except Exception:
             return "example.com"
     
@@ -719,28 +911,73 @@ class ComprehensiveWorkflowAutomator:
         if not self.debug_mode:
             return None
         
+        if self._bot is not None:
+            # Capture through the shared async session without blocking the event loop
+            try:
+                screenshot_data = await self._bot.screenshot_png()
+            except Exception as e:
+                self.logger.warning(f"Debug screenshot failed: {e}")
+                return None
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._store_debug_screenshot, name, screenshot_data
+            )
+        
+        # The synchronous daemon round-trip and file write run on a worker thread
+        return await asyncio.get_running_loop().run_in_executor(None, self._save_debug_screenshot, name)
+    
+    def _save_debug_screenshot(self, name: str) -> Optional[str]:
+        """Capture a screenshot through the daemon and save it (blocking)"""
         try:
-            # Use daemon to capture actual screenshot
-            from browsergeist import HumanMouse
+            # Use daemon to capture actual screenshot, over one connection kept for the
+            # automator's lifetime instead of a connect/disconnect per screenshot
+            with self._shot_bot_lock:
+                if self._shot_bot is None:
+                    self._shot_bot = HumanMouse(auto_solve_captcha=False)
+                try:
+                    result = self._shot_bot._send_command({"action": "screenshot"})
+                except Exception:
+                    # Drop a broken connection so the next screenshot reconnects
+                    self._close_shot_bot()
+                    raise
             
-            with HumanMouse() as temp_bot:
-                # Take actual screenshot using the daemon
-                result = temp_bot._send_command({"action": "screenshot"})
-                
-                if result.success and "data" in result.details:
-                    # Decode and save screenshot
-                    import base64
-                    screenshot_data = base64.b64decode(result.details["data"])
-                    
-                    screenshot_path = self.debug_dir / f"{name}_{int(time.time())}.png"
-                    with open(screenshot_path, 'wb') as f:
-                        f.write(screenshot_data)
-                    
-                    self.logger.debug(f"Debug screenshot saved: {screenshot_path}")
-                    return str(screenshot_path)
-                else:
-                    self.logger.warning("Screenshot capture failed")
-                    return None
+            if result.success and "data" in result.details:
+                # Decode and save screenshot (a2b_base64 is the C decoder b64decode wraps)
+                return self._store_debug_screenshot(name, binascii.a2b_base64(result.details["data"]))
+            else:
+                self.logger.warning("Screenshot capture failed")
+                return None
+            
+        except Exception as e:
+            self.logger.warning(f"Debug screenshot failed: {e}")
+            return None
+    
+    def _close_shot_bot(self) -> None:
+        """Close the screenshot connection, if one was opened"""
+        shot_bot, self._shot_bot = self._shot_bot, None
+        if shot_bot is not None:
+            shot_bot.close()
+    
+    def _store_debug_screenshot(self, name: str, screenshot_data: bytes) -> Optional[str]:
+        """Write captured PNG bytes to the debug directory (blocking)"""
+        try:
+            # Identical frames (e.g. still waiting on the same page) are recorded
+            # as a small pointer to the previous image instead of a new PNG
+            digest = hashlib.blake2b(screenshot_data, digest_size=8).digest()
+            if digest == self._last_shot_hash and self._last_shot_path:
+                dup_path = self.debug_dir / f"{name}_{int(time.time())}.dup"
+                dup_path.write_text(self._last_shot_path)
+                self.logger.debug(f"Debug screenshot unchanged, see {self._last_shot_path}")
+                return self._last_shot_path
+            
+            screenshot_path = self.debug_dir / f"{name}_{int(time.time())}.png"
+            with open(screenshot_path, 'wb') as f:
+                f.write(screenshot_data)
+            
+            self._last_shot_hash = digest
+            self._last_shot_path = str(screenshot_path)
+            
+            self.logger.debug(f"Debug screenshot saved: {screenshot_path}")
+            return str(screenshot_path)
             
         except Exception as e:
             self.logger.warning(f"Debug screenshot failed: {e}")
@@ -765,20 +1002,19 @@ async def demo_complete_workflow():
         print("💡 Set OPENAI_API_KEY for automatic CAPTCHA solving")
     
     try:
-        # Create workflow automator
-        automator = ComprehensiveWorkflowAutomator(
+        # Create workflow automator; the session it opens can serve many workflow runs
+        async with ComprehensiveWorkflowAutomator(
             openai_api_key=openai_key,
             persona="tech_professional",
             debug_mode=True
-        )
-        
-        print("🎯 Starting lead generation workflow...")
-        start_time = time.time()
-        
-        # Execute the workflow
-        result = await automator.execute_lead_generation_workflow()
+        ) as automator:
+            print("🎯 Starting lead generation workflow...")
+            start_time = time.perf_counter()
+            
+            # Execute the workflow
+            result = await automator.execute_lead_generation_workflow()
         
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         
         # Display results
         print(f"\n📊 Workflow Results:")
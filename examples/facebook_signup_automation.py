@@ -4,7 +4,7 @@ Facebook Account Creation Automation Example
 
 Demonstrates comprehensive browser automation using BrowserGeist's natural
 element targeting API. This example shows real-world usage including:
-- Opening applications via Spotlight
+- Opening applications directly or via Spotlight
 - Menu navigation and window management
 - Form filling with natural field targeting
 - Multi-step workflow automation
@@ -17,7 +17,9 @@ import sys
 import os
 import time
 import asyncio
-from datetime import datetime
+import binascii
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 # Add the src directory to Python path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'python_sdk'))
@@ -26,14 +28,48 @@ from browsergeist import HumanMouse, MotionProfiles, automation_session
 from user_personas import get_persona
 
 
+def label_variants(field_label: str) -> list:
+    """Label spellings to try for a form field, most likely first, without duplicates"""
+    candidates = [
+        field_label,
+        field_label.lower(),
+        field_label + " or phone number" if "email" in field_label.lower() else field_label,
+        field_label + " (required)" if field_label else field_label
+    ]
+    return list(dict.fromkeys(candidates))
+
+
 class FacebookSignupAutomation:
     """Automated Facebook account creation using natural browser targeting"""
 
+    LEVEL_EMOJI = {
+        "INFO": "ℹ️",
+        "SUCCESS": "✅",
+        "WARNING": "⚠️",
+        "ERROR": "❌",
+        "STEP": "🔄"
+    }
+
+    # Label variants for the signup form's fields, computed once
+    FIELD_CANDIDATES = {
+        label: label_variants(label)
+        for label in ("First name", "Last name", "Email", "Password", "Month", "Day", "Year")
+    }
+
     def __init__(self, use_persona=True, debug_mode=True):
         self.use_persona = use_persona
         self.debug_mode = debug_mode
         self.persona = get_persona("tech_professional") if use_persona else None
 
+        # Debug screenshots are captured at each step boundary; a single worker
+        # thread decodes and saves them while the next step runs
+        self.debug_dir = Path("facebook_signup_debug")
+        self._shot_executor = ThreadPoolExecutor(max_workers=1) if debug_mode else None
+        self._pending_shots = []
+
+        # Label that worked last time for each step, tried first on later runs
+        self._winning_candidates = {}
+
         # Account details to use for signup
         self.account_data = {
             "first_name": "John",
@@ -48,21 +84,23 @@ class FacebookSignupAutomation:
 
     def log(self, message: str, level: str = "INFO"):
         """Enhanced logging with timestamps"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        level_emoji = {
-            "INFO": "ℹ️",
-            "SUCCESS": "✅",
-            "WARNING": "⚠️",
-            "ERROR": "❌",
-            "STEP": "🔄"
-        }
-        emoji = level_emoji.get(level, "📝")
+        timestamp = time.strftime("%H:%M:%S")
+        emoji = self.LEVEL_EMOJI.get(level, "📝")
         print(f"[{timestamp}] {emoji} {message}")
 
-    def wait_with_message(self, seconds: float, message: str):
-        """Wait with user feedback"""
-        self.log(f"{message} (waiting {seconds}s)")
-        time.sleep(seconds)
+    def wait_with_message(self, bot, seconds: float, message: str, text: str = None):
+        """Wait with user feedback until the UI is ready, at most `seconds`
+
+        Returns as soon as `text` is visible or, without `text`, as soon as the
+        screen stops changing, instead of always sleeping the worst-case delay.
+        """
+        self.log(f"{message} (up to {seconds}s)")
+        if text:
+            result = bot.wait.for_element(text, timeout=seconds, confidence=0.7)
+        else:
+            result = bot.wait.for_stable_screen(timeout=seconds, stability_duration=0.3)
+        if result.success:
+            self.log(f"Ready after {result.elapsed_time:.2f}s")
 
     async def run_automation(self):
         """Execute the complete Facebook signup automation workflow"""
@@ -71,20 +109,25 @@ class FacebookSignupAutomation:
 
         try:
             with automation_session(persona=self.persona) as bot:
-                # Step 1: Open Safari via Spotlight
-                await self.open_safari_via_spotlight(bot)
+                # Step 1: Open Safari
+                await self.open_safari(bot)
+                self.capture_step_screenshot(bot, "01_safari_opened")
 
                 # Step 2: Open private browsing window
                 await self.open_private_window(bot)
+                self.capture_step_screenshot(bot, "02_private_window")
 
                 # Step 3: Navigate to Facebook
                 await self.navigate_to_facebook(bot)
+                self.capture_step_screenshot(bot, "03_facebook_loaded")
 
                 # Step 4: Start account creation
                 await self.start_account_creation(bot)
+                self.capture_step_screenshot(bot, "04_signup_form")
 
                 # Step 5: Fill signup form
                 await self.fill_signup_form(bot)
+                self.capture_step_screenshot(bot, "05_form_filled")
 
                 # Step 6: Submit form (but stop before actual submission)
                 await self.prepare_submission(bot)
@@ -95,31 +138,77 @@ class FacebookSignupAutomation:
             self.log(f"Automation failed: {str(e)}", "ERROR")
             raise
 
-    async def open_safari_via_spotlight(self, bot):
-        """Open Safari browser using Spotlight search"""
-        self.log("Opening Safari via Spotlight...", "STEP")
-
+        finally:
+            await self.finish_step_screenshots()
+
+    def capture_step_screenshot(self, bot, step_name: str):
+        """Capture a debug screenshot now and save it in the background
+        
+        The capture itself is synchronous so the image shows this step's end
+        state, not whatever the next step is already doing; only decoding and
+        writing the file overlap with the next step.
+        """
+        if not self.debug_mode:
+            return
         try:
-            # Open Spotlight with Cmd+Space
-            self.log("Opening Spotlight (Cmd+Space)")
-            bot._send_command({"action": "key_combination", "keys": ["cmd", "space"]})
+            result = bot._send_command({"action": "screenshot"})
+        except Exception as e:
+            self.log(f"Debug screenshot failed: {e}", "WARNING")
+            return
+        if not (result.success and "data" in result.details):
+            return
+        loop = asyncio.get_running_loop()
+        self._pending_shots.append(
+            loop.run_in_executor(self._shot_executor, self._save_step_screenshot, step_name, result.details["data"])
+        )
+
+    def _save_step_screenshot(self, step_name: str, data: str):
+        """Decode a base64 screenshot and save it (blocking)"""
+        try:
+            self.debug_dir.mkdir(exist_ok=True)
+            path = self.debug_dir / f"{step_name}_{int(time.time())}.png"
+            path.write_bytes(binascii.a2b_base64(data))
+            self.log(f"Debug screenshot saved: {path}")
+        except Exception as e:
+            self.log(f"Debug screenshot failed: {e}", "WARNING")
 
-            # Wait for Spotlight to open
-            self.wait_with_message(1.5, "Waiting for Spotlight to open")
+    async def finish_step_screenshots(self):
+        """Wait for outstanding debug screenshots to be saved"""
+        if not self.debug_mode:
+            return
+        await asyncio.gather(*self._pending_shots)
+        self._pending_shots.clear()
 
-            # Type "Safari" to search for the application
-            self.log("Typing 'Safari' in Spotlight")
-            bot.type_text("Safari", delay_profile="fast", use_persona=True)
+    async def open_safari(self, bot):
+        """Launch Safari directly through the daemon, falling back to Spotlight"""
+        self.log("Opening Safari...", "STEP")
+
+        try:
+            # One daemon call that returns once Safari has finished launching
+            result = bot.launch_app("Safari", timeout=5.0)
+            self.log(f"Safari opened successfully (pid {result.details.get('pid')})", "SUCCESS")
+            return
+        except Exception as e:
+            self.log(f"Direct launch unavailable ({e}), using Spotlight", "WARNING")
 
-            # Wait for search results
-            self.wait_with_message(1.0, "Waiting for search results")
+        await self.open_safari_via_spotlight(bot)
 
-            # Press Enter to open Safari
-            self.log("Pressing Enter to launch Safari")
-            bot._send_command({"action": "key_combination", "keys": ["return"]})
+    async def open_safari_via_spotlight(self, bot):
+        """Open Safari browser using Spotlight search"""
+        self.log("Opening Safari via Spotlight...", "STEP")
+
+        try:
+            # Cmd+Space, type "Safari", press Enter: one daemon round-trip, with the
+            # pauses for Spotlight to open and for search results applied daemon-side
+            self.log("Opening Spotlight (Cmd+Space), typing 'Safari', pressing Enter")
+            open_spotlight = {"action": "key_combination", "keys": ["cmd", "space"], "delay_after_ms": 1000}
+            search_safari = bot.type_command("Safari", delay_profile="fast", use_persona=True)
+            search_safari["delay_after_ms"] = 700
+            press_enter = {"action": "key_combination", "keys": ["return"]}
+            bot.run_batch([open_spotlight, search_safari, press_enter])
 
             # Wait for Safari to launch
-            self.wait_with_message(3.0, "Waiting for Safari to launch")
+            self.wait_with_message(bot, 3.0, "Waiting for Safari to launch")
 
             self.log("Safari opened successfully", "SUCCESS")
 
@@ -142,7 +231,7 @@ class FacebookSignupAutomation:
                 bot.click_text("File", confidence=0.6, use_accessibility=False)
 
             # Wait for menu to open
-            self.wait_with_message(1.0, "Waiting for File menu to open")
+            self.wait_with_message(bot, 1.0, "Waiting for File menu to open")
 
             # Click "New Private Window"
             self.log("Clicking 'New Private Window'")
@@ -153,23 +242,17 @@ class FacebookSignupAutomation:
                 "Private Browsing"
             ]
 
-            success = False
-            for candidate in private_window_candidates:
-                try:
-                    bot.click_text(candidate, confidence=0.7)
-                    success = True
-                    self.log(f"Found private window option: {candidate}")
-                    break
-                except Exception:
-                    continue
-
-            if not success:
+            # One screen scan covers every candidate label
+            try:
+                label = self.click_first_candidate(bot, "private_window", private_window_candidates, 0.7)
+                self.log(f"Found private window option: {label}")
+            except Exception:
                 # Fallback: use keyboard shortcut
                 self.log("Using keyboard shortcut for private window", "WARNING")
                 bot._send_command({"action": "key_combination", "keys": ["cmd", "shift", "n"]})
 
             # Wait for private window to open
-            self.wait_with_message(2.0, "Waiting for private window to open")
+            self.wait_with_message(bot, 2.0, "Waiting for private window to open")
 
             self.log("Private browsing window opened", "SUCCESS")
 
@@ -192,34 +275,26 @@ class FacebookSignupAutomation:
             ]
 
             # Try to find address bar naturally
-            address_found = False
-            for candidate in address_bar_candidates:
-                try:
-                    bot.click_text(candidate, confidence=0.6)
-                    address_found = True
-                    self.log(f"Found address bar using: {candidate}")
-                    break
-                except Exception:
-                    continue
-
-            if not address_found:
+            try:
+                label = self.click_first_candidate(bot, "address_bar", address_bar_candidates, 0.6)
+                self.log(f"Found address bar using: {label}")
+            except Exception:
                 # Fallback: use keyboard shortcut to focus address bar
                 self.log("Using keyboard shortcut for address bar", "WARNING")
                 bot._send_command({"action": "key_combination", "keys": ["cmd", "l"]})
 
             # Wait for address bar to be focused
-            self.wait_with_message(1.0, "Waiting for address bar focus")
+            self.wait_with_message(bot, 1.0, "Waiting for address bar focus")
 
-            # Type Facebook URL
-            self.log("Typing facebook.com")
-            bot.type_text("facebook.com", delay_profile="fast")
-
-            # Press Enter to navigate
-            self.log("Pressing Enter to navigate")
-            bot._send_command({"action": "key_combination", "keys": ["return"]})
+            # Type Facebook URL and press Enter to navigate, in one daemon round-trip
+            self.log("Typing facebook.com and pressing Enter")
+            bot.run_batch([
+                bot.type_command("facebook.com", delay_profile="fast"),
+                {"action": "key_combination", "keys": ["return"]}
+            ])
 
             # Wait for page to load
-            self.wait_with_message(5.0, "Waiting for Facebook to load")
+            self.wait_with_message(bot, 5.0, "Waiting for Facebook to load", text="Create new account")
 
             self.log("Successfully navigated to Facebook", "SUCCESS")
 
@@ -242,23 +317,14 @@ class FacebookSignupAutomation:
                 "Join Facebook"
             ]
 
-            success = False
-            for candidate in create_account_candidates:
-                try:
-                    self.log(f"Looking for: {candidate}")
-                    bot.click_text(candidate, confidence=0.7)
-                    success = True
-                    self.log(f"Found account creation option: {candidate}")
-                    break
-                except Exception as e:
-                    self.log(f"Could not find '{candidate}': {e}", "WARNING")
-                    continue
-
-            if not success:
-                raise Exception("Could not find account creation button")
+            try:
+                label = self.click_first_candidate(bot, "create_account", create_account_candidates, 0.7)
+            except Exception as e:
+                raise Exception(f"Could not find account creation button: {e}")
+            self.log(f"Found account creation option: {label}")
 
             # Wait for signup form to load
-            self.wait_with_message(3.0, "Waiting for signup form to load")
+            self.wait_with_message(bot, 3.0, "Waiting for signup form to load", text="First name")
 
             self.log("Account creation form loaded", "SUCCESS")
 
@@ -300,26 +366,15 @@ class FacebookSignupAutomation:
         self.log(f"Filling {field_label}: {value}")
 
         # Try multiple variations of field labels
-        field_candidates = [
-            field_label,
-            field_label.lower(),
-            field_label + " or phone number" if "email" in field_label.lower() else field_label,
-            field_label + " (required)" if field_label else field_label
-        ]
-
-        success = False
-        for candidate in field_candidates:
-            try:
-                bot.type_in_field(candidate, value, confidence=0.7, delay_profile="average")
-                success = True
-                self.log(f"Successfully filled {field_label} using label: {candidate}")
-                break
-            except Exception as e:
-                self.log(f"Could not fill using '{candidate}': {e}", "WARNING")
-                continue
+        field_candidates = self.FIELD_CANDIDATES.get(field_label) or label_variants(field_label)
 
-        if not success:
-            raise Exception(f"Could not fill field: {field_label}")
+        # All label variants are resolved in one accessibility query / OCR pass
+        try:
+            result = bot.type_in_any_field(field_candidates, value,
+                                           confidence=0.7, delay_profile="average")
+        except Exception as e:
+            raise Exception(f"Could not fill field: {field_label} ({e})")
+        self.log(f"Successfully filled {field_label} using label: {result.details['found_label']}")
 
         # Small delay between fields for natural flow
         time.sleep(0.5)
@@ -337,22 +392,47 @@ class FacebookSignupAutomation:
             ]
 
             for field_name, value in birthday_fields:
+                # Ask once what kind of control this is instead of failing over on exceptions
+                kind = bot.get_field_kind(field_name)
                 try:
-                    # Try as regular input field first
-                    await self.fill_form_field(bot, field_name, value)
-                except Exception:
-                    # Try as dropdown
-                    try:
-                        bot.click_text(field_name, confidence=0.7)
-                        time.sleep(1.0)
-                        bot.click_text(value, confidence=0.7)
-                        self.log(f"Selected {field_name}: {value} from dropdown")
-                    except Exception as e:
-                        self.log(f"Could not set {field_name}: {e}", "WARNING")
+                    if kind == "select":
+                        self.select_dropdown_option(bot, field_name, value)
+                    elif kind == "input":
+                        await self.fill_form_field(bot, field_name, value)
+                    else:
+                        # Accessibility couldn't tell: try as input field, then as dropdown
+                        try:
+                            await self.fill_form_field(bot, field_name, value)
+                        except Exception:
+                            self.select_dropdown_option(bot, field_name, value)
+                except Exception as e:
+                    self.log(f"Could not set {field_name}: {e}", "WARNING")
 
         except Exception as e:
             self.log(f"Birthday fields handling failed: {e}", "WARNING")
 
+    def click_first_candidate(self, bot, step: str, candidates: list, confidence: float) -> str:
+        """Click the first visible candidate label, preferring the one that won last time
+
+        Returns:
+            The label that was clicked
+        """
+        cached = self._winning_candidates.get(step)
+        if cached in candidates:
+            candidates = [cached] + [label for label in candidates if label != cached]
+
+        result = bot.find_and_click_any(candidates, confidence=confidence)
+        label = result.details["found_candidate"]
+        self._winning_candidates[step] = label
+        return label
+
+    def select_dropdown_option(self, bot, field_name: str, value: str):
+        """Open a dropdown by its label and pick an option"""
+        bot.click_text(field_name, confidence=0.7)
+        time.sleep(1.0)
+        bot.click_text(value, confidence=0.7)
+        self.log(f"Selected {field_name}: {value} from dropdown")
+
     async def select_gender(self, bot):
         """Select gender option"""
         self.log(f"Selecting gender: {self.account_data['gender']}")
@@ -364,13 +444,8 @@ class FacebookSignupAutomation:
                 "Male" if self.account_data["gender"] == "Male" else "Female"
             ]
 
-            for candidate in gender_candidates:
-                try:
-                    bot.click_text(candidate, confidence=0.7)
-                    self.log(f"Selected gender: {candidate}")
-                    break
-                except Exception:
-                    continue
+            label = self.click_first_candidate(bot, "gender", gender_candidates, 0.7)
+            self.log(f"Selected gender: {label}")
 
         except Exception as e:
             self.log(f"Gender selection failed: {e}", "WARNING")
@@ -388,19 +463,16 @@ class FacebookSignupAutomation:
                 "Get Started"
             ]
 
-            for candidate in submit_candidates:
-                try:
-                    # Just find the button, don't click
-                    screenshot = bot._take_screenshot()
-                    if screenshot is not None:
-                        result = bot.vision.find_text(screenshot, candidate, confidence=0.7)
-                        if result:
-                            self.log(f"Found submit button: {candidate}")
-                            self.log("⚠️  Form is ready for submission but stopping here for safety", "WARNING")
-                            self.log("⚠️  Manual review recommended before actual account creation", "WARNING")
-                            return
-                except Exception:
-                    continue
+            # Just find the button, don't click: one screenshot and one OCR pass for all candidates
+            screenshot = bot._take_screenshot()
+            if screenshot is not None:
+                matches = bot.vision.find_text_any(screenshot, submit_candidates, confidence=0.7)
+                for candidate in submit_candidates:
+                    if matches[candidate]:
+                        self.log(f"Found submit button: {candidate}")
+                        self.log("⚠️  Form is ready for submission but stopping here for safety", "WARNING")
+                        self.log("⚠️  Manual review recommended before actual account creation", "WARNING")
+                        return
 
             self.log("Submit button location identified", "SUCCESS")
 
@@ -438,7 +510,7 @@ async def main():
         print("✅ Automation demonstration completed successfully!")
         print()
         print("📋 What was demonstrated:")
-        print("  ✓ Spotlight application launching")
+        print("  ✓ Application launching (Spotlight as fallback)")
         print("  ✓ Menu navigation and window management")
         print("  ✓ Natural element targeting (text-based)")
         print("  ✓ Form field detection and filling")
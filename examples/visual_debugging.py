@@ -14,12 +14,23 @@ Comprehensive guide to visual automation with BrowserGeist:
 This example provides practical guidance for visual automation debugging.
 """
 
+import io
 import sys
 import os
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Tuple
 
+import cv2
+import numpy as np
+
+try:
+    import Quartz  # macOS only: reads the live mouse position for guided capture
+except ImportError:
+    Quartz = None
+
 # Add SDK to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'python_sdk'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'vision'))
@@ -27,17 +38,49 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'vision'))
 from browsergeist import HumanMouse, target, MotionProfiles
 from template_matcher import TemplateMatcher, VisionCache
 
+def brightness_divergence(image_a, image_b, bins: int = 8) -> float:
+    """
+    Jensen-Shannon divergence between two grayscale images' brightness histograms.
+    
+    Returns:
+        0.0 for identical tone distributions up to 1.0 for disjoint ones
+    """
+    hist_a = cv2.calcHist([image_a], [0], None, [bins], [0, 256]).ravel()
+    hist_b = cv2.calcHist([image_b], [0], None, [bins], [0, 256]).ravel()
+    p = hist_a / max(hist_a.sum(), 1.0)
+    q = hist_b / max(hist_b.sum(), 1.0)
+    m = (p + q) / 2
+    
+    def kl(x):
+        mask = x > 0
+        return float((x[mask] * np.log2(x[mask] / m[mask])).sum())
+    
+    return (kl(p) + kl(q)) / 2
+
+
 class VisualDebugger:
     """
     Comprehensive visual debugging tool for BrowserGeist automation.
     """
     
-    def __init__(self):
+    def __init__(self, screenshot_max_age: float = 5.0):
         self.bot = None
         self.matcher = TemplateMatcher()
         self.cache = VisionCache()
         self.debug_dir = Path("debug_screenshots")
         self.debug_dir.mkdir(exist_ok=True)
+        # Receive buffer reused by every capture (grown to the largest screenshot)
+        self._png_buffer = bytearray()
+        
+        # Last decoded capture, shared by the analysis passes (see get_screenshot)
+        self.screenshot_max_age = screenshot_max_age
+        self._last_screenshot = None
+        self._last_screenshot_gray = None
+        self._last_capture_ts = 0.0
+        
+        # Let OpenCV's transparent API run UMat work on the GPU when OpenCL is present
+        if cv2.ocl.haveOpenCL():
+            cv2.ocl.setUseOpenCL(True)
         
     def __enter__(self):
         """Context manager entry"""
@@ -59,36 +102,74 @@ class VisualDebugger:
         Returns:
             Path to saved screenshot file
         """
+        # Generate filename if not provided (nanoseconds, so back-to-back captures don't collide)
+        if not filename:
+            filename = f"screenshot_{time.time_ns()}.png"
+        
+        screenshot_path = self.debug_dir / filename
+        if self._capture(screenshot_path) is None:
+            return None
+        return str(screenshot_path)
+    
+    def get_screenshot(self, max_age: Optional[float] = None, save_as: Optional[str] = None,
+                       grayscale: bool = False):
+        """
+        Get the current screen as a decoded image, reusing a recent capture.
+        
+        Back-to-back analysis passes look at the same scene, so they share one
+        capture instead of each taking, saving and re-reading a screenshot.
+        
+        Args:
+            max_age: Reuse the last capture if it is at most this many seconds old
+                (defaults to screenshot_max_age; 0 forces a fresh capture)
+            save_as: Filename for saving a fresh capture to the debug directory
+            grayscale: Return the single-channel version (converted once per capture)
+            
+        Returns:
+            BGR (or grayscale) image array, or None if capture failed
+        """
+        if max_age is None:
+            max_age = self.screenshot_max_age
+        
+        if self._last_screenshot is None or time.monotonic() - self._last_capture_ts > max_age:
+            if self._capture(self.debug_dir / save_as if save_as else None) is None:
+                return None
+        
+        return self._last_screenshot_gray if grayscale else self._last_screenshot
+    
+    def _capture(self, save_path: Optional[Path] = None):
+        """Capture and decode the screen, optionally saving the PNG"""
         try:
             print("📸 Capturing screenshot...")
             
-            # Take screenshot using daemon
-            result = self.bot._send_command({"action": "screenshot"})
-            
-            if not result.success:
-                print(f"❌ Screenshot failed: {result.error_message}")
+            # Take screenshot using daemon; the PNG arrives as raw bytes in our buffer
+            png_size = self.bot.screenshot_png_into(self._png_buffer)
+            if not png_size:
+                print("❌ No screenshot data received")
                 return None
             
-            # Generate filename if not provided
-            if not filename:
-                timestamp = int(time.time())
-                filename = f"screenshot_{timestamp}.png"
+            png = memoryview(self._png_buffer)[:png_size]
+            screenshot = cv2.imdecode(np.frombuffer(png, np.uint8), cv2.IMREAD_COLOR)
+            if screenshot is None:
+                print("❌ Could not decode screenshot")
+                return None
             
             # Save screenshot
-            screenshot_path = self.debug_dir / filename
+            if save_path is not None:
+                # Write straight from the receive buffer, without a buffered file object
+                fd = os.open(str(save_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    written = 0
+                    while written < png_size:
+                        written += os.write(fd, png[written:])
+                finally:
+                    os.close(fd)
+                print(f"✅ Screenshot saved: {save_path}")
             
-            import base64
-            screenshot_data = result.data.get("image")
-            if screenshot_data:
-                image_bytes = base64.b64decode(screenshot_data)
-                with open(screenshot_path, "wb") as f:
-                    f.write(image_bytes)
-                
-                print(f"✅ Screenshot saved: {screenshot_path}")
-                return str(screenshot_path)
-            else:
-                print("❌ No screenshot data received")
-                return None
+            self._last_screenshot = screenshot
+            self._last_screenshot_gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
+            self._last_capture_ts = time.monotonic()
+            return screenshot
                 
         except Exception as e:
             print(f"❌ Screenshot capture failed: {e}")
@@ -113,13 +194,12 @@ class VisualDebugger:
             return
         
         # Capture current screenshot
-        screenshot_path = self.capture_and_save_screenshot("analysis_screenshot.png")
-        if not screenshot_path:
+        # Match in grayscale: one channel instead of three, converted once per capture
+        screenshot = self.get_screenshot(save_as="analysis_screenshot.png", grayscale=True)
+        if screenshot is None:
             return
         
-        import cv2
-        screenshot = cv2.imread(screenshot_path)
-        template = cv2.imread(template_path)
+        template = cv2.imread(template_path, cv2.IMREAD_GRAYSCALE)
         
         if screenshot is None or template is None:
             print("❌ Could not load screenshot or template")
@@ -129,83 +209,111 @@ class VisualDebugger:
         print(f"📊 Template: {template.shape[1]}x{template.shape[0]}")
         print()
         
-        # Test different confidence levels
+        # The score map doesn't depend on the threshold, so match once and test
+        # every confidence level against the best score
+        try:
+            scores = cv2.matchTemplate(screenshot, template, cv2.TM_CCOEFF_NORMED)
+            _, best_score, _, best_loc = cv2.minMaxLoc(scores)
+        except Exception as e:
+            print(f"⚠️  Error: {e}")
+            return
+        
+        center_x = best_loc[0] + template.shape[1] // 2
+        center_y = best_loc[1] + template.shape[0] // 2
+        
         for confidence in confidence_levels:
             print(f"🎯 Testing confidence level: {confidence}")
             
-            try:
-                result = self.matcher.find_template(
-                    screenshot, template, confidence=confidence
-                )
-                
-                if result:
-                    print(f"   ✅ Match found at ({result.center[0]}, {result.center[1]})")
-                    print(f"   📊 Confidence: {result.confidence:.3f}")
-                    print(f"   📊 Method: {result.method_used}")
-                    if hasattr(result, 'scale_factor'):
-                        print(f"   📊 Scale: {result.scale_factor:.2f}x")
-                else:
-                    print(f"   ❌ No match found")
-                
-            except Exception as e:
-                print(f"   ⚠️  Error: {e}")
+            if best_score >= confidence:
+                print(f"   ✅ Match found at ({center_x}, {center_y})")
+                print(f"   📊 Confidence: {best_score:.3f}")
+            else:
+                print(f"   ❌ No match found (best {best_score:.3f})")
             
             print()
     
-    def test_multi_scale_detection(self, template_path: str) -> None:
+    def test_multi_scale_detection(self, template_path: str, min_size: int = 10,
+                                   max_size: Optional[int] = None) -> None:
         """
         Test multi-scale template detection.
         
         Args:
             template_path: Path to template image
+            min_size: Smallest on-screen element size (longer side, pixels) worth scanning for
+            max_size: Largest on-screen element size worth scanning for (default: screen size)
         """
         print(f"🔬 Multi-Scale Detection Test: {template_path}")
         print("-" * 60)
         
-        screenshot_path = self.capture_and_save_screenshot("multiscale_screenshot.png")
-        if not screenshot_path:
+        gray_screenshot = self.get_screenshot(save_as="multiscale_screenshot.png", grayscale=True)
+        if gray_screenshot is None:
             return
         
-        import cv2
-        screenshot = cv2.imread(screenshot_path)
-        template = cv2.imread(template_path)
+        gray_template = cv2.imread(template_path, cv2.IMREAD_GRAYSCALE)
         
-        if screenshot is None or template is None:
+        if gray_template is None:
             print("❌ Could not load images")
             return
         
-        # Test different scale factors
-        scale_factors = [0.5, 0.75, 1.0, 1.25, 1.5, 2.0]
+        # Build a Gaussian pyramid of the screenshot once and slide the fixed-size
+        # template over every level: level n finds the element at 2^n times the
+        # template's size, at a quarter of the previous level's cost
+        template_height, template_width = gray_template.shape
         
-        for scale in scale_factors:
-            print(f"🔍 Testing scale factor: {scale:.2f}x")
-            
-            # Resize template
-            new_width = int(template.shape[1] * scale)
-            new_height = int(template.shape[0] * scale)
+        if template_height > gray_screenshot.shape[0] or template_width > gray_screenshot.shape[1]:
+            print("❌ Template is larger than the screenshot")
+            return
+        
+        # Levels are UMats so pyrDown/matchTemplate run on OpenCL when available;
+        # their sizes are tracked alongside since UMats have no shape
+        height, width = gray_screenshot.shape
+        if max_size is None:
+            max_size = max(width, height)
+        
+        # Only levels where the element would be between min_size and max_size are
+        # scanned; the pyramid stops growing once elements would exceed max_size
+        template_size = max(template_width, template_height)
+        pyramid = [(cv2.UMat(gray_screenshot), width, height)]
+        while (height >= template_height * 2 and width >= template_width * 2 and
+               template_size * 2 ** len(pyramid) <= max_size):
+            width, height = (width + 1) // 2, (height + 1) // 2
+            pyramid.append((cv2.pyrDown(pyramid[-1][0]), width, height))
+        
+        levels = [(level, entry) for level, entry in enumerate(pyramid)
+                  if min_size <= template_size * 2 ** level <= max_size]
+        if not levels:
+            print(f"❌ No scale puts a {template_width}x{template_height} template between "
+                  f"{min_size} and {max_size} pixels")
+            return
+        
+        template_umat = cv2.UMat(gray_template)
+        
+        best = None
+        for level, (image, width, height) in levels:
+            scale = 2 ** level
+            print(f"🔍 Testing scale factor: {scale:.2f}x ({width}x{height})")
             
-            if new_width < 10 or new_height < 10:
-                print("   ⚠️  Template too small, skipping")
+            try:
+                scores = cv2.matchTemplate(image, template_umat, cv2.TM_CCOEFF_NORMED)
+                _, max_val, _, max_loc = cv2.minMaxLoc(scores)
+            except Exception as e:
+                print(f"   ⚠️  Error: {e}")
                 continue
             
-            if new_width > screenshot.shape[1] or new_height > screenshot.shape[0]:
-                print("   ⚠️  Template too large, skipping")
-                continue
+            # Map the match back to full-resolution screen coordinates
+            x, y = max_loc[0] * scale, max_loc[1] * scale
+            center = (x + template_width * scale // 2, y + template_height * scale // 2)
             
-            scaled_template = cv2.resize(template, (new_width, new_height))
+            if max_val >= 0.7:
+                print(f"   ✅ Match found: confidence {max_val:.3f} at {center}")
+            else:
+                print(f"   ❌ No match (best {max_val:.3f})")
             
-            try:
-                result = self.matcher.find_template(
-                    screenshot, scaled_template, confidence=0.7
-                )
-                
-                if result:
-                    print(f"   ✅ Match found: confidence {result.confidence:.3f}")
-                else:
-                    print(f"   ❌ No match")
-                    
-            except Exception as e:
-                print(f"   ⚠️  Error: {e}")
+            if best is None or max_val > best[0]:
+                best = (max_val, scale, center)
+        
+        if best:
+            print(f"🏆 Best: {best[1]}x scale, confidence {best[0]:.3f} at {best[2]}")
         
         print()
     
@@ -223,17 +331,17 @@ class VisualDebugger:
         """
         print(f"✂️  Creating template '{name}' from region ({x}, {y}, {width}, {height})")
         
-        # Capture full screenshot
-        screenshot_path = self.capture_and_save_screenshot("full_capture.png")
-        if not screenshot_path:
+        # Capture full screenshot (fresh: the user has just positioned the element)
+        screenshot = self.get_screenshot(max_age=0)
+        if screenshot is None:
             return None
         
         try:
-            import cv2
-            screenshot = cv2.imread(screenshot_path)
-            
-            # Extract region
+            # Extract region straight from the in-memory capture
             region = screenshot[y:y+height, x:x+width]
+            if region.size == 0:
+                print("❌ Region lies outside the captured screen")
+                return None
             
             # Save as template
             template_dir = Path("templates")
@@ -245,9 +353,6 @@ class VisualDebugger:
             print(f"✅ Template created: {template_path}")
             print(f"📊 Size: {width}x{height}")
             
-            # Clean up full screenshot
-            os.remove(screenshot_path)
-            
             return str(template_path)
             
         except Exception as e:
@@ -274,8 +379,9 @@ class VisualDebugger:
         # Wait for user to click top-left
         print("   Waiting for click...")
         # Capture actual mouse coordinates using system events
-        
-        import Quartz
+        if Quartz is None:
+            print("❌ Reading the mouse position requires pyobjc (Quartz) on macOS")
+            return
         
         # Get current mouse position for top-left
         mouse_pos_1 = Quartz.CGEventGetLocation(Quartz.CGEventCreate(None))
@@ -327,13 +433,11 @@ class VisualDebugger:
             print(f"❌ Template file not found: {template_path}")
             return
         
-        screenshot_path = self.capture_and_save_screenshot("debug_screenshot.png")
-        if not screenshot_path:
+        screenshot = self.get_screenshot(save_as="debug_screenshot.png", grayscale=True)
+        if screenshot is None:
             return
         
-        import cv2
-        screenshot = cv2.imread(screenshot_path)
-        template = cv2.imread(template_path)
+        template = cv2.imread(template_path, cv2.IMREAD_GRAYSCALE)
         
         # Check image properties
         print("📊 Image Analysis:")
@@ -347,47 +451,42 @@ class VisualDebugger:
             print("   Solution: Use multi-scale detection or smaller template")
             print()
         
-        # Test different matching methods
-        methods = [
-            (cv2.TM_CCOEFF_NORMED, "TM_CCOEFF_NORMED"),
-            (cv2.TM_CCORR_NORMED, "TM_CCORR_NORMED"),
-            (cv2.TM_SQDIFF_NORMED, "TM_SQDIFF_NORMED")
-        ]
-        
         print("🔬 Testing Different Matching Methods:")
-        for method, method_name in methods:
-            try:
-                result = cv2.matchTemplate(screenshot, template, method)
-                min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-                
-                if method == cv2.TM_SQDIFF_NORMED:
-                    best_match = min_val
-                    print(f"   {method_name}: {best_match:.3f} (lower is better)")
-                else:
-                    best_match = max_val
-                    print(f"   {method_name}: {best_match:.3f} (higher is better)")
-                    
-            except Exception as e:
-                print(f"   {method_name}: Error - {e}")
+        try:
+            scores = self._match_method_scores(screenshot, template)
+            print(f"   TM_CCOEFF_NORMED: {scores['TM_CCOEFF_NORMED']:.3f} (higher is better)")
+            print(f"   TM_CCORR_NORMED: {scores['TM_CCORR_NORMED']:.3f} (higher is better)")
+            print(f"   TM_SQDIFF_NORMED: {scores['TM_SQDIFF_NORMED']:.3f} (lower is better)")
+        except Exception as e:
+            print(f"   Error - {e}")
         
         print()
         
         # Check color space
         print("🎨 Color Analysis:")
-        screenshot_gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
-        template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
-        
-        screenshot_mean = screenshot_gray.mean()
-        template_mean = template_gray.mean()
+        # An area-averaged 1/8 downsample has (near enough) the same mean brightness
+        # as the full screenshot at 1/64 of the pixels
+        small_screenshot = cv2.resize(
+            screenshot, (max(1, screenshot.shape[1] // 8), max(1, screenshot.shape[0] // 8)),
+            interpolation=cv2.INTER_AREA
+        )
+        screenshot_mean = cv2.mean(small_screenshot)[0]
+        template_mean = cv2.mean(template)[0]
+        tone_divergence = brightness_divergence(small_screenshot, template)
         
         print(f"   Screenshot brightness: {screenshot_mean:.1f}")
         print(f"   Template brightness: {template_mean:.1f}")
         print(f"   Brightness difference: {abs(screenshot_mean - template_mean):.1f}")
+        print(f"   Tone distribution divergence: {tone_divergence:.2f} (0 = same, 1 = disjoint)")
         
         if abs(screenshot_mean - template_mean) > 50:
             print("   ⚠️  Large brightness difference detected!")
             print("   Solution: Try adjusting template or use edge detection")
         
+        if tone_divergence > 0.5:
+            print("   ⚠️  Template tones barely occur on screen (theme or contrast change?)")
+            print("   Solution: Recapture the template in the current appearance")
+        
         print()
         
         # Suggestions
@@ -399,6 +498,60 @@ class VisualDebugger:
         print("   5. Try capturing a larger region around the element")
         print("   6. Use edge detection for shape-based matching")
     
+    def _match_method_scores(self, screenshot, template) -> dict:
+        """
+        Best scores of the three normalized matchTemplate methods from one pass.
+        
+        All three share the raw cross-correlation; the per-window image sums they
+        normalize by come from integral images, so only one correlation is run.
+        
+        Args:
+            screenshot: Screenshot (grayscale or BGR)
+            template: Template image with the same channel count
+            
+        Returns:
+            Best TM_CCOEFF_NORMED, TM_CCORR_NORMED (max) and TM_SQDIFF_NORMED (min)
+        """
+        height, width = template.shape[:2]
+        area = float(height * width)
+        
+        ccorr = cv2.matchTemplate(cv2.UMat(screenshot), cv2.UMat(template), cv2.TM_CCORR).get().astype(np.float64)
+        
+        # Per-channel window sums and summed squares of the screenshot
+        sums, square_sums = cv2.integral2(screenshot, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+        sums = sums.reshape(sums.shape[0], sums.shape[1], -1)
+        square_sums = square_sums.reshape(square_sums.shape[0], square_sums.shape[1], -1)
+        
+        def window(table):
+            return (table[height:, width:] - table[:-height, width:]
+                    - table[height:, :-width] + table[:-height, :-width])
+        
+        image_sums = window(sums)
+        image_energy = window(square_sums).sum(axis=2)
+        
+        pixels = template.reshape(-1, sums.shape[2]).astype(np.float64)
+        template_sums = pixels.sum(axis=0)
+        template_energy = float((pixels * pixels).sum())
+        
+        norm = np.sqrt(image_energy * template_energy)
+        ccorr_normed = np.divide(ccorr, norm, out=np.zeros_like(ccorr), where=norm > 0)
+        sqdiff_normed = np.divide(image_energy + template_energy - 2 * ccorr, norm,
+                                  out=np.ones_like(ccorr), where=norm > 0)
+        
+        # Mean-subtracted correlation and energies
+        centered = ccorr - image_sums @ template_sums / area
+        image_variance = np.maximum(image_energy - (image_sums * image_sums).sum(axis=2) / area, 0)
+        template_variance = max(template_energy - float(template_sums @ template_sums) / area, 0.0)
+        variance_norm = np.sqrt(image_variance * template_variance)
+        ccoeff_normed = np.divide(centered, variance_norm, out=np.zeros_like(ccorr),
+                                  where=variance_norm > 1e-6 * max(template_energy, 1.0))
+        
+        return {
+            "TM_CCOEFF_NORMED": min(float(ccoeff_normed.max()), 1.0),
+            "TM_CCORR_NORMED": min(float(ccorr_normed.max()), 1.0),
+            "TM_SQDIFF_NORMED": float(max(sqdiff_normed.min(), 0.0)),
+        }
+    
     def validate_template_library(self, templates_dir: str = "templates") -> None:
         """
         Validate all templates in the template library.
@@ -414,10 +567,14 @@ class VisualDebugger:
             print(f"❌ Template directory not found: {templates_dir}")
             return
         
-        # Find all image files
-        template_files = []
-        for ext in ["*.png", "*.jpg", "*.jpeg"]:
-            template_files.extend(templates_path.glob(ext))
+        # Find all image files in one directory pass
+        image_extensions = {".png", ".jpg", ".jpeg"}
+        with os.scandir(templates_path) as entries:
+            template_files = sorted(
+                (entry for entry in entries
+                 if entry.is_file() and os.path.splitext(entry.name)[1].lower() in image_extensions),
+                key=lambda entry: entry.name
+            )
         
         if not template_files:
             print(f"📁 No template files found in {templates_dir}")
@@ -427,59 +584,126 @@ class VisualDebugger:
         print()
         
         # Test each template
-        screenshot_path = self.capture_and_save_screenshot("validation_screenshot.png")
-        if not screenshot_path:
+        screenshot = self.get_screenshot(save_as="validation_screenshot.png", grayscale=True)
+        if screenshot is None:
             return
         
-        import cv2
-        screenshot = cv2.imread(screenshot_path)
+        # One grayscale pyramid of the screenshot serves every template
+        screenshot_pyramid = [screenshot.astype(np.float32)]
+        for _ in range(2):
+            screenshot_pyramid.append(cv2.pyrDown(screenshot_pyramid[-1]))
         
-        results = []
+        status_counts = Counter()
         
-        for template_file in template_files:
-            print(f"🧪 Testing: {template_file.name}")
-            
+        def score_template(template_file):
+            """Best match score for one template (None if it can't be loaded), or the error raised"""
             try:
-                template = cv2.imread(str(template_file))
+                template = self.cache.get_prepared(template_file.path)
                 if template is None:
-                    print(f"   ❌ Could not load template")
-                    results.append({"name": template_file.name, "status": "load_error"})
+                    return None, None
+                return self._coarse_to_fine_match(screenshot_pyramid, template), None
+            except Exception as e:
+                return None, e
+        
+        # Per-template lines are buffered and written out every 16 templates
+        report = io.StringIO()
+        
+        # File reads, decoding and matchTemplate all release the GIL, so templates
+        # are loaded and scored on several threads; results come back in directory order
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            scored = executor.map(score_template, template_files)
+            for index, (template_file, (score, error)) in enumerate(zip(template_files, scored)):
+                if index and index % 16 == 0:
+                    sys.stdout.write(report.getvalue())
+                    sys.stdout.flush()
+                    report.seek(0)
+                    report.truncate()
+                
+                print(f"🧪 Testing: {template_file.name}", file=report)
+                
+                if error is not None:
+                    print(f"   ⚠️  Error: {error}", file=report)
+                    status_counts["error"] += 1
+                    continue
+                
+                if score is None:
+                    print(f"   ❌ Could not load template", file=report)
+                    status_counts["load_error"] += 1
                     continue
                 
-                # Test at multiple confidence levels
+                # Report the strictest confidence level the best match clears
                 found_at_confidence = None
                 for confidence in [0.8, 0.7, 0.6, 0.5]:
-                    result = self.matcher.find_template(
-                        screenshot, template, confidence=confidence
-                    )
-                    if result:
+                    if score >= confidence:
                         found_at_confidence = confidence
                         break
                 
                 if found_at_confidence:
-                    print(f"   ✅ Found at confidence {found_at_confidence}")
-                    results.append({
-                        "name": template_file.name, 
-                        "status": "found",
-                        "confidence": found_at_confidence
-                    })
+                    print(f"   ✅ Found at confidence {found_at_confidence}", file=report)
+                    status_counts["found"] += 1
                 else:
-                    print(f"   ❌ Not found")
-                    results.append({"name": template_file.name, "status": "not_found"})
-                    
-            except Exception as e:
-                print(f"   ⚠️  Error: {e}")
-                results.append({"name": template_file.name, "status": "error"})
+                    print(f"   ❌ Not found", file=report)
+                    status_counts["not_found"] += 1
         
         # Summary
-        print(f"\n📊 Validation Summary:")
-        status_counts = {}
-        for result in results:
-            status = result["status"]
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
+        print(f"\n📊 Validation Summary:", file=report)
         for status, count in status_counts.items():
-            print(f"   {status}: {count} templates")
+            print(f"   {status}: {count} templates", file=report)
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+    
+    def _coarse_to_fine_match(self, screenshot_pyramid: List, template, min_size: int = 8,
+                              coarse_threshold: float = 0.45, margin: int = 4) -> float:
+        """
+        Best TM_CCOEFF_NORMED score for template, searched coarse-to-fine.
+        
+        The template is matched against the coarsest pyramid level it still fits;
+        unpromising templates stop there, others are refined level by level in a
+        small window around the coarse hit.
+        
+        Args:
+            screenshot_pyramid: Grayscale screenshot followed by its pyrDown levels
+            template: Grayscale float32 template (see VisionCache.get_prepared)
+            min_size: Smallest template side worth matching at a coarse level
+            coarse_threshold: Coarse score below which the template is rejected
+            margin: Search margin in pixels around the candidate at each finer level
+            
+        Returns:
+            Best full-resolution match score (0.0 if rejected early)
+        """
+        template_pyramid = [template]
+        while (len(template_pyramid) < len(screenshot_pyramid) and
+               min(template_pyramid[-1].shape) >= min_size * 2):
+            template_pyramid.append(cv2.pyrDown(template_pyramid[-1]))
+        
+        if template_pyramid[0].shape[0] > screenshot_pyramid[0].shape[0] or \
+                template_pyramid[0].shape[1] > screenshot_pyramid[0].shape[1]:
+            return 0.0
+        
+        level = len(template_pyramid) - 1
+        _, score, _, (x, y) = cv2.minMaxLoc(
+            cv2.matchTemplate(screenshot_pyramid[level], template_pyramid[level], cv2.TM_CCOEFF_NORMED))
+        if level > 0 and score < coarse_threshold:
+            return 0.0
+        
+        # Refine around the candidate at each finer level
+        while level > 0:
+            level -= 1
+            image = screenshot_pyramid[level]
+            height, width = template_pyramid[level].shape
+            left = max(0, 2 * x - margin)
+            top = max(0, 2 * y - margin)
+            right = min(image.shape[1], 2 * x + width + margin)
+            bottom = min(image.shape[0], 2 * y + height + margin)
+            window = image[top:bottom, left:right]
+            if window.shape[0] < height or window.shape[1] < width:
+                return 0.0
+            
+            _, score, _, (dx, dy) = cv2.minMaxLoc(
+                cv2.matchTemplate(window, template_pyramid[level], cv2.TM_CCOEFF_NORMED))
+            x, y = left + dx, top + dy
+        
+        return score
 
 def demo_screenshot_capture():
     """Demonstrate screenshot capture and analysis"""
@@ -18,12 +18,132 @@ with realistic human behavior patterns.
 import sys
 import os
 import time
-from typing import Dict, List, Optional
+import functools
+import logging
+from collections import namedtuple
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
 # Add SDK to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src', 'python_sdk'))
 
-from browsergeist import HumanMouse, MotionProfiles, target
+# The SDK itself (sockets, vision, CAPTCHA solvers) is imported when a
+# WebFormAutomator is entered, so importing this module stays cheap
+
+# Per-field and per-click detail goes to this logger at INFO, so it costs nothing
+# unless enabled; main() turns it on for the demos
+logger = logging.getLogger("browsergeist.forms")
+
+# Typing profile by field name (password fields and long text are handled separately)
+_PROFILE_MAP = {
+    "first_name": "fast",  # Familiar information
+    "last_name": "fast",
+    "email": "careful",  # Important accuracy-critical fields
+    "phone": "careful",
+    "credit_card": "careful",
+    "credit_card_number": "careful",
+    "cvv": "careful",
+    "password": "careful",  # Typos here lock people out
+    "confirm_password": "careful",
+    "new_password": "careful",
+}
+
+# Fields the site validates as you leave them, so the user waits a moment
+_VALIDATED_FIELDS = frozenset({"email", "phone", "credit_card_number"})
+
+# One form field: kind is "text", "password" or "card" (payment details)
+FieldSpec = namedtuple("FieldSpec", "name pos required profile kind", defaults=(False, None, "text"))
+
+class ContactFormData(NamedTuple):
+    """Contact form values; fields left as None are skipped (or rejected if required)"""
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    company: Optional[str] = None
+    subject: Optional[str] = None
+    message: Optional[str] = None
+
+# In real usage, you'd have actual screenshot images
+# For demo, we'll use coordinate-based targeting
+CONTACT_SCHEMA: Tuple[FieldSpec, ...] = (
+    FieldSpec("first_name", (400, 200), required=True),
+    FieldSpec("last_name", (600, 200), required=True),
+    FieldSpec("email", (400, 250), required=True),
+    FieldSpec("phone", (400, 300)),
+    FieldSpec("company", (400, 350)),
+    FieldSpec("subject", (400, 400), required=True),
+    FieldSpec("message", (400, 500), required=True),
+)
+
+REGISTRATION_PERSONAL_SCHEMA: Tuple[FieldSpec, ...] = (
+    FieldSpec("first_name", (350, 200)),
+    FieldSpec("last_name", (550, 200)),
+    FieldSpec("email", (450, 250)),
+    FieldSpec("phone", (450, 300)),
+    FieldSpec("date_of_birth", (450, 350)),
+)
+
+REGISTRATION_ACCOUNT_SCHEMA: Tuple[FieldSpec, ...] = (
+    FieldSpec("username", (450, 200)),
+    FieldSpec("password", (450, 250), kind="password"),
+    FieldSpec("confirm_password", (450, 300), kind="password"),
+)
+
+SHIPPING_SCHEMA: Tuple[FieldSpec, ...] = (
+    FieldSpec("shipping_first_name", (350, 200)),
+    FieldSpec("shipping_last_name", (550, 200)),
+    FieldSpec("shipping_address", (450, 250)),
+    FieldSpec("shipping_city", (350, 300)),
+    FieldSpec("shipping_state", (450, 300)),
+    FieldSpec("shipping_zip", (550, 300)),
+    FieldSpec("shipping_country", (450, 350)),
+)
+
+BILLING_SCHEMA: Tuple[FieldSpec, ...] = (
+    FieldSpec("billing_first_name", (350, 450)),
+    FieldSpec("billing_last_name", (550, 450)),
+    FieldSpec("billing_address", (450, 500)),
+    FieldSpec("billing_city", (350, 550)),
+    FieldSpec("billing_state", (450, 550)),
+    FieldSpec("billing_zip", (550, 550)),
+)
+
+CREDIT_CARD_SCHEMA: Tuple[FieldSpec, ...] = (
+    FieldSpec("credit_card_number", (450, 350), kind="card"),
+    FieldSpec("expiry_month", (400, 400), kind="card"),
+    FieldSpec("expiry_year", (500, 400), kind="card"),
+    FieldSpec("cvv", (450, 450), kind="card"),
+    FieldSpec("cardholder_name", (450, 500), kind="card"),
+)
+
+# Opt-in checkboxes on the registration preferences step
+PreferenceOption = namedtuple("PreferenceOption", "name pos description")
+
+PREFERENCE_OPTIONS: Tuple[PreferenceOption, ...] = (
+    PreferenceOption("newsletter", (300, 200), "Email newsletter"),
+    PreferenceOption("sms_updates", (300, 230), "SMS updates"),
+    PreferenceOption("promotional_offers", (300, 260), "Promotional offers"),
+)
+
+def _precise_sleep(seconds: float):
+    """Sleep until a monotonic deadline, waking at most about 1 ms late
+    
+    time.sleep can oversleep by several milliseconds on macOS; sleep short
+    of the deadline, then finish in 1 ms steps. Long "human review" pauses
+    keep plain time.sleep, where that jitter doesn't matter.
+    """
+    deadline = time.monotonic() + seconds
+    remaining = seconds
+    while remaining > 0:
+        time.sleep(min(remaining, 0.001) if remaining < 0.01 else remaining - 0.005)
+        remaining = deadline - time.monotonic()
+
+@functools.lru_cache(maxsize=256)
+def _field_jitter(field_name: str) -> tuple:
+    """Per-field click offset: fixed for a field within a run, varied across fields"""
+    h = hash(field_name)
+    return (h % 11 - 5,         # ±5 pixel variation
+            (h >> 8) % 7 - 3)   # ±3 pixel variation
 
 class WebFormAutomator:
     """
@@ -37,6 +157,11 @@ class WebFormAutomator:
         
     def __enter__(self):
         """Context manager entry"""
+        from browsergeist import HumanMouse, MotionProfiles
+        
+        # Motion profile for every move between fields and buttons
+        self._natural_profile = MotionProfiles.NATURAL
+        
         self.bot = HumanMouse(
             openai_api_key=self.openai_api_key,
             auto_solve_captcha=True
@@ -48,12 +173,12 @@ class WebFormAutomator:
         if self.bot:
             self.bot.close()
     
-    def fill_contact_form(self, form_data: Dict[str, str]) -> bool:
+    def fill_contact_form(self, form_data: ContactFormData) -> bool:
         """
         Fill a typical contact form with realistic human behavior.
         
         Args:
-            form_data: Dictionary containing form field values
+            form_data: Contact form field values
             
         Returns:
             bool: True if form was filled successfully
@@ -64,52 +189,10 @@ class WebFormAutomator:
             # Step 1: Navigate to and focus on the form
             print("1. Locating contact form...")
             
-            # In real usage, you'd have actual screenshot images
-            # For demo, we'll use coordinate-based targeting
-            form_fields = [
-                {"name": "first_name", "pos": (400, 200), "required": True},
-                {"name": "last_name", "pos": (600, 200), "required": True},
-                {"name": "email", "pos": (400, 250), "required": True},
-                {"name": "phone", "pos": (400, 300), "required": False},
-                {"name": "company", "pos": (400, 350), "required": False},
-                {"name": "subject", "pos": (400, 400), "required": True},
-                {"name": "message", "pos": (400, 500), "required": True}
-            ]
-            
-            # Step 2: Fill each field with appropriate behavior
-            for i, field in enumerate(form_fields):
-                field_name = field["name"]
-                position = field["pos"]
-                is_required = field["required"]
-                
-                if field_name not in form_data:
-                    if is_required:
-                        print(f"❌ Required field '{field_name}' missing from form data")
-                        return False
-                    continue
-                
-                value = form_data[field_name]
-                print(f"2.{i+1} Filling {field_name}: '{value[:30]}{'...' if len(value) > 30 else ''}'")
-                
-                # Human behavior: Read field label first
-                self._simulate_reading_delay(field_name)
-                
-                # Move to field with natural movement
-                success = self._click_field(position, field_name)
-                if not success:
-                    print(f"⚠️  Could not locate field: {field_name}")
-                    continue
-                
-                # Type with appropriate profile
-                typing_profile = self._get_typing_profile(field_name, value)
-                self.bot.type_text(value, delay_profile=typing_profile)
-                
-                # Brief pause after filling each field
-                time.sleep(0.3 + (len(value) * 0.005))
-                
-                # Occasionally validate what was typed (human behavior)
-                if is_required and len(value) > 10:
-                    self._simulate_validation_check()
+            # Step 2: Fill each field with appropriate behavior, all in one daemon batch
+            print("2. Filling contact details...")
+            if not self._execute_schema(CONTACT_SCHEMA, form_data):
+                return False
             
             # Step 3: Handle any CAPTCHAs
             print("3. Checking for CAPTCHA...")
@@ -151,40 +234,14 @@ class WebFormAutomator:
         try:
             # Step 1: Personal Information
             print("Step 1/3: Personal Information")
-            personal_fields = [
-                ("first_name", (350, 200)),
-                ("last_name", (550, 200)),
-                ("email", (450, 250)),
-                ("phone", (450, 300)),
-                ("date_of_birth", (450, 350))
-            ]
-            
-            for field_name, position in personal_fields:
-                if field_name in user_data:
-                    self._fill_field_with_validation(
-                        field_name, position, user_data[field_name]
-                    )
+            self._execute_schema(REGISTRATION_PERSONAL_SCHEMA, user_data)
             
             # Next button
             self._click_button((500, 450), "Next: Account Details")
             
             # Step 2: Account Information
             print("Step 2/3: Account Information")
-            account_fields = [
-                ("username", (450, 200)),
-                ("password", (450, 250)),
-                ("confirm_password", (450, 300))
-            ]
-            
-            for field_name, position in account_fields:
-                if field_name in user_data:
-                    # Special handling for passwords
-                    if "password" in field_name:
-                        self._fill_password_field(position, user_data[field_name])
-                    else:
-                        self._fill_field_with_validation(
-                            field_name, position, user_data[field_name]
-                        )
+            self._execute_schema(REGISTRATION_ACCOUNT_SCHEMA, user_data)
             
             # Handle terms and conditions checkbox
             print("2.4 Accepting terms and conditions...")
@@ -198,16 +255,10 @@ class WebFormAutomator:
             
             # Newsletter subscription checkboxes
             preferences = user_data.get("preferences", {})
-            checkbox_options = [
-                ("newsletter", (300, 200), "Email newsletter"),
-                ("sms_updates", (300, 230), "SMS updates"),
-                ("promotional_offers", (300, 260), "Promotional offers")
-            ]
-            
-            for pref_name, position, description in checkbox_options:
-                selected = preferences.get(pref_name, False)
-                print(f"3.{checkbox_options.index((pref_name, position, description))+1} {description}: {'✓' if selected else '✗'}")
-                self._handle_checkbox(position, selected)
+            for i, option in enumerate(PREFERENCE_OPTIONS):
+                selected = preferences.get(option.name, False)
+                print(f"3.{i+1} {option.description}: {'✓' if selected else '✗'}")
+                self._handle_checkbox(option.pos, selected)
             
             # Handle CAPTCHA before final submission
             print("4. Final CAPTCHA check...")
@@ -241,21 +292,7 @@ class WebFormAutomator:
         try:
             # Step 1: Shipping Information
             print("Step 1/4: Shipping Information")
-            shipping_fields = [
-                ("shipping_first_name", (350, 200)),
-                ("shipping_last_name", (550, 200)),
-                ("shipping_address", (450, 250)),
-                ("shipping_city", (350, 300)),
-                ("shipping_state", (450, 300)),
-                ("shipping_zip", (550, 300)),
-                ("shipping_country", (450, 350))
-            ]
-            
-            for field_name, position in shipping_fields:
-                if field_name in order_data:
-                    self._fill_field_with_validation(
-                        field_name, position, order_data[field_name]
-                    )
+            self._execute_schema(SHIPPING_SCHEMA, order_data)
             
             # Step 2: Billing Information
             print("Step 2/4: Billing Information")
@@ -267,20 +304,7 @@ class WebFormAutomator:
                 self._handle_checkbox((300, 400), True)
             else:
                 # Fill separate billing fields
-                billing_fields = [
-                    ("billing_first_name", (350, 450)),
-                    ("billing_last_name", (550, 450)),
-                    ("billing_address", (450, 500)),
-                    ("billing_city", (350, 550)),
-                    ("billing_state", (450, 550)),
-                    ("billing_zip", (550, 550))
-                ]
-                
-                for field_name, position in billing_fields:
-                    if field_name in order_data:
-                        self._fill_field_with_validation(
-                            field_name, position, order_data[field_name]
-                        )
+                self._execute_schema(BILLING_SCHEMA, order_data)
             
             # Step 3: Payment Information
             print("Step 3/4: Payment Information")
@@ -290,7 +314,8 @@ class WebFormAutomator:
             print(f"3.1 Selecting payment method: {payment_method}")
             
             if payment_method == "credit_card":
-                self._fill_credit_card_info(order_data)
+                print("3.2 Entering credit card information...")
+                self._execute_schema(CREDIT_CARD_SCHEMA, order_data)
             elif payment_method == "paypal":
                 self._click_button((400, 300), "Pay with PayPal")
             
@@ -321,116 +346,107 @@ class WebFormAutomator:
     
     # Helper methods for realistic form interaction
     
-    def _simulate_reading_delay(self, field_name: str):
-        """Simulate time to read and understand field label"""
+    def _reading_delay(self, field_name: str) -> float:
+        """Time to read and understand field label"""
         # Longer delays for complex field names
-        reading_time = 0.2 + (len(field_name) * 0.02)
-        time.sleep(reading_time)
+        return 0.2 + (len(field_name) * 0.02)
     
     def _get_typing_profile(self, field_name: str, value: str) -> str:
         """Choose appropriate typing profile based on field type"""
-        if "password" in field_name.lower():
-            return "careful"
-        elif field_name in ["first_name", "last_name"]:
-            return "fast"  # Familiar information
-        elif field_name in ["email", "phone", "credit_card"]:
-            return "careful"  # Important accuracy-critical fields
-        elif len(value) > 50:
-            return "natural"  # Long text
-        else:
-            return "average"
+        profile = _PROFILE_MAP.get(field_name)
+        if profile:
+            return profile
+        return "natural" if len(value) > 50 else "average"  # Long text
     
-    def _click_field(self, position: tuple, field_name: str) -> bool:
-        """Click on a form field with error handling"""
-        try:
-            # Add slight randomness to position
-            x, y = position
-            actual_x = x + (hash(field_name) % 11 - 5)  # ±5 pixel variation
-            actual_y = y + (hash(field_name) % 7 - 3)   # ±3 pixel variation
-            
-            self.bot.move_to((actual_x, actual_y), profile=MotionProfiles.NATURAL)
-            self.bot.click()
-            time.sleep(0.2)  # Wait for field to focus
-            return True
-        except Exception as e:
-            print(f"⚠️  Could not click field {field_name}: {e}")
-            return False
+    def _field_position(self, position: tuple, field_name: str) -> tuple:
+        """Field position with slight per-field randomness"""
+        dx, dy = _field_jitter(field_name)
+        return (position[0] + dx, position[1] + dy)
     
-    def _fill_field_with_validation(self, field_name: str, position: tuple, value: str):
-        """Fill a field and simulate validation check"""
-        print(f"   📝 {field_name}: {value}")
-        
-        success = self._click_field(position, field_name)
-        if not success:
-            return
-        
-        # Clear any existing content first
-        # In real implementation: bot.key_press("Command+A") then "Delete"
-        
-        typing_profile = self._get_typing_profile(field_name, value)
-        self.bot.type_text(value, delay_profile=typing_profile)
+    def _execute_schema(self, schema: Tuple[FieldSpec, ...], data: Union[Dict[str, str], NamedTuple]) -> bool:
+        """
+        Fill the schema's fields from data in one daemon batch.
         
-        # Simulate validation for important fields
-        if field_name in ["email", "phone", "credit_card_number"]:
-            time.sleep(0.5)  # Wait for validation
-            print(f"   ✅ {field_name} validated")
-    
-    def _fill_password_field(self, position: tuple, password: str):
-        """Fill password field with extra security considerations"""
-        print("   🔐 Entering password...")
+        Args:
+            schema: Fields to fill, in order
+            data: Field values, as a dict or a record such as ContactFormData
+            
+        Returns:
+            bool: False if a required field is missing from data
+        """
+        from browsergeist import FieldOp
         
-        self._click_field(position, "password")
+        if isinstance(data, dict):
+            get_value = data.get
+        else:
+            def get_value(name):
+                return getattr(data, name, None)
         
-        # Type password very carefully
-        self.bot.type_text(password, delay_profile="careful")
-        time.sleep(0.8)  # Pause to verify password
+        field_ops = []
+        for spec in schema:
+            value = get_value(spec.name)
+            if value is None:
+                if spec.required:
+                    print(f"❌ Required field '{spec.name}' missing from form data")
+                    return False
+                continue
+            
+            # Human behavior: Read field label first. The daemon can only pause
+            # after an action, so reading time rides on the previous field
+            reading_delay = self._reading_delay(spec.name)
+            if field_ops:
+                field_ops[-1].post_delay += reading_delay
+            else:
+                _precise_sleep(reading_delay)
+            
+            if spec.kind == "password":
+                # Type password very carefully, then pause to verify it
+                logger.info("   🔐 Entering password...")
+                profile, post_delay = "careful", 0.8
+            elif spec.kind == "card":
+                # Extra care for financial information
+                logger.info("     💳 %s", spec.name.replace('_', ' ').capitalize())
+                profile, post_delay = "careful", 0.3
+            else:
+                logger.info("   📝 %s: '%s%s'", spec.name, value[:30], '...' if len(value) > 30 else '')
+                profile = spec.profile or self._get_typing_profile(spec.name, value)
+                
+                # Brief pause after filling each field
+                post_delay = 0.3 + (len(value) * 0.005)
+                
+                # Wait for validation on important fields; otherwise occasionally
+                # re-read what was typed (human behavior)
+                if spec.name in _VALIDATED_FIELDS:
+                    post_delay += 0.5
+                elif spec.required and len(value) > 10:
+                    post_delay += self._validation_delay()
+            
+            field_ops.append(FieldOp(self._field_position(spec.pos, spec.name), value, profile, post_delay))
         
-        print("   ✅ Password entered securely")
+        if field_ops:
+            self.bot.fill_fields_batch(field_ops)
+        return True
     
     def _handle_checkbox(self, position: tuple, should_check: bool):
         """Handle checkbox interaction"""
-        self.bot.move_to(position, profile=MotionProfiles.NATURAL)
-        
         if should_check:
-            self.bot.click()
-            time.sleep(0.2)
+            self.bot.tap(position, self._natural_profile, delay_after=0.2)
+        else:
+            self.bot.move_to(position, profile=self._natural_profile)
     
     def _click_button(self, position: tuple, button_text: str, important: bool = False):
         """Click a button with appropriate hesitation"""
-        print(f"   🔘 Clicking: {button_text}")
+        logger.info("   🔘 Clicking: %s", button_text)
         
-        if important:
-            # Extra hesitation for important actions
-            time.sleep(0.8)
+        # Extra hesitation over the button for important actions
+        hesitation = 0.8 if important else 0.0
         
-        self.bot.move_to(position, profile=MotionProfiles.NATURAL)
-        self.bot.click(duration=0.08)  # Slightly longer click for buttons
-        time.sleep(0.5)
+        # Pauses are scheduled by the daemon; slightly longer click for buttons
+        self.bot.tap(position, self._natural_profile, duration=0.08, hover=hesitation, delay_after=0.5)
     
-    def _fill_credit_card_info(self, order_data: Dict[str, str]):
-        """Fill credit card information securely"""
-        print("3.2 Entering credit card information...")
-        
-        cc_fields = [
-            ("credit_card_number", (450, 350), "Card number"),
-            ("expiry_month", (400, 400), "Expiry month"),
-            ("expiry_year", (500, 400), "Expiry year"),
-            ("cvv", (450, 450), "CVV"),
-            ("cardholder_name", (450, 500), "Cardholder name")
-        ]
-        
-        for field_name, position, description in cc_fields:
-            if field_name in order_data:
-                print(f"     💳 {description}")
-                
-                # Extra care for financial information
-                self._click_field(position, field_name)
-                self.bot.type_text(order_data[field_name], delay_profile="careful")
-                time.sleep(0.3)
-    
-    def _simulate_validation_check(self):
-        """Simulate user checking what they typed"""
-        time.sleep(0.4)  # Brief validation pause
+    def _validation_delay(self) -> float:
+        """Time for the user to check what they typed"""
+        return 0.4  # Brief validation pause
     
     def _submit_form(self) -> bool:
         """Submit form with error handling"""
@@ -438,12 +454,10 @@ class WebFormAutomator:
             # Look for submit button
             submit_position = (450, 550)  # Default submit button position
             
-            print("   🚀 Clicking submit...")
-            self.bot.move_to(submit_position, profile=MotionProfiles.NATURAL)
-            self.bot.click(duration=0.1)  # Deliberate click
+            logger.info("   🚀 Clicking submit...")
             
-            # Wait for submission to process
-            time.sleep(2.0)
+            # Deliberate click, then let the submission process
+            self.bot.tap(submit_position, self._natural_profile, duration=0.1, delay_after=2.0)
             
             # Check for any error messages or validation failures
             # In real implementation, you'd check for error indicators
@@ -453,33 +467,32 @@ class WebFormAutomator:
             print(f"   ❌ Submit failed: {e}")
             return False
 
-def demo_contact_form():
+def demo_contact_form(automator: WebFormAutomator):
     """Demonstrate contact form automation"""
     print("📧 Contact Form Automation Demo")
     print("-" * 50)
     
     # Sample contact form data
-    contact_data = {
-        "first_name": "Alice",
-        "last_name": "Johnson",
-        "email": "alice.johnson@example.com",
-        "phone": "(555) 123-4567",
-        "company": "Tech Solutions Inc.",
-        "subject": "Partnership Inquiry",
-        "message": "Hello, I'm interested in discussing a potential partnership opportunity. We specialize in cloud infrastructure solutions and believe there may be synergies with your platform. Please let me know when would be a good time to schedule a call to explore this further."
-    }
+    contact_data = ContactFormData(
+        first_name="Alice",
+        last_name="Johnson",
+        email="alice.johnson@example.com",
+        phone="(555) 123-4567",
+        company="Tech Solutions Inc.",
+        subject="Partnership Inquiry",
+        message="Hello, I'm interested in discussing a potential partnership opportunity. We specialize in cloud infrastructure solutions and believe there may be synergies with your platform. Please let me know when would be a good time to schedule a call to explore this further."
+    )
     
     try:
-        with WebFormAutomator() as automator:
-            success = automator.fill_contact_form(contact_data)
-            if success:
-                print("✅ Contact form demo completed successfully!")
-            else:
-                print("❌ Contact form demo failed")
+        success = automator.fill_contact_form(contact_data)
+        if success:
+            print("✅ Contact form demo completed successfully!")
+        else:
+            print("❌ Contact form demo failed")
     except Exception as e:
         print(f"❌ Demo failed: {e}")
 
-def demo_registration_form():
+def demo_registration_form(automator: WebFormAutomator):
     """Demonstrate user registration automation"""
     print("\n👤 Registration Form Automation Demo")
     print("-" * 50)
@@ -502,16 +515,15 @@ def demo_registration_form():
     }
     
     try:
-        with WebFormAutomator() as automator:
-            success = automator.fill_registration_form(registration_data)
-            if success:
-                print("✅ Registration form demo completed successfully!")
-            else:
-                print("❌ Registration form demo failed")
+        success = automator.fill_registration_form(registration_data)
+        if success:
+            print("✅ Registration form demo completed successfully!")
+        else:
+            print("❌ Registration form demo failed")
     except Exception as e:
         print(f"❌ Demo failed: {e}")
 
-def demo_ecommerce_checkout():
+def demo_ecommerce_checkout(automator: WebFormAutomator):
     """Demonstrate e-commerce checkout automation"""
     print("\n🛒 E-commerce Checkout Automation Demo")
     print("-" * 50)
@@ -535,17 +547,19 @@ def demo_ecommerce_checkout():
     }
     
     try:
-        with WebFormAutomator() as automator:
-            success = automator.fill_ecommerce_checkout(order_data)
-            if success:
-                print("✅ Checkout demo completed successfully!")
-            else:
-                print("❌ Checkout demo failed")
+        success = automator.fill_ecommerce_checkout(order_data)
+        if success:
+            print("✅ Checkout demo completed successfully!")
+        else:
+            print("❌ Checkout demo failed")
     except Exception as e:
         print(f"❌ Demo failed: {e}")
 
 def main():
     """Run comprehensive web form automation examples"""
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logger.setLevel(logging.INFO)
+    
     print("📝 BrowserGeist - Web Form Automation Examples")
     print("=" * 70)
     print()
@@ -564,9 +578,12 @@ def main():
         print("💡 Set OPENAI_API_KEY environment variable for automatic CAPTCHA solving")
     
     try:
-        demo_contact_form()
-        demo_registration_form()
-        demo_ecommerce_checkout()
+        # The demos share one cursor and keyboard, so they run one after
+        # another over a single daemon connection
+        with WebFormAutomator() as automator:
+            demo_contact_form(automator)
+            demo_registration_form(automator)
+            demo_ecommerce_checkout(automator)
         
         print("\n🎉 All web form automation demos completed!")
         print("\n📋 Key Features Demonstrated:")
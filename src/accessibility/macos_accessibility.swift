@@ -268,37 +268,50 @@ class AccessibilityTargeting {
      * Find input field by label text
      */
     static func findInputFieldByLabel(_ labelText: String, bundleId: String? = nil) -> CGPoint? {
+        return findInputFieldByLabels([labelText], bundleId: bundleId)?.point
+    }
+    
+    /**
+     * Find the input field for the first matching label among several variants.
+     * The application's input fields are collected once and reused for every label.
+     */
+    static func findInputFieldByLabels(_ labelTexts: [String], bundleId: String? = nil) -> (point: CGPoint, label: String)? {
         let app = bundleId != nil ? 
             AccessibilityElementFinder.getApplicationByBundleId(bundleId!) :
             AccessibilityElementFinder.getFrontmostApplication()
         
         guard let application = app else { return nil }
         
-        // First try to find input fields with matching names
         let inputFields = AccessibilityElementFinder.findInputFields(in: application)
-        
-        for field in inputFields {
-            if let title = AccessibilityElementFinder.getElementTitle(field),
-               title.localizedCaseInsensitiveContains(labelText) {
-                return AccessibilityElementFinder.getElementCenter(field)
+        let fieldTitles = inputFields.map { AccessibilityElementFinder.getElementTitle($0) }
+        
+        for labelText in labelTexts {
+            // First try to find input fields with matching names
+            for (field, fieldTitle) in zip(inputFields, fieldTitles) {
+                if let title = fieldTitle,
+                   title.localizedCaseInsensitiveContains(labelText),
+                   let center = AccessibilityElementFinder.getElementCenter(field) {
+                    return (center, labelText)
+                }
             }
-        }
-        
-        // Fallback: find labels and look for nearby input fields
-        let labels = AccessibilityElementFinder.findElementsByName(labelText, in: application)
-        
-        for label in labels {
-            if let labelPos = AccessibilityElementFinder.getElementPosition(label),
-               let _ = AccessibilityElementFinder.getElementSize(label) {
-                
-                // Look for input fields near this label
-                for field in inputFields {
-                    if let fieldPos = AccessibilityElementFinder.getElementPosition(field) {
-                        let distance = sqrt(pow(fieldPos.x - labelPos.x, 2) + pow(fieldPos.y - labelPos.y, 2))
-                        
-                        // If field is reasonably close to label (within 200 pixels)
-                        if distance < 200 {
-                            return AccessibilityElementFinder.getElementCenter(field)
+            
+            // Fallback: find labels and look for nearby input fields
+            let labels = AccessibilityElementFinder.findElementsByName(labelText, in: application)
+            
+            for label in labels {
+                if let labelPos = AccessibilityElementFinder.getElementPosition(label),
+                   let _ = AccessibilityElementFinder.getElementSize(label) {
+                    
+                    // Look for input fields near this label
+                    for field in inputFields {
+                        if let fieldPos = AccessibilityElementFinder.getElementPosition(field) {
+                            let distance = sqrt(pow(fieldPos.x - labelPos.x, 2) + pow(fieldPos.y - labelPos.y, 2))
+                            
+                            // If field is reasonably close to label (within 200 pixels)
+                            if distance < 200,
+                               let center = AccessibilityElementFinder.getElementCenter(field) {
+                                return (center, labelText)
+                            }
                         }
                     }
                 }
@@ -337,4 +350,31 @@ class AccessibilityTargeting {
         
         return nil
     }
+    
+    /**
+     * Classify the form control for a label: "select" for dropdowns,
+     * "input" for text fields, "unknown" if neither is found
+     */
+    static func fieldKind(forLabel labelText: String, bundleId: String? = nil) -> String {
+        let app = bundleId != nil ? 
+            AccessibilityElementFinder.getApplicationByBundleId(bundleId!) :
+            AccessibilityElementFinder.getFrontmostApplication()
+        
+        guard let application = app else { return "unknown" }
+        
+        // HTML <select> elements are exposed as pop-up buttons
+        let popUps = AccessibilityElementFinder.findElementsByRole("AXPopUpButton", in: application)
+        for popUp in popUps {
+            if let title = AccessibilityElementFinder.getElementTitle(popUp),
+               title.localizedCaseInsensitiveContains(labelText) {
+                return "select"
+            }
+        }
+        
+        if findInputFieldByLabels([labelText], bundleId: bundleId) != nil {
+            return "input"
+        }
+        
+        return "unknown"
+    }
 }
@@ -11,11 +11,19 @@ import json
 import subprocess
 import socket
 import time
-import psutil
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import importlib.util
-import tempfile
+
+# Required pip packages and the modules they install
+_REQUIRED_DEPS = {
+    "opencv-python": "cv2",
+    "numpy": "numpy",
+    "pillow": "PIL",
+    "pytesseract": "pytesseract",
+    "requests": "requests",
+    "flask": "flask",
+}
 
 class CLICommands:
     """Command implementations for BrowserGeist CLI."""
@@ -155,15 +163,21 @@ class CLICommands:
             if self._is_daemon_running():
                 print("✅ Daemon is running")
                 
-                # Get process info
+                # Get process info; psutil is only needed here
+                import psutil
                 try:
-                    for proc in psutil.process_iter(['pid', 'name', 'create_time']):
-                        if 'browsergeist-daemon' in proc.info['name']:
-                            create_time = time.strftime('%Y-%m-%d %H:%M:%S', 
-                                                      time.localtime(proc.info['create_time']))
-                            print(f"   PID: {proc.info['pid']}")
-                            print(f"   Started: {create_time}")
-                            break
+                    pid = self._daemon_pid()
+                    if pid is not None:
+                        info = psutil.Process(pid).as_dict(['pid', 'create_time'])
+                    else:
+                        # No peer PID from the socket; find the daemon by name
+                        info = next((proc.info for proc in psutil.process_iter(['pid', 'name', 'create_time'])
+                                     if 'browsergeist-daemon' in (proc.info['name'] or '')), None)
+                    if info:
+                        create_time = time.strftime('%Y-%m-%d %H:%M:%S', 
+                                                  time.localtime(info['create_time']))
+                        print(f"   PID: {info['pid']}")
+                        print(f"   Started: {create_time}")
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     pass
                 
@@ -482,14 +496,9 @@ class CLICommands:
     
     def _check_python_deps(self) -> Dict[str, Any]:
         """Check if required Python dependencies are installed."""
-        required_deps = ["opencv-python", "numpy", "pillow", "pytesseract", "requests", "flask"]
-        missing_deps = []
-        
-        for dep in required_deps:
-            try:
-                __import__(dep.replace("-", "_"))
-            except ImportError:
-                missing_deps.append(dep)
+        # find_spec checks that each module is installed without importing it
+        missing_deps = [dep for dep, module in _REQUIRED_DEPS.items()
+                        if importlib.util.find_spec(module) is None]
         
         if missing_deps:
             return {
@@ -15,18 +15,14 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 import subprocess
 import socket
+import struct
 import time
 
 # Add the parent directory to the path so we can import browsergeist
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-try:
-    from python_sdk.browsergeist import HumanMouse, MotionProfiles
-    from python_sdk.async_browsergeist import AsyncHumanMouse
-except ImportError as e:
-    print(f"❌ Failed to import BrowserGeist modules: {e}")
-    print("   Make sure the project is built and dependencies are installed.")
-    sys.exit(1)
+# The SDK (and OpenCV/NumPy with it) is imported by the commands that drive
+# the daemon, so config, version and doctor start without loading it
 from cli.commands import CLICommands
 
 class BrowserGeistCLI(CLICommands):
@@ -144,6 +140,22 @@ class BrowserGeistCLI(CLICommands):
         except (socket.error, FileNotFoundError):
             return False
     
+    def _daemon_pid(self) -> Optional[int]:
+        """PID of the process serving the daemon socket, if the platform reports it."""
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(1.0)
+                sock.connect(self.daemon_socket)
+                if sys.platform == "darwin":
+                    # SOL_LOCAL, LOCAL_PEERPID from <sys/un.h>
+                    return sock.getsockopt(0, 0x002)
+                if hasattr(socket, "SO_PEERCRED"):
+                    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+                    return struct.unpack("3i", creds)[0]
+        except (OSError, struct.error):
+            pass
+        return None
+    
     def _start_daemon(self) -> bool:
         """Start the BrowserGeist daemon."""
         daemon_path = Path(__file__).parent.parent.parent / "bin" / "browsergeist-daemon"
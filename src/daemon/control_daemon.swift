@@ -1,6 +1,7 @@
 import Foundation
 import CoreGraphics
 import AppKit
+import QuartzCore
 
 /**
  * Control Daemon
@@ -46,12 +47,29 @@ class ControlDaemon {
     private func handleConnection(_ clientSocket: Int32) {
         let connection = SocketConnection(socket: clientSocket)
 
+        // Earliest time the next action on this connection may start,
+        // set by a previous command's "delay_after_ms"
+        var nextActionDeadline: CFTimeInterval = 0
+
         while true {
             guard let messageData = connection.readMessage() else {
                 break
             }
 
-            let response = processMessage(messageData)
+            var response: [String: Any]
+            // Raw binary frame sent right after the JSON reply (screenshot_raw)
+            var payload: Data? = nil
+            if let command = decodeCommand(messageData) {
+                waitUntil(nextActionDeadline)
+                if command["action"] as? String == "screenshot_raw" {
+                    (response, payload) = handleScreenshotRaw()
+                } else {
+                    response = processCommand(command)
+                }
+                nextActionDeadline = actionDeadline(after: command)
+            } else {
+                response = ["success": false, "error": "Invalid command"]
+            }
 
             guard let responseData = try? JSONSerialization.data(withJSONObject: response) else {
                 break
@@ -60,20 +78,51 @@ class ControlDaemon {
             if !connection.sendMessage(responseData) {
                 break
             }
+
+            if let payload = payload, !connection.sendMessage(payload) {
+                break
+            }
         }
     }
 
-    private func processMessage(_ data: Data) -> [String: Any] {
+    private func decodeCommand(_ data: Data) -> [String: Any]? {
         guard let jsonString = String(data: data, encoding: .utf8),
               let jsonData = jsonString.data(using: .utf8),
               let command = try? JSONSerialization.jsonObject(with: jsonData) as? [String: Any],
-              let action = command["action"] as? String else {
+              command["action"] is String else {
+            return nil
+        }
+        return command
+    }
+
+    private func actionDeadline(after command: [String: Any]) -> CFTimeInterval {
+        guard let delayMs = command["delay_after_ms"] as? Double, delayMs > 0 else {
+            return 0
+        }
+        return CACurrentMediaTime() + delayMs / 1000.0
+    }
+
+    private func waitUntil(_ deadline: CFTimeInterval) {
+        // Sleep for the bulk of the wait, then spin the last couple of
+        // milliseconds so scheduler wake-up jitter doesn't skew short gaps
+        let spinWindow: CFTimeInterval = 0.002
+        let remaining = deadline - CACurrentMediaTime()
+        if remaining > spinWindow {
+            Thread.sleep(forTimeInterval: remaining - spinWindow)
+        }
+        while CACurrentMediaTime() < deadline {}
+    }
+
+    private func processCommand(_ command: [String: Any]) -> [String: Any] {
+        guard let action = command["action"] as? String else {
             return ["success": false, "error": "Invalid command"]
         }
 
         switch action {
         case "move_to":
             return handleMoveTo(command)
+        case "move_path":
+            return handleMovePath(command)
         case "click":
             return handleClick(command)
         case "type":
@@ -90,6 +139,12 @@ class ControlDaemon {
             return handleFindInputField(command)
         case "find_button":
             return handleFindButton(command)
+        case "get_field_kind":
+            return handleGetFieldKind(command)
+        case "launch_app":
+            return handleLaunchApp(command)
+        case "batch":
+            return handleBatch(command)
         default:
             return ["success": false, "error": "Unknown action: \(action)"]
         }
@@ -117,6 +172,33 @@ class ControlDaemon {
         return ["success": true]
     }
 
+    private func handleMovePath(_ command: [String: Any]) -> [String: Any] {
+        guard let rawPoints = command["points"] as? [[Double]], !rawPoints.isEmpty else {
+            return ["success": false, "error": "Missing points array"]
+        }
+
+        var waypoints: [CGPoint] = []
+        for rawPoint in rawPoints {
+            guard rawPoint.count == 2 else {
+                return ["success": false, "error": "Each point must be an [x, y] pair"]
+            }
+            waypoints.append(CGPoint(x: rawPoint[0], y: rawPoint[1]))
+        }
+
+        let currentMouseLocation = NSEvent.mouseLocation
+        let current = CGPoint(x: currentMouseLocation.x, y: currentMouseLocation.y)
+
+        var profile = HumanMotion.MotionProfile.natural
+        if let profileData = command["profile"] as? [String: Any] {
+            profile = parseMotionProfile(profileData)
+        }
+
+        let motion = HumanMotion(mouse: mouse, profile: profile)
+        motion.movePath(through: waypoints, from: current)
+
+        return ["success": true, "points": waypoints.count]
+    }
+
     private func handleClick(_ command: [String: Any]) -> [String: Any] {
         let buttonString = command["button"] as? String ?? "left"
         let duration = command["duration"] as? TimeInterval ?? 0.05
@@ -187,6 +269,19 @@ class ControlDaemon {
         }
     }
     
+    private func handleScreenshotRaw() -> ([String: Any], Data?) {
+        // Same capture as "screenshot", but the PNG travels as its own
+        // length-prefixed frame instead of base64 inside the JSON reply
+        do {
+            let image = try ScreenCapture.captureFullScreenSync()
+            let imageData = try ScreenCapture.imageToData(image, format: "png")
+
+            return (["success": true, "length": imageData.count, "format": "png"], imageData)
+        } catch {
+            return (["success": false, "error": "Failed to capture screenshot: \(error.localizedDescription)"], nil)
+        }
+    }
+    
     private func handleKeyCombination(_ command: [String: Any]) -> [String: Any] {
         guard let keys = command["keys"] as? [String] else {
             return ["success": false, "error": "Missing keys array"]
@@ -284,17 +379,20 @@ class ControlDaemon {
             return ["success": false, "error": "Missing label parameter"]
         }
         
+        // Optional label variants, tried in order against a single walk of the input fields
+        let labelTexts = command["labels"] as? [String] ?? [labelText]
         let bundleId = command["bundle_id"] as? String
         
-        if let coordinates = AccessibilityTargeting.findInputFieldByLabel(labelText, bundleId: bundleId) {
+        if let match = AccessibilityTargeting.findInputFieldByLabels(labelTexts, bundleId: bundleId) {
             return [
                 "success": true,
-                "x": coordinates.x,
-                "y": coordinates.y,
+                "x": match.point.x,
+                "y": match.point.y,
+                "label": match.label,
                 "method": "accessibility"
             ]
         } else {
-            return ["success": false, "error": "Input field not found: \(labelText)"]
+            return ["success": false, "error": "Input field not found: \(labelTexts.joined(separator: ", "))"]
         }
     }
     
@@ -317,6 +415,98 @@ class ControlDaemon {
         }
     }
 
+    private func handleGetFieldKind(_ command: [String: Any]) -> [String: Any] {
+        guard let labelText = command["label"] as? String else {
+            return ["success": false, "error": "Missing label parameter"]
+        }
+        
+        let bundleId = command["bundle_id"] as? String
+        
+        return [
+            "success": true,
+            "kind": AccessibilityTargeting.fieldKind(forLabel: labelText, bundleId: bundleId),
+            "method": "accessibility"
+        ]
+    }
+
+    private func handleBatch(_ command: [String: Any]) -> [String: Any] {
+        guard let commands = command["commands"] as? [[String: Any]] else {
+            return ["success": false, "error": "Missing commands array"]
+        }
+        
+        // Run the steps back to back on this thread, honouring each step's
+        // delay_after_ms, and stop at the first failure
+        var results: [[String: Any]] = []
+        var nextStepDeadline: CFTimeInterval = 0
+        
+        for step in commands {
+            guard let action = step["action"] as? String, action != "batch" else {
+                return ["success": false, "error": "Invalid batch step", "completed": results.count, "results": results]
+            }
+            
+            waitUntil(nextStepDeadline)
+            let result = processCommand(step)
+            results.append(result)
+            
+            if result["success"] as? Bool != true {
+                return [
+                    "success": false,
+                    "error": "Batch step \(results.count - 1) (\(action)) failed: \(result["error"] as? String ?? "unknown error")",
+                    "completed": results.count - 1,
+                    "results": results
+                ]
+            }
+            
+            nextStepDeadline = actionDeadline(after: step)
+        }
+        
+        waitUntil(nextStepDeadline)
+        return ["success": true, "completed": results.count, "results": results]
+    }
+    
+    private func handleLaunchApp(_ command: [String: Any]) -> [String: Any] {
+        guard let app = command["app"] as? String else {
+            return ["success": false, "error": "Missing app parameter"]
+        }
+        
+        let timeout = (command["timeout_ms"] as? Double ?? 5000.0) / 1000.0
+        let workspace = NSWorkspace.shared
+        
+        // Accept either a bundle identifier ("com.apple.Safari") or an application name ("Safari")
+        guard let appURL = workspace.urlForApplication(withBundleIdentifier: app)
+                ?? workspace.fullPath(forApplication: app).map({ URL(fileURLWithPath: $0) }) else {
+            return ["success": false, "error": "Application not found: \(app)"]
+        }
+        
+        let configuration = NSWorkspace.OpenConfiguration()
+        configuration.activates = true
+        
+        let launched = DispatchSemaphore(value: 0)
+        var runningApp: NSRunningApplication?
+        var launchError: Error?
+        workspace.openApplication(at: appURL, configuration: configuration) { application, error in
+            runningApp = application
+            launchError = error
+            launched.signal()
+        }
+        
+        let deadline = CACurrentMediaTime() + timeout
+        guard launched.wait(timeout: .now() + timeout) == .success, let application = runningApp else {
+            return ["success": false, "error": "Failed to launch \(app): \(launchError?.localizedDescription ?? "timed out")"]
+        }
+        
+        // Return once the app has finished launching rather than after a fixed delay
+        while !application.isFinishedLaunching && CACurrentMediaTime() < deadline {
+            Thread.sleep(forTimeInterval: 0.02)
+        }
+        
+        return [
+            "success": true,
+            "pid": Int(application.processIdentifier),
+            "finished_launching": application.isFinishedLaunching
+        ]
+    }
+
     private func parseMotionProfile(_ data: [String: Any]) -> HumanMotion.MotionProfile {
         return HumanMotion.MotionProfile(
             maxVelocity: data["max_velocity"] as? Double ?? 800.0,
@@ -89,7 +89,37 @@ class HumanMotion {
         let path = generateAdvancedPath(from: current, to: target, targetWidth: targetWidth)
         executePath(path)
     }
-    
+
+    func movePath(through waypoints: [CGPoint], from current: CGPoint, targetWidth: Double = 20.0) {
+        guard !waypoints.isEmpty else { return }
+
+        // A single hand-eye delay for the whole itinerary
+        let handEyeDelay = TimeInterval.random(in: profile.handEyeDelay)
+        Thread.sleep(forTimeInterval: handEyeDelay)
+
+        // Chain per-segment Bézier paths into one trajectory with continuous timestamps
+        var path: [Point] = []
+        var segmentStart = current
+        var timeOffset: TimeInterval = 0
+
+        for waypoint in waypoints {
+            let segment = generateAdvancedPath(from: segmentStart, to: waypoint, targetWidth: targetWidth)
+            let dropCount = path.isEmpty ? 0 : 1 // Segment start duplicates previous end
+
+            var segmentEnd = timeOffset
+            for point in segment.dropFirst(dropCount) {
+                let timestamp = timeOffset + point.timestamp
+                path.append(Point(x: point.x, y: point.y, timestamp: timestamp))
+                segmentEnd = max(segmentEnd, timestamp)
+            }
+
+            timeOffset = segmentEnd
+            segmentStart = waypoint
+        }
+
+        executePath(path)
+    }
+
     private func generateAdvancedPath(from start: CGPoint, to end: CGPoint, targetWidth: Double) -> [Point] {
         let distance = sqrt(pow(end.x - start.x, 2) + pow(end.y - start.y, 2))
         let duration = calculateFittsLawDuration(distance: distance, targetWidth: targetWidth)
@@ -9,6 +9,7 @@ from .browsergeist import (
     AsyncHumanMouse,
     MotionProfiles, 
     MotionProfile,
+    FieldOp,
     target,
     automation_session,
     BrowserGeistError,
@@ -39,6 +40,7 @@ __all__ = [
     'AsyncHumanMouse', 
     'MotionProfiles',
     'MotionProfile',
+    'FieldOp',
     'target',
     'automation_session',
     'BrowserGeistError',
@@ -29,7 +29,7 @@ from template_matcher import TemplateMatcher, MatchResult, VisionCache, MultiMon
 from python_sdk.captcha_solver import CaptchaSolver, CaptchaSolveMethod, CaptchaSolution
 
 # Import sync classes for compatibility
-from python_sdk.browsergeist import MotionProfile, MotionProfiles
+from python_sdk.browsergeist import MotionProfile, MotionProfiles, _frame_command, _recv_exact
 
 
 class BrowserGeistError(Exception):
@@ -157,6 +157,7 @@ class AsyncHumanMouse:
         
         # Vision components
         self.matcher = TemplateMatcher()
+        self.vision = self.matcher  # Name used by the targeting helpers and examples
         self.multi_monitor = MultiMonitorMatcher()
         self.vision_cache = VisionCache()
         
@@ -218,18 +219,17 @@ class AsyncHumanMouse:
             
             try:
                 # Send command
-                message = json.dumps(command).encode('utf-8')
-                conn.send(len(message).to_bytes(4, 'big') + message)
+                conn.sendall(_frame_command(command))
                 
                 # Read response with timeout
                 length_bytes = await asyncio.wait_for(
-                    asyncio.get_event_loop().run_in_executor(None, conn.recv, 4),
+                    asyncio.get_event_loop().run_in_executor(None, _recv_exact, conn, 4),
                     timeout=self.command_timeout
                 )
                 
                 length = int.from_bytes(length_bytes, 'big')
                 response_bytes = await asyncio.wait_for(
-                    asyncio.get_event_loop().run_in_executor(None, conn.recv, length),
+                    asyncio.get_event_loop().run_in_executor(None, _recv_exact, conn, length),
                     timeout=self.command_timeout
                 )
                 
@@ -352,6 +352,108 @@ class AsyncHumanMouse:
         
         return result
     
+    async def screenshot_png(self) -> bytes:
+        """Capture the screen through the daemon and return the encoded PNG
+        
+        The event loop keeps running while the daemon captures the screen.
+        """
+        screenshot_result = await self._send_command({"action": "screenshot"})
+        if not screenshot_result.success or "data" not in screenshot_result.data:
+            raise VisionError("Failed to capture screenshot", "SCREENSHOT_FAILED")
+        
+        return base64.b64decode(screenshot_result.data["data"])
+    
+    async def _take_screenshot(self) -> np.ndarray:
+        """Capture the screen through the daemon and decode it"""
+        image_data = await self.screenshot_png()
+        image = cv2.imdecode(np.frombuffer(image_data, np.uint8), cv2.IMREAD_COLOR)
+        if image is None:
+            raise VisionError("Failed to decode screenshot", "SCREENSHOT_FAILED")
+        return image
+    
+    async def wait_until_text(self, 
+                              text: str, 
+                              timeout: float = 3.0, 
+                              poll: float = 0.15,
+                              confidence: float = 0.8) -> Optional[MatchResult]:
+        """Wait for text to appear on screen, polling instead of sleeping a fixed time
+        
+        Args:
+            text: Text to wait for
+            timeout: Maximum time to wait in seconds
+            poll: Interval between checks (at least 100ms)
+            confidence: OCR confidence threshold
+        
+        Returns:
+            The text match, or None if it didn't appear before the timeout
+        """
+        poll = max(poll, 0.1)
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            try:
+                screenshot = await self._take_screenshot()
+                match = await asyncio.get_event_loop().run_in_executor(
+                    None, self.matcher.find_text, screenshot, text, confidence
+                )
+                if match:
+                    return match
+            except BrowserGeistError:
+                pass
+            
+            if time.monotonic() + poll > deadline:
+                return None
+            await asyncio.sleep(poll)
+    
+    async def wait_until_idle(self, 
+                              timeout: float = 3.0, 
+                              poll: float = 0.15,
+                              stability_duration: float = 0.3,
+                              similarity_threshold: float = 0.95) -> bool:
+        """Wait for the screen to stop changing, e.g. after a click navigates
+        
+        Consecutive screenshots are diffed; once they stay within
+        similarity_threshold for stability_duration the page is considered
+        settled. A page that has already loaded returns after a single
+        stability window rather than a fixed sleep.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            poll: Interval between screenshots (at least 100ms)
+            stability_duration: How long the screen must stay unchanged
+            similarity_threshold: Fraction of unchanged pixels that counts as stable
+        
+        Returns:
+            True if the screen settled before the timeout
+        """
+        poll = max(poll, 0.1)
+        deadline = time.monotonic() + timeout
+        previous = None
+        stable_since = None
+        
+        while True:
+            try:
+                current = cv2.cvtColor(await self._take_screenshot(), cv2.COLOR_BGR2GRAY)
+                now = time.monotonic()
+                
+                if previous is not None and previous.shape == current.shape:
+                    changed = np.count_nonzero(cv2.absdiff(previous, current)) / current.size
+                    if 1.0 - changed >= similarity_threshold:
+                        if now - stable_since >= stability_duration:
+                            return True
+                    else:
+                        stable_since = now
+                else:
+                    stable_since = now
+                
+                previous = current
+            except BrowserGeistError:
+                pass
+            
+            if time.monotonic() + poll > deadline:
+                return False
+            await asyncio.sleep(poll)
+    
     async def _find_target_image(self, image_path: str) -> Optional[Tuple[int, int]]:
         """Find target image on screen using enhanced vision system"""
         try:
@@ -361,13 +463,7 @@ class AsyncHumanMouse:
                 raise VisionError(f"Could not load template: {image_path}", "TEMPLATE_LOAD_FAILED")
             
             # Get screenshot
-            screenshot_result = await self._send_command({"action": "screenshot"})
-            if not screenshot_result.success:
-                raise VisionError("Failed to capture screenshot", "SCREENSHOT_FAILED")
-            
-            # Decode screenshot
-            image_data = base64.b64decode(screenshot_result.data["image"])
-            screenshot = cv2.imdecode(np.frombuffer(image_data, np.uint8), cv2.IMREAD_COLOR)
+            screenshot = await self._take_screenshot()
             
             # Use enhanced matching with fallbacks
             match = self.matcher.find_template_with_fallbacks(screenshot, template, confidence=0.7)
@@ -25,12 +25,12 @@ from template_matcher import TemplateMatcher, MatchResult, VisionCache
 
 # Import CAPTCHA solver and wait system
 try:
-    from .captcha_solver import CaptchaSolver, CaptchaSolveMethod, CaptchaSolution
+    from .captcha_solver import CaptchaSolver, CaptchaSolveMethod, CaptchaSolution, OpenAICaptchaSolver, TwoCaptchaSolver
     from .user_personas import UserPersona, get_persona, list_personas, PERSONAS
     from .wait_conditions import WaitSystem, ExpectationSystem, WaitTimeoutError
 except ImportError:
     # Fallback for when module is imported directly
-    from captcha_solver import CaptchaSolver, CaptchaSolveMethod, CaptchaSolution
+    from captcha_solver import CaptchaSolver, CaptchaSolveMethod, CaptchaSolution, OpenAICaptchaSolver, TwoCaptchaSolver
     from user_personas import UserPersona, get_persona, list_personas, PERSONAS
     from wait_conditions import WaitSystem, ExpectationSystem, WaitTimeoutError
 
@@ -64,6 +64,41 @@ class CaptchaError(BrowserGeistError):
     pass
 
 
+# Reused compact encoder for daemon commands, so large batches carry no
+# padding whitespace and no encoder is built per call
+_command_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _frame_command(command: Dict[str, Any]) -> bytes:
+    """Encode a daemon command as a length-prefixed JSON message"""
+    message = _command_encoder.encode(command).encode('utf-8')
+    return len(message).to_bytes(4, 'big') + message
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytearray:
+    """Read exactly size bytes from conn
+    
+    Large replies such as screenshots arrive in pieces; they are received
+    straight into one preallocated buffer rather than concatenated.
+    """
+    buffer = bytearray(size)
+    _recv_into(conn, buffer, size)
+    return buffer
+
+
+def _recv_into(conn: socket.socket, buffer: bytearray, size: int) -> None:
+    """Fill buffer[:size] from conn, growing buffer first if it is too small"""
+    if len(buffer) < size:
+        buffer.extend(bytes(size - len(buffer)))
+    with memoryview(buffer) as view:
+        received = 0
+        while received < size:
+            count = conn.recv_into(view[received:size])
+            if not count:
+                raise ConnectionError("Daemon closed the connection mid-response", "CONNECTION_LOST")
+            received += count
+
+
 @dataclass
 class CommandResult:
     """Result of a command execution"""
@@ -72,6 +107,15 @@ class CommandResult:
     error_code: Optional[str] = None
     error_message: Optional[str] = None
     execution_time: Optional[float] = None
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        """Response payload; alias of data used by the targeting helpers"""
+        return self.data
+    
+    @details.setter
+    def details(self, value: Dict[str, Any]) -> None:
+        self.data = value
 
 
 @dataclass
@@ -86,6 +130,15 @@ class MotionProfile:
     dwell_time_max: float
 
 
+@dataclass
+class FieldOp:
+    """One form field to fill as part of HumanMouse.fill_fields_batch"""
+    position: Tuple[int, int]
+    text: str
+    profile: str = "average"
+    post_delay: float = 0.0
+
+
 class MotionProfiles:
     NATURAL = MotionProfile("natural", 800.0, 2000.0, 2.0, 0.15, 0.02, 0.08)
     CAREFUL = MotionProfile("careful", 400.0, 1200.0, 1.0, 0.05, 0.05, 0.12)
@@ -117,6 +170,7 @@ class HumanMouse:
         self.command_timeout = command_timeout
         self.socket = None
         self.matcher = TemplateMatcher()
+        self.vision = self.matcher  # Name used by the targeting helpers and examples
         self.vision_cache = VisionCache()
         self.auto_solve_captcha = auto_solve_captcha
         
@@ -159,6 +213,42 @@ class HumanMouse:
         else:
             raise TypeError(f"Persona must be string or UserPersona, got {type(persona)}")
     
+    def reconfigure(self,
+                    openai_api_key: Optional[str] = None,
+                    twocaptcha_api_key: Optional[str] = None,
+                    auto_solve_captcha: Optional[bool] = None,
+                    command_timeout: Optional[float] = None) -> None:
+        """Update session options without reconnecting to the daemon
+        
+        Only the options that are passed change; previously configured
+        CAPTCHA API keys are kept.
+        
+        Args:
+            openai_api_key: OpenAI API key for CAPTCHA solving
+            twocaptcha_api_key: 2Captcha API key for CAPTCHA solving
+            auto_solve_captcha: Enable automatic CAPTCHA detection/solving
+            command_timeout: Timeout for command execution
+        """
+        if auto_solve_captcha is not None:
+            self.auto_solve_captcha = auto_solve_captcha
+        
+        if command_timeout is not None:
+            self.command_timeout = command_timeout
+            if self.socket:
+                self.socket.settimeout(command_timeout)
+        
+        if self.captcha_solver is None:
+            if openai_api_key or twocaptcha_api_key or self.auto_solve_captcha:
+                self.captcha_solver = CaptchaSolver(
+                    openai_api_key=openai_api_key,
+                    twocaptcha_api_key=twocaptcha_api_key
+                )
+        else:
+            if openai_api_key:
+                self.captcha_solver.openai_solver = OpenAICaptchaSolver(openai_api_key)
+            if twocaptcha_api_key:
+                self.captcha_solver.twocaptcha_solver = TwoCaptchaSolver(twocaptcha_api_key)
+    
     def set_persona(self, persona: Union[str, UserPersona]) -> None:
         """Change the current persona"""
         self.persona = self._initialize_persona(persona)
@@ -266,9 +356,14 @@ class HumanMouse:
         except Exception as e:
             raise ConnectionError(f"Failed to connect to daemon: {e}", "CONNECTION_FAILED")
     
-    def _send_command(self, command: Dict[str, Any]) -> CommandResult:
-        """Send command to daemon with enhanced error handling"""
+    def _send_command(self, command: Dict[str, Any], timeout: Optional[float] = None) -> CommandResult:
+        """Send command to daemon with enhanced error handling
+        
+        timeout overrides command_timeout for this one command, e.g. for a
+        batch that is expected to run longer.
+        """
         start_time = time.time()
+        timeout = timeout or self.command_timeout
         
         try:
             # Ensure connection
@@ -276,13 +371,17 @@ class HumanMouse:
                 self._connect()
             
             # Send command
-            message = json.dumps(command).encode('utf-8')
-            self.socket.send(len(message).to_bytes(4, 'big') + message)
+            self.socket.sendall(_frame_command(command))
             
             # Read response
-            length = int.from_bytes(self.socket.recv(4), 'big')
-            response = self.socket.recv(length).decode('utf-8')
-            response_data = json.loads(response)
+            if timeout != self.command_timeout:
+                self.socket.settimeout(timeout)
+            try:
+                length = int.from_bytes(_recv_exact(self.socket, 4), 'big')
+                response_data = json.loads(_recv_exact(self.socket, length))
+            finally:
+                if timeout != self.command_timeout:
+                    self.socket.settimeout(self.command_timeout)
             
             # Update stats
             execution_time = time.time() - start_time
@@ -311,8 +410,12 @@ class HumanMouse:
             
         except socket.timeout:
             self._session_stats["errors_occurred"] += 1
+            # The late reply would be taken for the next command's, so start
+            # the next command on a fresh connection
+            self.socket.close()
+            self.socket = None
             raise CommandError(
-                f"Command timeout after {self.command_timeout}s",
+                f"Command timeout after {timeout}s",
                 "COMMAND_TIMEOUT",
                 {"command": command.get("action", "unknown")}
             )
@@ -328,12 +431,13 @@ class HumanMouse:
     def move_to(self, 
                 target: Union[Tuple[int, int], str], 
                 profile: MotionProfile = MotionProfiles.NATURAL,
-                use_persona: bool = True) -> CommandResult:
-        """Move mouse to target location with human-like motion"""
+                use_persona: bool = True,
+                delay_after: float = 0.0) -> CommandResult:
+        """Move mouse to target location with human-like motion
         
-        # Update persona state if using persona
-        if use_persona and self.persona:
-            self.update_persona_state()
+        If delay_after is set, the daemon holds the next command on this
+        connection until that many seconds after the move completes.
+        """
         
         if isinstance(target, str):
             # Template matching
@@ -343,45 +447,110 @@ class HumanMouse:
         else:
             target_coords = target
         
-        # Adapt profile based on persona if available
+        command = self.move_command(target_coords, profile, use_persona, delay_after)
+        
+        result = self._send_command(command)
+        if not result.success:
+            raise CommandError(
+                f"Move failed: {result.error_message}",
+                result.error_code,
+                {"target": target_coords, "profile": command["profile"]["name"], "persona": command["persona"]}
+            )
+        
+        return result
+    
+    def move_command(self,
+                     target_coords: Tuple[int, int],
+                     profile: MotionProfile = MotionProfiles.NATURAL,
+                     use_persona: bool = True,
+                     delay_after: float = 0.0) -> Dict[str, Any]:
+        """Build the daemon command move_to sends for a screen position, e.g. for use in run_batch"""
+        
+        # Update persona state and adapt the profile if using persona
         if use_persona and self.persona:
+            self.update_persona_state()
             profile = self._adapt_motion_profile_for_persona(profile)
-            
+        
         command = {
             "action": "move_to",
             "x": target_coords[0],
             "y": target_coords[1],
-            "profile": {
-                "name": profile.name,
-                "max_velocity": profile.max_velocity,
-                "acceleration": profile.acceleration,
-                "jitter_amount": profile.jitter_amount,
-                "overshoot_chance": profile.overshoot_chance,
-                "dwell_time_min": profile.dwell_time_min,
-                "dwell_time_max": profile.dwell_time_max
-            },
+            "profile": self._serialize_profile(profile),
+            "persona": self.persona.name if self.persona else None
+        }
+        self._apply_delay_after(command, delay_after)
+        return command
+    
+    def move_path(self,
+                  points: List[Tuple[int, int]],
+                  profile: MotionProfile = MotionProfiles.NATURAL,
+                  use_persona: bool = True) -> CommandResult:
+        """Move mouse through a series of waypoints in a single daemon request
+        
+        The daemon chains the per-segment curves into one continuous trajectory,
+        so the whole itinerary costs one round-trip instead of one per waypoint.
+        
+        Args:
+            points: Waypoints as (x, y) tuples, visited in order
+            profile: Motion profile applied to every segment
+            use_persona: Whether to use persona for motion adaptation
+        
+        Returns:
+            CommandResult with success status and details
+        """
+        if not points:
+            raise ValueError("move_path requires at least one point")
+        
+        if use_persona and self.persona:
+            self.update_persona_state()
+            profile = self._adapt_motion_profile_for_persona(profile)
+        
+        command = {
+            "action": "move_path",
+            "points": [[x, y] for x, y in points],
+            "profile": self._serialize_profile(profile),
             "persona": self.persona.name if self.persona else None
         }
         
         result = self._send_command(command)
         if not result.success:
             raise CommandError(
-                f"Move failed: {result.error_message}",
+                f"Move path failed: {result.error_message}",
                 result.error_code,
-                {"target": target_coords, "profile": profile.name, "persona": self.persona.name if self.persona else None}
+                {"points": len(points), "profile": profile.name, "persona": self.persona.name if self.persona else None}
             )
         
         return result
     
+    @staticmethod
+    def _apply_delay_after(command: Dict[str, Any], delay_after: float) -> None:
+        """Ask the daemon to schedule the next action delay_after seconds later"""
+        if delay_after > 0:
+            command["delay_after_ms"] = round(delay_after * 1000)
+    
+    @staticmethod
+    def _serialize_profile(profile: MotionProfile) -> Dict[str, Any]:
+        """Convert a motion profile to its wire representation"""
+        return {
+            "name": profile.name,
+            "max_velocity": profile.max_velocity,
+            "acceleration": profile.acceleration,
+            "jitter_amount": profile.jitter_amount,
+            "overshoot_chance": profile.overshoot_chance,
+            "dwell_time_min": profile.dwell_time_min,
+            "dwell_time_max": profile.dwell_time_max
+        }
+    
     def click(self, 
               button: str = "left", 
-              duration: float = 0.05) -> CommandResult:
-        """Perform a mouse click with human-like timing"""
-        command = {
-            "action": "click",
-            "button": button,
-            "duration": duration
-        }
+              duration: float = 0.05,
+              delay_after: float = 0.0) -> CommandResult:
+        """Perform a mouse click with human-like timing
+        
+        If delay_after is set, the daemon holds the next command on this
+        connection until that many seconds after the click completes.
+        """
+        command = self.click_command(button, duration, delay_after)
         
         result = self._send_command(command)
         if not result.success:
@@ -393,11 +562,64 @@ class HumanMouse:
         
         return result
     
+    def click_command(self,
+                      button: str = "left",
+                      duration: float = 0.05,
+                      delay_after: float = 0.0) -> Dict[str, Any]:
+        """Build the daemon command click sends, e.g. for use in run_batch"""
+        command = {
+            "action": "click",
+            "button": button,
+            "duration": duration
+        }
+        self._apply_delay_after(command, delay_after)
+        return command
+    
+    def tap(self,
+            position: Tuple[int, int],
+            profile: MotionProfile = MotionProfiles.NATURAL,
+            button: str = "left",
+            duration: float = 0.05,
+            hover: float = 0.0,
+            delay_after: float = 0.0) -> CommandResult:
+        """Move to a position and click it in one daemon round-trip
+        
+        The daemon pauses hover seconds between arriving and clicking, and
+        holds the next command until delay_after seconds after the click.
+        """
+        return self.run_batch([
+            self.move_command(position, profile, delay_after=hover),
+            self.click_command(button, duration, delay_after)
+        ])
+    
     def type_text(self, 
                   text: str, 
                   delay_profile: str = "average",
-                  use_persona: bool = True) -> CommandResult:
-        """Type text with human-like rhythm and timing"""
+                  use_persona: bool = True,
+                  delay_after: float = 0.0) -> CommandResult:
+        """Type text with human-like rhythm and timing
+        
+        If delay_after is set, the daemon holds the next command on this
+        connection until that many seconds after typing completes.
+        """
+        command = self.type_command(text, delay_profile, use_persona, delay_after)
+        
+        result = self._send_command(command)
+        if not result.success:
+            raise CommandError(
+                f"Type failed: {result.error_message}",
+                result.error_code,
+                {"text_length": len(text), "profile": command["profile"], "persona": command["persona"]}
+            )
+        
+        return result
+    
+    def type_command(self, 
+                     text: str, 
+                     delay_profile: str = "average",
+                     use_persona: bool = True,
+                     delay_after: float = 0.0) -> Dict[str, Any]:
+        """Build the daemon command type_text sends, e.g. for use in run_batch"""
         
         # Update persona state if using persona
         if use_persona and self.persona:
@@ -413,17 +635,74 @@ class HumanMouse:
             "persona": self.persona.name if self.persona else None,
             "persona_params": typing_params if use_persona and self.persona else None
         }
+        self._apply_delay_after(command, delay_after)
+        return command
+    
+    def run_batch(self, commands: List[Dict[str, Any]], timeout: Optional[float] = None) -> CommandResult:
+        """Run several daemon commands in one round-trip
         
-        result = self._send_command(command)
-        if not result.success:
-            raise CommandError(
-                f"Type failed: {result.error_message}",
-                result.error_code,
-                {"text_length": len(text), "profile": typing_params["profile"], "persona": self.persona.name if self.persona else None}
-            )
+        The daemon executes the commands in order, applying each one's
+        delay_after_ms before the next, and stops at the first failure.
         
+        Args:
+            commands: Daemon command dicts (e.g. from type_command, or key_combination actions)
+            timeout: Seconds to wait for the whole batch (defaults to command_timeout)
+            
+        Returns:
+            CommandResult whose details hold the per-command "results"
+        """
+        if not commands:
+            raise ValueError("run_batch needs at least one command")
+        
+        result = self._send_command({"action": "batch", "commands": list(commands)}, timeout=timeout)
+        if not result.success:
+            raise CommandError(f"Batch failed: {result.error_message}", result.error_code, {"commands": len(commands)})
         return result
     
+    # Expected daemon time per typed character, following virtual_keyboard's
+    # performTypeText for the slowest profile on average (careful): a 0.2 s
+    # base delay x 1.3 for the character mix, plus micro-pauses, the key
+    # press and the inter-key gaps
+    _EXPECTED_SECONDS_PER_CHAR = 0.4
+    # Allowance for moving to a field
+    _FIELD_MOVE_SECONDS = 1.5
+    # Headroom over the expected duration before a batch is given up on
+    _BATCH_TIMEOUT_MARGIN = 2.0
+    
+    def fill_fields_batch(self,
+                          ops: List[FieldOp],
+                          profile: MotionProfile = MotionProfiles.NATURAL,
+                          focus_delay: float = 0.2) -> CommandResult:
+        """Fill several form fields in a single daemon round-trip
+        
+        Each field is moved to, clicked, and typed into in order; the daemon
+        waits focus_delay after each click and the op's post_delay after
+        typing before moving on. The batch is given a timeout scaled from
+        its expected duration (never less than command_timeout).
+        
+        Args:
+            ops: Fields to fill, in order
+            profile: Motion profile for moving between fields
+            focus_delay: Seconds to let each field take focus before typing
+            
+        Returns:
+            CommandResult whose details hold the per-command "results"
+        """
+        if not ops:
+            raise ValueError("fill_fields_batch needs at least one field")
+        
+        commands = []
+        estimate = 0.0
+        for op in ops:
+            commands.append(self.move_command(op.position, profile))
+            commands.append(self.click_command(delay_after=focus_delay))
+            commands.append(self.type_command(op.text, op.profile, delay_after=op.post_delay))
+            estimate += (self._FIELD_MOVE_SECONDS + focus_delay
+                         + len(op.text) * self._EXPECTED_SECONDS_PER_CHAR + op.post_delay)
+        
+        timeout = max(self.command_timeout, estimate * self._BATCH_TIMEOUT_MARGIN)
+        return self.run_batch(commands, timeout=timeout)
+    
     def type(self, text: str, delay_profile: str = "average"):
         """Type text with human-like delays between keystrokes"""
         command = {
@@ -436,6 +715,22 @@ class HumanMouse:
         if not result.success:
             raise CommandError(f"Type failed: {result.error_message}", result.error_code)
     
+    def launch_app(self, app: str, timeout: float = 5.0) -> CommandResult:
+        """Launch (or activate) an application directly through the daemon
+        
+        Args:
+            app: Application name ("Safari") or bundle identifier ("com.apple.Safari")
+            timeout: Seconds to wait for the application to finish launching
+            
+        Returns:
+            CommandResult with the application's pid once it has finished launching
+        """
+        command = {"action": "launch_app", "app": app, "timeout_ms": int(timeout * 1000)}
+        result = self._send_command(command)
+        if not result.success:
+            raise CommandError(f"Launch failed: {result.error_message}", result.error_code, {"app": app})
+        return result
+    
     def scroll(self, dx: int = 0, dy: int = 0, smooth: bool = True):
         """Scroll with human-like motion"""
         command = {
@@ -762,17 +1057,48 @@ class HumanMouse:
         Returns:
             CommandResult with success status and details
         """
+        return self.type_in_any_field([field_text], content, confidence, delay_profile,
+                                      clear_field, use_persona, use_accessibility)
+    
+    def type_in_any_field(self, field_candidates: List[str], content: str,
+                          confidence: float = 0.8,
+                          delay_profile: str = "average",
+                          clear_field: bool = True,
+                          use_persona: bool = True,
+                          use_accessibility: bool = True) -> CommandResult:
+        """Type content into the field matching the first available label variant
+        
+        All candidates are resolved with one accessibility query and, if that
+        fails, one screenshot and OCR pass, rather than one round-trip each.
+        
+        Args:
+            field_candidates: Label variants to try in order (e.g., ["Email", "Email or phone number"])
+            content: Text content to type
+            confidence: OCR confidence for finding field
+            delay_profile: Typing speed profile
+            clear_field: Whether to clear field before typing
+            use_persona: Whether to use persona for motion adaptation
+            use_accessibility: Whether to try accessibility API first
+            
+        Returns:
+            CommandResult with success status and details about which label was used
+        """
+        if not field_candidates:
+            raise ValueError("field_candidates must contain at least one label")
+        
         input_field = None
         method_used = "unknown"
+        found_label = None
         
         # Try accessibility API first if enabled
         if use_accessibility:
             try:
-                command = {"action": "find_input_field", "label": field_text}
+                command = {"action": "find_input_field", "label": field_candidates[0], "labels": list(field_candidates)}
                 result = self._send_command(command)
                 if result.success and "x" in result.details and "y" in result.details:
                     input_field = (result.details["x"], result.details["y"])
                     method_used = "accessibility"
+                    found_label = result.details.get("label", field_candidates[0])
             except Exception:
                 # Fall back to OCR
                 pass
@@ -781,12 +1107,14 @@ class HumanMouse:
         if not input_field:
             # Find the field label
             screenshot = self._take_screenshot()
-            if not screenshot:
+            if screenshot is None:
                 raise VisionError("Failed to capture screenshot", "SCREENSHOT_FAILED")
             
-            field_result = self.vision.find_text(screenshot, field_text, confidence)
-            if not field_result:
-                raise VisionError(f"Field '{field_text}' not found", "FIELD_NOT_FOUND", {"field": field_text, "confidence": confidence})
+            matches = self.vision.find_text_any(screenshot, field_candidates, confidence)
+            found_label = next((label for label in field_candidates if matches.get(label)), None)
+            if found_label is None:
+                raise VisionError(f"Field '{field_candidates[0]}' not found", "FIELD_NOT_FOUND", {"field": field_candidates[0], "candidates": list(field_candidates), "confidence": confidence})
+            field_result = matches[found_label]
             
             # Look for input field near the label (typically to the right or below)
             input_field = self._find_input_field_near(screenshot, field_result)
@@ -798,7 +1126,7 @@ class HumanMouse:
             method_used = "ocr"
         
         if not input_field:
-            raise VisionError(f"Input field for '{field_text}' not found", "INPUT_FIELD_NOT_FOUND", {"field": field_text})
+            raise VisionError(f"Input field for '{field_candidates[0]}' not found", "INPUT_FIELD_NOT_FOUND", {"field": field_candidates[0]})
         
         # Click on input field
         self.move_to(input_field, use_persona=use_persona)
@@ -812,8 +1140,26 @@ class HumanMouse:
         # Type content
         type_result = self.type_text(content, delay_profile, use_persona)
         type_result.details["targeting_method"] = method_used
+        type_result.details["found_label"] = found_label
         return type_result
     
+    def get_field_kind(self, field_text: str) -> str:
+        """Classify the form control labelled field_text via the Accessibility API
+        
+        Args:
+            field_text: Text label of the field
+            
+        Returns:
+            "select" for dropdowns, "input" for text fields, or "unknown" if the
+            daemon cannot tell (e.g. accessibility unavailable)
+        """
+        try:
+            result = self._send_command({"action": "get_field_kind", "label": field_text})
+        except BrowserGeistError:
+            return "unknown"
+        kind = result.details.get("kind") if result.success else None
+        return kind if kind in ("select", "input") else "unknown"
+    
     def find_and_click_any(self, candidates: List[str], 
                           confidence: float = 0.8,
                           use_persona: bool = True) -> CommandResult:
@@ -828,22 +1174,31 @@ class HumanMouse:
             CommandResult with success status and details about which candidate was found
         """
         screenshot = self._take_screenshot()
-        if not screenshot:
+        if screenshot is None:
             raise VisionError("Failed to capture screenshot", "SCREENSHOT_FAILED")
         
+        # All text candidates share one OCR pass instead of one pass each
+        text_candidates = [c for c in candidates if not c.endswith(('.png', '.jpg', '.jpeg'))]
+        try:
+            text_matches = self.vision.find_text_any(screenshot, text_candidates, confidence)
+        except Exception:
+            text_matches = {}
+        
         for candidate in candidates:
             try:
                 if candidate.endswith(('.png', '.jpg', '.jpeg')):
                     # Image template
+                    method = "image"
                     result = self.vision.find_template_with_fallbacks(screenshot, candidate, confidence)
                 else:
                     # Text search
-                    result = self.vision.find_text(screenshot, candidate, confidence)
+                    method = "text"
+                    result = text_matches.get(candidate)
                 
                 if result:
                     self.move_to(result.center, use_persona=use_persona)
                     click_result = self.click()
-                    click_result.details = {"found_candidate": candidate, "method": "text" if not candidate.endswith(('.png', '.jpg', '.jpeg')) else "image"}
+                    click_result.details = {"found_candidate": candidate, "method": method}
                     return click_result
                     
             except Exception as e:
@@ -870,15 +1225,47 @@ class HumanMouse:
         # TODO: Implement actual input field detection using image processing
         return search_areas[0] if search_areas else None
     
+    def screenshot_png_into(self, buffer: bytearray) -> int:
+        """Capture the screen as PNG bytes received directly into buffer
+        
+        The daemon sends the image as a raw frame rather than base64 inside
+        JSON, so there is no decode step and, when the same buffer is passed
+        each time, no per-capture allocation. buffer is grown if too small.
+        
+        Args:
+            buffer: Reusable buffer that receives the PNG
+            
+        Returns:
+            Number of PNG bytes at the start of buffer
+        """
+        result = self._send_command({"action": "screenshot_raw"})
+        if not result.success:
+            raise VisionError(f"Failed to capture screenshot: {result.error_message}", "SCREENSHOT_FAILED")
+        
+        size = result.details["length"]
+        try:
+            frame_size = int.from_bytes(_recv_exact(self.socket, 4), 'big')
+            if frame_size != size:
+                raise CommandError(f"Screenshot frame is {frame_size} bytes, expected {size}", "PROTOCOL_ERROR")
+            _recv_into(self.socket, buffer, size)
+        except Exception as e:
+            # Unread frame bytes would be taken for the next reply, so start
+            # the next command on a fresh connection
+            self.socket.close()
+            self.socket = None
+            if isinstance(e, socket.timeout):
+                raise CommandError(f"Command timeout after {self.command_timeout}s", "COMMAND_TIMEOUT", {"command": "screenshot_raw"})
+            raise
+        return size
+    
     def _take_screenshot(self):
         """Take a screenshot for vision operations"""
         try:
             command = {"action": "screenshot"}
             result = self._send_command(command)
-            if result.success and "screenshot" in result.details:
+            if result.success and "data" in result.details:
                 # Decode base64 screenshot
-                import base64
-                screenshot_data = base64.b64decode(result.details["screenshot"])
+                screenshot_data = base64.b64decode(result.details["data"])
                 nparr = np.frombuffer(screenshot_data, np.uint8)
                 screenshot = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
                 return screenshot
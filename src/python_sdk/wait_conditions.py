@@ -379,10 +379,12 @@ class WaitTimeoutError(Exception):
 class WaitSystem:
     """Main wait system providing Playwright-inspired waiting functionality"""
     
-    def __init__(self, bot, default_timeout: float = 30.0, default_poll_interval: float = 0.5):
+    def __init__(self, bot, default_timeout: float = 30.0, default_poll_interval: float = 0.5,
+                 initial_poll_interval: float = 0.05):
         self.bot = bot
         self.default_timeout = default_timeout
         self.default_poll_interval = default_poll_interval
+        self.initial_poll_interval = initial_poll_interval
     
     def for_element(self, text: str, 
                    timeout: Optional[float] = None,
@@ -466,10 +468,15 @@ class WaitSystem:
         return self._wait_for_condition(condition, timeout)
     
     def _wait_for_condition(self, condition: WaitCondition, timeout: Optional[float] = None) -> WaitResult:
-        """Internal method to wait for any condition"""
+        """Internal method to wait for any condition
+        
+        Polling starts fast and backs off to default_poll_interval, so
+        conditions that are met almost immediately return in tens of ms.
+        """
         timeout = timeout or self.default_timeout
         start_time = time.time()
         attempts = 0
+        poll_interval = min(self.initial_poll_interval, self.default_poll_interval)
         
         while True:
             attempts += 1
@@ -502,7 +509,8 @@ class WaitSystem:
                     attempts=attempts
                 )
             
-            time.sleep(self.default_poll_interval)
+            time.sleep(min(poll_interval, max(timeout - elapsed, 0)))
+            poll_interval = min(poll_interval * 2, self.default_poll_interval)
 
 
 class ExpectationSystem:
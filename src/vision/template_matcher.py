@@ -9,8 +9,8 @@ import cv2
 import numpy as np
 from typing import List, Tuple, Optional, NamedTuple, Dict
 from dataclasses import dataclass
+import threading
 import time
-from pathlib import Path
 import subprocess
 import re
 import difflib
@@ -276,21 +276,26 @@ class TemplateMatcher:
         best_confidence = 0
         
         original_h, original_w = gray_template.shape
+        screen_h, screen_w = gray_screenshot.shape
+        
+        # Drop scales whose template would not fit the screen or would be too small to match
+        scale_factors = [
+            scale for scale in scale_factors
+            if 10 <= int(original_w * scale) <= screen_w and 10 <= int(original_h * scale) <= screen_h
+        ]
+        if not scale_factors:
+            return None
+        
+        # Every scaled template is written into a view of one buffer sized for the largest scale
+        max_scale = max(scale_factors)
+        scaled_buffer = np.empty((int(original_h * max_scale), int(original_w * max_scale)), dtype=gray_template.dtype)
         
         for scale in scale_factors:
-            # Scale the template
             scaled_w = int(original_w * scale)
             scaled_h = int(original_h * scale)
             
-            # Skip if scaled template is larger than screenshot
-            if scaled_h > gray_screenshot.shape[0] or scaled_w > gray_screenshot.shape[1]:
-                continue
-            
-            # Skip if scaled template is too small
-            if scaled_h < 10 or scaled_w < 10:
-                continue
-            
-            scaled_template = cv2.resize(gray_template, (scaled_w, scaled_h))
+            scaled_template = cv2.resize(gray_template, (scaled_w, scaled_h),
+                                         dst=scaled_buffer[:scaled_h, :scaled_w])
             
             # Perform template matching
             result = cv2.matchTemplate(gray_screenshot, scaled_template, cv2.TM_CCOEFF_NORMED)
@@ -409,6 +414,28 @@ class TemplateMatcher:
             confidence: OCR confidence threshold (0.0-1.0)
             fuzzy_threshold: Fuzzy matching threshold (0.0-1.0)
         """
+        return self.find_text_any(screenshot, [target_text], confidence, fuzzy_threshold)[target_text]
+    
+    def find_text_any(self, 
+                      screenshot: np.ndarray,
+                      patterns: List[str],
+                      confidence: float = 0.8,
+                      fuzzy_threshold: float = 0.6) -> Dict[str, Optional[MatchResult]]:
+        """Find several pieces of text with a single OCR pass (requires pytesseract)
+        
+        The OCR pass dominates the cost of a text search, so this runs it once
+        and matches every pattern against the detected words.
+        
+        Args:
+            screenshot: Screenshot image array
+            patterns: Texts to search for
+            confidence: OCR confidence threshold (0.0-1.0)
+            fuzzy_threshold: Fuzzy matching threshold (0.0-1.0)
+        
+        Returns:
+            Mapping of each pattern to its best match, or None if not found
+        """
+        matches = {pattern: None for pattern in patterns}
         
         try:
             import pytesseract
@@ -422,64 +449,79 @@ class TemplateMatcher:
             # Get text data with bounding boxes
             data = pytesseract.image_to_data(thresh, output_type=pytesseract.Output.DICT)
             
-            target_lower = target_text.lower().strip()
-            best_match = None
-            best_similarity = 0.0
-            
-            # Search for target text with fuzzy matching
+            # Words that pass the OCR confidence threshold, shared by every pattern
+            words = []
             for i, text in enumerate(data['text']):
                 if not text or not text.strip():
                     continue
-                    
-                text_clean = text.strip().lower()
+                
                 ocr_confidence = float(data['conf'][i]) / 100.0
                 
                 # Skip if OCR confidence too low
                 if ocr_confidence < confidence:
                     continue
                 
-                # Exact substring match (highest priority)
-                if target_lower in text_clean:
-                    similarity = 1.0
-                elif text_clean in target_lower:
-                    similarity = 0.95
-                else:
-                    # Fuzzy matching using sequence matcher
-                    similarity = difflib.SequenceMatcher(None, target_lower, text_clean).ratio()
-                
-                # Check if this is the best match so far
-                if similarity >= fuzzy_threshold and similarity > best_similarity:
-                    best_similarity = similarity
-                    best_match = {
-                        'index': i,
-                        'similarity': similarity,
-                        'ocr_confidence': ocr_confidence,
-                        'text': text
-                    }
-            
-            # Return best match if found
-            if best_match:
-                i = best_match['index']
-                x = data['left'][i]
-                y = data['top'][i]
-                w = data['width'][i]
-                h = data['height'][i]
-                
-                # Combine fuzzy similarity and OCR confidence for final confidence
-                final_confidence = (best_match['similarity'] * 0.7 + best_match['ocr_confidence'] * 0.3)
-                
-                return MatchResult(
-                    x=x, y=y, width=w, height=h,
-                    confidence=final_confidence,
-                    center_x=x + w // 2, center_y=y + h // 2,
-                    method=f"ocr_fuzzy({best_match['similarity']:.2f})"
-                )
+                words.append((i, text, text.strip().lower(), ocr_confidence))
+            
+            for pattern in matches:
+                matches[pattern] = self._best_text_match(data, words, pattern, fuzzy_threshold)
         
         except ImportError:
             print("Warning: pytesseract not installed, text search unavailable")
         except Exception as e:
             print(f"OCR error: {e}")
         
+        return matches
+    
+    def _best_text_match(self, 
+                         data: Dict,
+                         words: List[Tuple[int, str, str, float]],
+                         target_text: str,
+                         fuzzy_threshold: float) -> Optional[MatchResult]:
+        """Pick the OCR word that best matches target_text"""
+        target_lower = target_text.lower().strip()
+        best_match = None
+        best_similarity = 0.0
+        
+        # Search for target text with fuzzy matching
+        for i, text, text_clean, ocr_confidence in words:
+            # Exact substring match (highest priority)
+            if target_lower in text_clean:
+                similarity = 1.0
+            elif text_clean in target_lower:
+                similarity = 0.95
+            else:
+                # Fuzzy matching using sequence matcher
+                similarity = difflib.SequenceMatcher(None, target_lower, text_clean).ratio()
+            
+            # Check if this is the best match so far
+            if similarity >= fuzzy_threshold and similarity > best_similarity:
+                best_similarity = similarity
+                best_match = {
+                    'index': i,
+                    'similarity': similarity,
+                    'ocr_confidence': ocr_confidence,
+                    'text': text
+                }
+        
+        # Return best match if found
+        if best_match:
+            i = best_match['index']
+            x = data['left'][i]
+            y = data['top'][i]
+            w = data['width'][i]
+            h = data['height'][i]
+            
+            # Combine fuzzy similarity and OCR confidence for final confidence
+            final_confidence = (best_match['similarity'] * 0.7 + best_match['ocr_confidence'] * 0.3)
+            
+            return MatchResult(
+                x=x, y=y, width=w, height=h,
+                confidence=final_confidence,
+                center_x=x + w // 2, center_y=y + h // 2,
+                method=f"ocr_fuzzy({best_match['similarity']:.2f})"
+            )
+        
         return None
 
 
@@ -585,39 +627,81 @@ class MultiMonitorMatcher:
 
 
 class VisionCache:
-    """Cache for template images and matching results"""
+    """Cache for template images and matching results (safe to share between threads)"""
     
     def __init__(self, max_size: int = 100, ttl: float = 60.0):
         self.cache = {}
         self.access_times = {}
         self.max_size = max_size
         self.ttl = ttl
+        # Guards the dicts only; files are read and decoded outside it so
+        # several threads can load templates at once
+        self._lock = threading.RLock()
     
     def get_template(self, image_path: str) -> Optional[np.ndarray]:
         """Get cached template image"""
-        current_time = time.time()
-        
-        if image_path in self.cache:
-            # Check if cached item is still valid
-            if current_time - self.access_times[image_path] < self.ttl:
-                self.access_times[image_path] = current_time
-                return self.cache[image_path]
-            else:
-                # Remove expired item
-                del self.cache[image_path]
-                del self.access_times[image_path]
+        cached = self._lookup(image_path)
+        if cached is not None:
+            return cached
         
         # Load and cache template
-        if Path(image_path).exists():
-            template = cv2.imread(image_path, cv2.IMREAD_COLOR)
-            if template is not None:
-                self._add_to_cache(image_path, template, current_time)
-                return template
+        template = self._load(image_path, cv2.IMREAD_COLOR)
+        if template is not None:
+            with self._lock:
+                self._add_to_cache(image_path, template, time.time())
+        return template
+    
+    def get_prepared(self, image_path: str) -> Optional[np.ndarray]:
+        """Get cached template as a grayscale float32 image, ready for matchTemplate"""
+        key = ("prepared", image_path)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        
+        template = self._lookup(image_path)
+        if template is not None:
+            gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+        else:
+            gray = self._load(image_path, cv2.IMREAD_GRAYSCALE)
+            if gray is None:
+                return None
         
-        return None
+        prepared = gray.astype(np.float32)
+        with self._lock:
+            self._add_to_cache(key, prepared, time.time())
+        return prepared
+    
+    def _lookup(self, key) -> Optional[np.ndarray]:
+        """Return a live cache entry, dropping it if expired"""
+        current_time = time.time()
+        
+        with self._lock:
+            if key not in self.cache:
+                return None
+            
+            # Check if cached item is still valid
+            if current_time - self.access_times[key] < self.ttl:
+                self.access_times[key] = current_time
+                return self.cache[key]
+            
+            # Remove expired item
+            del self.cache[key]
+            del self.access_times[key]
+            return None
+    
+    @staticmethod
+    def _load(image_path: str, flags: int) -> Optional[np.ndarray]:
+        """Read an image file's bytes and decode them in memory"""
+        try:
+            data = np.fromfile(image_path, dtype=np.uint8)
+        except OSError:
+            return None
+        if data.size == 0:
+            return None
+        return cv2.imdecode(data, flags)
     
-    def _add_to_cache(self, key: str, value: np.ndarray, current_time: float):
-        """Add item to cache with size management"""
+    def _add_to_cache(self, key, value: np.ndarray, current_time: float):
+        """Add item to cache with size management (caller holds the lock)"""
         # Remove oldest items if cache is full
         while len(self.cache) >= self.max_size:
             oldest_key = min(self.access_times.keys(), key=lambda k: self.access_times[k])
@@ -629,5 +713,6 @@ class VisionCache:
     
     def clear(self):
         """Clear all cached items"""
-        self.cache.clear()
-        self.access_times.clear()
+        with self._lock:
+            self.cache.clear()
+            self.access_times.clear()
@@ -0,0 +1,404 @@
+"""
+Tests for the HumanMouse command protocol.
+
+A lightweight fake daemon listens on a real Unix socket and records every
+length-prefixed JSON command, so these tests exercise the actual wire format
+the SDK sends without needing the Swift daemon or macOS permissions.
+"""
+
+import pytest
+import json
+import socket
+import tempfile
+import threading
+import time
+import os
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "python_sdk"))
+
+from browsergeist import HumanMouse, MotionProfiles, FieldOp
+
+
+class FakeDaemon:
+    """Minimal stand-in for the control daemon that records commands"""
+
+    def __init__(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.socket_path = os.path.join(self._tmpdir, "browsergeist.sock")
+        self.commands = []
+        self.replies = {}
+        self.delays = {}
+        self.raw_frames = {}
+        self.connections = 0
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.socket_path)
+        self._server.listen(5)
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _recv_exact(self, conn, size):
+        data = b""
+        while len(data) < size:
+            try:
+                chunk = conn.recv(size - len(data))
+            except ConnectionResetError:
+                return None
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn):
+        with conn:
+            while True:
+                header = self._recv_exact(conn, 4)
+                if header is None:
+                    return
+                body = self._recv_exact(conn, int.from_bytes(header, 'big'))
+                if body is None:
+                    return
+                command = json.loads(body)
+                self.commands.append(command)
+                time.sleep(self.delays.get(command["action"], 0))
+                reply = json.dumps(self.replies.get(command["action"], {"success": True})).encode('utf-8')
+                conn.sendall(len(reply).to_bytes(4, 'big') + reply)
+                frame = self.raw_frames.get(command["action"])
+                if frame is not None:
+                    try:
+                        conn.sendall(len(frame).to_bytes(4, 'big') + frame)
+                    except OSError:
+                        return  # Client hung up mid-frame
+
+    def close(self):
+        self._server.close()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+
+@pytest.fixture
+def daemon():
+    fake = FakeDaemon()
+    yield fake
+    fake.close()
+
+
+@pytest.fixture
+def bot(daemon):
+    mouse = HumanMouse(daemon_socket=daemon.socket_path, auto_solve_captcha=False, command_timeout=5.0)
+    yield mouse
+    mouse.close()
+
+
+class TestMovePath:
+    """Test batched waypoint movement"""
+
+    def test_move_path_sends_single_command(self, bot, daemon):
+        """All waypoints travel in one request"""
+        points = [(400, 200), (450, 350), (380, 500)]
+        result = bot.move_path(points, profile=MotionProfiles.CAREFUL)
+
+        assert result.success
+        assert len(daemon.commands) == 1
+        command = daemon.commands[0]
+        assert command["action"] == "move_path"
+        assert command["points"] == [[400, 200], [450, 350], [380, 500]]
+        assert command["profile"]["name"] == "careful"
+        assert command["profile"]["max_velocity"] == MotionProfiles.CAREFUL.max_velocity
+
+    def test_move_path_profile_matches_move_to(self, bot, daemon):
+        """move_path and move_to serialize profiles identically"""
+        bot.move_to((10, 20), profile=MotionProfiles.FAST)
+        bot.move_path([(10, 20)], profile=MotionProfiles.FAST)
+
+        assert daemon.commands[0]["profile"] == daemon.commands[1]["profile"]
+
+    def test_move_path_rejects_empty_itinerary(self, bot, daemon):
+        """An empty path is a caller error, not a daemon round-trip"""
+        with pytest.raises(ValueError):
+            bot.move_path([])
+
+        assert daemon.commands == []
+
+
+class TestDelayAfter:
+    """Test daemon-side scheduling of inter-action pauses"""
+
+    def test_delay_after_is_sent_in_milliseconds(self, bot, daemon):
+        """The pause rides along with the command instead of a client sleep"""
+        bot.click("left", duration=0.04, delay_after=0.08)
+        bot.move_to((400, 500), delay_after=1.2)
+
+        assert daemon.commands[0]["delay_after_ms"] == 80
+        assert daemon.commands[1]["delay_after_ms"] == 1200
+
+    def test_no_delay_after_by_default(self, bot, daemon):
+        """Commands without a pause leave the field out entirely"""
+        bot.click()
+        bot.move_to((1, 2))
+
+        assert all("delay_after_ms" not in command for command in daemon.commands)
+
+
+class TestReconfigure:
+    """Test changing session options on a live connection"""
+
+    def test_reconfigure_keeps_connection(self, bot, daemon):
+        """Toggling options does not open a new daemon connection"""
+        bot.click()
+        bot.reconfigure(openai_api_key="test-key", auto_solve_captcha=True, command_timeout=2.0)
+        bot.click()
+
+        assert daemon.connections == 1
+        assert len(daemon.commands) == 2
+        assert bot.socket.gettimeout() == 2.0
+
+    def test_reconfigure_preserves_existing_keys(self, bot):
+        """Adding one solver key leaves the other in place"""
+        bot.reconfigure(twocaptcha_api_key="two-key")
+        bot.reconfigure(openai_api_key="openai-key")
+
+        assert bot.captcha_solver.twocaptcha_solver.api_key == "two-key"
+        assert bot.captcha_solver.openai_solver.api_key == "openai-key"
+
+
+class TestFindAndClickAny:
+    """Test multi-candidate targeting"""
+
+    def test_text_candidates_share_one_ocr_pass(self, bot, daemon, monkeypatch):
+        """Every text candidate is matched against a single OCR pass"""
+        import numpy as np
+        from template_matcher import MatchResult
+
+        calls = []
+
+        def fake_find_text_any(screenshot, patterns, confidence=0.8, fuzzy_threshold=0.6):
+            calls.append(list(patterns))
+            hit = MatchResult(confidence=0.9, x=90, y=190, width=20, height=20, center_x=100, center_y=200, method="ocr")
+            return {pattern: hit if pattern == "Private Window" else None for pattern in patterns}
+
+        monkeypatch.setattr(bot, "_take_screenshot", lambda: np.zeros((10, 10, 3), np.uint8))
+        monkeypatch.setattr(bot.vision, "find_text_any", fake_find_text_any)
+
+        result = bot.find_and_click_any(["New Private Window", "Private Window", "Private Browsing"])
+
+        assert calls == [["New Private Window", "Private Window", "Private Browsing"]]
+        assert result.details["found_candidate"] == "Private Window"
+        assert daemon.commands[0]["action"] == "move_to"
+        assert daemon.commands[0]["x"] == 100 and daemon.commands[0]["y"] == 200
+
+
+class TestTypeInAnyField:
+    """Test multi-label field targeting"""
+
+    def test_label_variants_share_one_accessibility_query(self, bot, daemon):
+        """Every label variant rides along in a single find_input_field request"""
+        daemon.replies["find_input_field"] = {"success": True, "x": 10, "y": 20, "label": "Email or phone number"}
+        result = bot.type_in_any_field(["Email", "email", "Email or phone number"], "a@b.c", clear_field=False)
+
+        lookups = [c for c in daemon.commands if c["action"] == "find_input_field"]
+        assert len(lookups) == 1
+        assert lookups[0]["label"] == "Email"
+        assert lookups[0]["labels"] == ["Email", "email", "Email or phone number"]
+        assert result.details["found_label"] == "Email or phone number"
+        assert result.details["targeting_method"] == "accessibility"
+
+    def test_type_in_field_keeps_single_label_request(self, bot, daemon):
+        """type_in_field still sends the label older daemons understand"""
+        daemon.replies["find_input_field"] = {"success": True, "x": 10, "y": 20}
+        bot.type_in_field("Password", "secret", clear_field=False)
+
+        assert daemon.commands[0]["action"] == "find_input_field"
+        assert daemon.commands[0]["label"] == "Password"
+
+
+class TestGetFieldKind:
+    """Test form control classification"""
+
+    def test_reports_daemon_kind(self, bot, daemon):
+        """The control kind comes straight from the daemon"""
+        daemon.replies["get_field_kind"] = {"success": True, "kind": "select"}
+
+        assert bot.get_field_kind("Month") == "select"
+        assert daemon.commands[0] == {"action": "get_field_kind", "label": "Month"}
+
+    def test_unknown_when_daemon_cannot_classify(self, bot, daemon):
+        """Daemons without the command degrade to "unknown" rather than raising"""
+        daemon.replies["get_field_kind"] = {"success": False, "error": "Unknown action: get_field_kind"}
+
+        assert bot.get_field_kind("Month") == "unknown"
+
+
+class TestWaitPolling:
+    """Test wait condition polling cadence"""
+
+    def test_fast_conditions_return_before_full_poll_interval(self, bot):
+        """Polling backs off from a short first interval instead of sleeping 0.5s up front"""
+        checks = []
+
+        def ready_on_third_check(_bot):
+            checks.append(1)
+            return len(checks) >= 3
+
+        result = bot.wait.for_condition(ready_on_third_check, "third check", timeout=5.0)
+
+        assert result.success
+        assert result.attempts == 3
+        assert result.elapsed_time < bot.wait.default_poll_interval
+
+
+class TestLaunchApp:
+    """Test direct application launching"""
+
+    def test_launch_app_is_one_command(self, bot, daemon):
+        """Launching is a single daemon request carrying the wait budget"""
+        daemon.replies["launch_app"] = {"success": True, "pid": 4242, "finished_launching": True}
+
+        result = bot.launch_app("Safari", timeout=2.5)
+
+        assert daemon.commands == [{"action": "launch_app", "app": "Safari", "timeout_ms": 2500}]
+        assert result.details["pid"] == 4242
+
+    def test_launch_app_failure_raises(self, bot, daemon):
+        """A daemon-side failure surfaces as a CommandError"""
+        from browsergeist import CommandError
+
+        daemon.replies["launch_app"] = {"success": False, "error": "Application not found: Nope"}
+
+        with pytest.raises(CommandError):
+            bot.launch_app("Nope")
+
+
+class TestLargeReplies:
+    """Test reading replies larger than one socket read"""
+
+    def test_multi_megabyte_reply_is_read_completely(self, bot, daemon):
+        """Screenshot-sized payloads arrive intact rather than truncated"""
+        payload = "A" * (3 * 1024 * 1024)
+        daemon.replies["screenshot"] = {"success": True, "data": payload, "format": "png"}
+
+        result = bot._send_command({"action": "screenshot"})
+
+        assert result.success
+        assert result.details["data"] == payload
+
+
+class TestRunBatch:
+    """Test batching several actions into one round-trip"""
+
+    def test_batch_is_one_request(self, bot, daemon):
+        """Batched steps travel together, with type_command matching type_text"""
+        bot.run_batch([
+            {"action": "key_combination", "keys": ["cmd", "space"], "delay_after_ms": 800},
+            bot.type_command("Safari", delay_profile="fast", use_persona=False),
+            {"action": "key_combination", "keys": ["return"]},
+        ])
+        bot.type_text("Safari", delay_profile="fast", use_persona=False)
+
+        assert len(daemon.commands) == 2
+        batch = daemon.commands[0]
+        assert batch["action"] == "batch"
+        assert [step["action"] for step in batch["commands"]] == ["key_combination", "type", "key_combination"]
+        assert batch["commands"][0]["delay_after_ms"] == 800
+        assert batch["commands"][1] == daemon.commands[1]
+
+    def test_tap_moves_and_clicks_in_one_request(self, bot, daemon):
+        """tap sends the move and the click as one batch with their pauses"""
+        bot.tap((450, 550), duration=0.1, hover=0.8, delay_after=2.0)
+
+        assert len(daemon.commands) == 1
+        move, click = daemon.commands[0]["commands"]
+        assert (move["action"], move["x"], move["y"], move["delay_after_ms"]) == ("move_to", 450, 550, 800)
+        assert (click["action"], click["duration"], click["delay_after_ms"]) == ("click", 0.1, 2000)
+
+    def test_fill_fields_batch_is_one_request(self, bot, daemon):
+        """Each field becomes move, click and type steps inside a single batch"""
+        bot.fill_fields_batch([
+            FieldOp((400, 200), "Alice", profile="fast"),
+            FieldOp((400, 250), "alice@example.com", profile="careful", post_delay=0.5),
+        ])
+
+        assert len(daemon.commands) == 1
+        steps = daemon.commands[0]["commands"]
+        assert [step["action"] for step in steps] == ["move_to", "click", "type"] * 2
+        assert (steps[3]["x"], steps[3]["y"]) == (400, 250)
+        assert steps[1]["delay_after_ms"] == 200
+        assert steps[5]["profile"] == "careful"
+        assert steps[5]["delay_after_ms"] == 500
+        assert "delay_after_ms" not in steps[2]
+
+    def test_long_fills_wait_longer_than_command_timeout(self, bot, daemon):
+        """The batch timeout scales with its expected duration, then resets"""
+        bot.reconfigure(command_timeout=0.5)
+        daemon.delays["batch"] = 1.0
+        bot.fill_fields_batch([FieldOp((400, 500), "x" * 150)])
+
+        assert len(daemon.commands) == 1
+        assert bot.socket.gettimeout() == 0.5
+
+    def test_empty_batch_is_rejected(self, bot, daemon):
+        """An empty batch is a caller error, not a daemon round-trip"""
+        with pytest.raises(ValueError):
+            bot.run_batch([])
+
+        assert daemon.commands == []
+
+
+class TestRawScreenshot:
+    """Test binary screenshot transport"""
+
+    def test_png_frame_lands_in_reused_buffer(self, bot, daemon):
+        """The raw frame fills (and grows) the caller's buffer, and the connection stays in sync"""
+        png = bytes(range(256)) * 8192
+        daemon.replies["screenshot_raw"] = {"success": True, "length": len(png), "format": "png"}
+        daemon.raw_frames["screenshot_raw"] = png
+        buffer = bytearray(16)
+
+        size = bot.screenshot_png_into(buffer)
+        assert size == len(png)
+        assert bytes(buffer[:size]) == png
+
+        assert bot.screenshot_png_into(buffer) == len(png)
+        assert len(buffer) == len(png)
+        assert bot.click().success
+
+    def test_frame_size_mismatch_drops_the_connection(self, bot, daemon):
+        """Unread frame bytes are not mistaken for the next reply"""
+        from browsergeist import CommandError
+        png = b"\x89PNG" * 64
+        daemon.replies["screenshot_raw"] = {"success": True, "length": len(png) + 1, "format": "png"}
+        daemon.raw_frames["screenshot_raw"] = png
+
+        with pytest.raises(CommandError) as excinfo:
+            bot.screenshot_png_into(bytearray(16))
+        assert excinfo.value.error_code == "PROTOCOL_ERROR"
+
+        assert bot.click().success
+        assert daemon.connections == 2
+
+    def test_command_timeout_drops_the_connection(self, bot, daemon):
+        """A late reply to a timed-out command is not taken for the next one"""
+        from browsergeist import CommandError
+        bot.reconfigure(command_timeout=0.2)
+        daemon.replies["batch"] = {"success": True, "marker": "BATCH_REPLY"}
+        daemon.delays["batch"] = 0.5
+
+        with pytest.raises(CommandError) as excinfo:
+            bot.run_batch([{"action": "key_combination", "keys": ["return"]}])
+        assert excinfo.value.error_code == "COMMAND_TIMEOUT"
+
+        assert "marker" not in bot.click().details
+        assert daemon.connections == 2
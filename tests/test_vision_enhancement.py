@@ -9,7 +9,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import numpy as np
 import cv2
-from vision.template_matcher import TemplateMatcher, MultiMonitorMatcher
+from vision.template_matcher import TemplateMatcher, MultiMonitorMatcher, VisionCache
 
 def test_multi_scale_matching():
     """Test multi-scale template matching"""
@@ -70,6 +70,51 @@ def test_multi_monitor_support():
     except Exception as e:
         print(f"   ⚠️ Multi-monitor test failed: {e}")
 
+def test_find_text_any_single_ocr_pass(monkeypatch):
+    """Test that batched text search runs OCR once for all patterns"""
+    import pytesseract
+    
+    calls = []
+    ocr_data = {
+        'text': ['Email:', 'info@acme.com', '', 'Tel:', '555-0100'],
+        'conf': ['95', '90', '-1', '40', '88'],
+        'left': [10, 80, 0, 10, 60],
+        'top': [20, 20, 0, 50, 50],
+        'width': [60, 120, 0, 40, 80],
+        'height': [15, 15, 0, 15, 15],
+    }
+    
+    def fake_image_to_data(image, output_type=None):
+        calls.append(image.shape)
+        return ocr_data
+    
+    monkeypatch.setattr(pytesseract, "image_to_data", fake_image_to_data)
+    
+    matcher = TemplateMatcher()
+    screenshot = np.zeros((100, 200, 3), dtype=np.uint8)
+    hits = matcher.find_text_any(screenshot, ["info@", "Tel:", "Fax:"], confidence=0.6, fuzzy_threshold=0.8)
+    
+    assert len(calls) == 1
+    assert hits["info@"] is not None and hits["info@"].center == (140, 27)
+    assert hits["Tel:"] is None  # Below the OCR confidence threshold
+    assert hits["Fax:"] is None
+    
+    # find_text is the single-pattern case of the same search
+    assert matcher.find_text(screenshot, "info@", confidence=0.6, fuzzy_threshold=0.8) == hits["info@"]
+
+def test_vision_cache_prepared_template(tmp_path):
+    """Test that prepared templates are converted once and reused"""
+    template_path = str(tmp_path / "button.png")
+    cv2.imwrite(template_path, np.full((12, 20, 3), (10, 200, 30), dtype=np.uint8))
+    
+    cache = VisionCache()
+    prepared = cache.get_prepared(template_path)
+    
+    assert prepared.dtype == np.float32
+    assert prepared.shape == (12, 20)
+    assert cache.get_prepared(template_path) is prepared
+    assert cache.get_prepared(str(tmp_path / "missing.png")) is None
+
 def test_enhanced_features():
     """Test enhanced vision features"""
     print("\n🎯 Vision System Enhancement Test")